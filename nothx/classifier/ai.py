@@ -2,6 +2,7 @@
 
 import json
 import logging
+import threading
 from datetime import datetime
 
 from .. import db
@@ -34,6 +35,9 @@ AI_RETRY_CONFIG = RetryConfig(
 # at max_tokens mid-JSON, losing the whole batch.
 AI_BATCH_CHUNK_SIZE = 15
 
+# Responses kept in memory when config.ai.cache_responses is enabled
+AI_RESPONSE_CACHE_SIZE = 256
+
 
 def _extract_json_value(text: str, open_char: str) -> list | dict | None:
     """Extract the first parseable JSON array ('[') or object ('{') from text.
@@ -116,17 +120,22 @@ class AIClassifier:
         self.config = config
         self._provider: BaseAIProvider | None = None
         self._provider_initialized = False
+        # The warmup thread and the main thread may both ask for the provider
+        self._provider_lock = threading.Lock()
 
     def _get_provider(self) -> BaseAIProvider | None:
         """Get or create the AI provider."""
-        if not self._provider_initialized:
-            self._provider = get_provider(
-                provider_name=self.config.ai.provider,
-                api_key=self.config.ai.api_key,
-                model=self.config.ai.model,
-                api_base=self.config.ai.api_base,
-            )
-            self._provider_initialized = True
+        with self._provider_lock:
+            if not self._provider_initialized:
+                self._provider = get_provider(
+                    provider_name=self.config.ai.provider,
+                    api_key=self.config.ai.api_key,
+                    model=self.config.ai.model,
+                    api_base=self.config.ai.api_base,
+                    cache_size=AI_RESPONSE_CACHE_SIZE if self.config.ai.cache_responses else 0,
+                    persist_cache=self.config.ai.cache_responses,
+                )
+                self._provider_initialized = True
         return self._provider
 
     def is_available(self) -> bool:
@@ -140,6 +149,25 @@ class AIClassifier:
 
         return provider.is_available()
 
+    def start_warmup(self) -> None:
+        """Warm up the AI provider in a background thread.
+
+        Lets SDK import and connection setup overlap with slower work such
+        as the inbox scan. Only call this when the run is allowed to contact
+        the provider (i.e. not a dry run).
+        """
+
+        def _warmup() -> None:
+            try:
+                if self.is_available():
+                    provider = self._get_provider()
+                    if provider is not None:
+                        provider.warmup()
+            except Exception as e:
+                logger.debug("AI provider warmup failed: %s", e)
+
+        threading.Thread(target=_warmup, name="nothx-ai-warmup", daemon=True).start()
+
     def classify_batch(
         self, senders: list[SenderStats], persist: bool = True
     ) -> dict[str, Classification]:
@@ -217,6 +245,26 @@ class AIClassifier:
 
             # Parse response
             classifications, parse_errors = self._parse_response(response.text)
+            if parse_errors:
+                # Never replay a reply that did not parse from the cache
+                provider.invalidate(prompt)
+            else:
+                provider.confirm(prompt)
+
+            # A malformed or truncated reply loses every sender packed into
+            # the prompt. Retry in halves so one bad response costs a few
+            # extra calls rather than the whole chunk.
+            if not classifications and parse_errors and len(senders) > 1:
+                logger.warning(
+                    "AI response for %d senders was unusable, retrying in smaller chunks: %s",
+                    len(senders),
+                    "; ".join(parse_errors[:3]),
+                    extra={"sender_count": len(senders), "parse_errors": parse_errors},
+                )
+                middle = len(senders) // 2
+                results = self._classify_chunk(senders[:middle], persist=persist)
+                results.update(self._classify_chunk(senders[middle:], persist=persist))
+                return results
 
             # Validate domains - only accept classifications for domains we asked about
             # This prevents prompt injection attacks from classifying arbitrary domains
@@ -310,6 +358,7 @@ class AIClassifier:
             return {}
 
         except json.JSONDecodeError as e:
+            provider.invalidate(prompt)
             logger.error(
                 "AI response was not valid JSON: %s",
                 e,
@@ -538,17 +587,22 @@ class AIPatternAnalyzer:
         self.config = config
         self._provider: BaseAIProvider | None = None
         self._provider_initialized = False
+        # The warmup thread and the main thread may both ask for the provider
+        self._provider_lock = threading.Lock()
 
     def _get_provider(self) -> BaseAIProvider | None:
         """Get or create the AI provider."""
-        if not self._provider_initialized:
-            self._provider = get_provider(
-                provider_name=self.config.ai.provider,
-                api_key=self.config.ai.api_key,
-                model=self.config.ai.model,
-                api_base=self.config.ai.api_base,
-            )
-            self._provider_initialized = True
+        with self._provider_lock:
+            if not self._provider_initialized:
+                self._provider = get_provider(
+                    provider_name=self.config.ai.provider,
+                    api_key=self.config.ai.api_key,
+                    model=self.config.ai.model,
+                    api_base=self.config.ai.api_base,
+                    cache_size=AI_RESPONSE_CACHE_SIZE if self.config.ai.cache_responses else 0,
+                    persist_cache=self.config.ai.cache_responses,
+                )
+                self._provider_initialized = True
         return self._provider
 
     def is_available(self) -> bool:
@@ -610,6 +664,10 @@ class AIPatternAnalyzer:
 
             # Parse response
             result = self._parse_analysis(response.text)
+            if result is None:
+                provider.invalidate(prompt, max_tokens=2048)
+            else:
+                provider.confirm(prompt, max_tokens=2048)
             if result:
                 logger.info(
                     "AI pattern analysis found %d insights",
@@ -642,6 +700,7 @@ class AIPatternAnalyzer:
             return None
 
         except json.JSONDecodeError as e:
+            provider.invalidate(prompt, max_tokens=2048)
             logger.error(
                 "AI pattern analysis JSON error: %s",
                 e,
@@ -2,6 +2,7 @@
 
 import fnmatch
 import logging
+from collections.abc import Callable, Collection, Iterator
 
 from ..config import Config
 from ..models import Action, Classification, EmailType, SenderStats
@@ -399,7 +400,10 @@ class ClassificationEngine:
         return classification
 
     def classify_batch(
-        self, senders: list[SenderStats], persist: bool = True
+        self,
+        senders: Collection[SenderStats],
+        persist: bool = True,
+        on_classified: Callable[[str, Classification], None] | None = None,
     ) -> dict[str, Classification]:
         """
         Classify a batch of senders efficiently.
@@ -408,9 +412,29 @@ class ClassificationEngine:
         When persist is False (dry-run or a pre-consent scan), cloud AI calls
         and classification writes are both disabled; candidates fall back to
         local heuristics.
+
+        Args:
+            senders: Senders to classify
+            persist: Allow cloud AI calls and classification writes
+            on_classified: Optional callback(key, classification) called as
+                each sender is decided, e.g. to advance a progress bar
         """
         results: dict[str, Classification] = {}
+        for key, classification in self.classify_iter(senders, persist=persist):
+            results[key] = classification
+            if on_classified:
+                on_classified(key, classification)
+        return results
+
+    def classify_iter(
+        self, senders: Collection[SenderStats], persist: bool = True
+    ) -> Iterator[tuple[str, Classification]]:
+        """Yield ``(classification_key, classification)`` as senders are decided.
 
+        Rule, policy and pattern matches are yielded immediately; senders
+        needing AI are yielded together once the single batched AI call
+        returns. See :meth:`classify_batch` for ``persist``.
+        """
         # Track classification sources for metrics
         source_counts = {"user_rule": 0, "preset": 0, "ai": 0, "heuristics": 0, "uncertain": 0}
         fallback_count = 0
@@ -423,33 +447,33 @@ class ClassificationEngine:
             # Layer 1: User rules
             result = self.rules.match(sender)
             if result:
-                results[sender.classification_key] = self._apply_action_policy(sender, result)
+                yield sender.classification_key, self._apply_action_policy(sender, result)
                 source_counts["user_rule"] += 1
                 continue
 
             result = self._threat_precheck(sender)
             if result:
-                results[sender.classification_key] = result
+                yield sender.classification_key, result
                 source_counts.setdefault("provider_policy", 0)
                 source_counts["provider_policy"] += 1
                 continue
 
             result = self._authentication_precheck(sender)
             if result:
-                results[sender.classification_key] = result
+                yield sender.classification_key, result
                 source_counts.setdefault("auth_policy", 0)
                 source_counts["auth_policy"] += 1
                 continue
 
             result = self._cold_outreach_precheck(sender)
             if result:
-                results[sender.classification_key] = result
+                yield sender.classification_key, result
                 source_counts["heuristics"] += 1
                 continue
 
             result = self._transactional_precheck(sender)
             if result:
-                results[sender.classification_key] = result
+                yield sender.classification_key, result
                 source_counts.setdefault("transactional_policy", 0)
                 source_counts["transactional_policy"] += 1
                 continue
@@ -457,7 +481,7 @@ class ClassificationEngine:
             # Layer 2: Preset patterns
             result = self.patterns.match(sender)
             if result:
-                results[sender.classification_key] = self._apply_action_policy(sender, result)
+                yield sender.classification_key, self._apply_action_policy(sender, result)
                 source_counts["preset"] += 1
                 continue
 
@@ -472,15 +496,18 @@ class ClassificationEngine:
         for sender in local_only:
             local_result = self.heuristics.classify(sender)
             if local_result:
-                results[sender.classification_key] = self._apply_action_policy(sender, local_result)
+                yield sender.classification_key, self._apply_action_policy(sender, local_result)
                 source_counts["heuristics"] += 1
             else:
-                results[sender.classification_key] = Classification(
-                    email_type=EmailType.UNKNOWN,
-                    action=Action.REVIEW,
-                    confidence=0.5,
-                    reasoning="Local policy could not confidently classify this sender",
-                    source="uncertain",
+                yield (
+                    sender.classification_key,
+                    Classification(
+                        email_type=EmailType.UNKNOWN,
+                        action=Action.REVIEW,
+                        confidence=0.5,
+                        reasoning="Local policy could not confidently classify this sender",
+                        source="uncertain",
+                    ),
                 )
                 source_counts["uncertain"] += 1
 
@@ -495,9 +522,7 @@ class ClassificationEngine:
                 if sender.classification_key in ai_results:
                     result = ai_results[sender.classification_key]
                     if result.confidence >= self.config.thresholds.unsub_confidence:
-                        results[sender.classification_key] = self._apply_action_policy(
-                            sender, result
-                        )
+                        yield sender.classification_key, self._apply_action_policy(sender, result)
                         source_counts["ai"] += 1
                         ai_success_count += 1
                         continue
@@ -508,18 +533,22 @@ class ClassificationEngine:
                 fallback_count += 1
                 heuristic_result = self.heuristics.classify(sender)
                 if heuristic_result:
-                    results[sender.classification_key] = self._apply_action_policy(
-                        sender, heuristic_result
+                    yield (
+                        sender.classification_key,
+                        self._apply_action_policy(sender, heuristic_result),
                     )
                     source_counts["heuristics"] += 1
                 else:
                     # Layer 5: Review queue
-                    results[sender.classification_key] = Classification(
-                        email_type=EmailType.UNKNOWN,
-                        action=Action.REVIEW,
-                        confidence=0.5,
-                        reasoning="Could not confidently classify",
-                        source="uncertain",
+                    yield (
+                        sender.classification_key,
+                        Classification(
+                            email_type=EmailType.UNKNOWN,
+                            action=Action.REVIEW,
+                            confidence=0.5,
+                            reasoning="Could not confidently classify",
+                            source="uncertain",
+                        ),
                     )
                     source_counts["uncertain"] += 1
 
@@ -557,15 +586,18 @@ class ClassificationEngine:
             for sender in needs_ai:
                 result = self.heuristics.classify(sender)
                 if result:
-                    results[sender.classification_key] = self._apply_action_policy(sender, result)
+                    yield sender.classification_key, self._apply_action_policy(sender, result)
                     source_counts["heuristics"] += 1
                 else:
-                    results[sender.classification_key] = Classification(
-                        email_type=EmailType.UNKNOWN,
-                        action=Action.REVIEW,
-                        confidence=0.5,
-                        reasoning="Could not confidently classify",
-                        source="uncertain",
+                    yield (
+                        sender.classification_key,
+                        Classification(
+                            email_type=EmailType.UNKNOWN,
+                            action=Action.REVIEW,
+                            confidence=0.5,
+                            reasoning="Could not confidently classify",
+                            source="uncertain",
+                        ),
                     )
                     source_counts["uncertain"] += 1
 
@@ -577,8 +609,6 @@ class ClassificationEngine:
             extra={"total_senders": len(senders), "source_distribution": source_counts},
         )
 
-        return results
-
     def should_auto_act(self, classification: Classification) -> bool:
         """Check if we should automatically act on this classification."""
         if self.config.operation_mode == "confirm":
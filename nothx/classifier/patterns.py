@@ -6,7 +6,7 @@ from importlib import resources
 from pathlib import Path
 
 from ..models import Action, Classification, EmailType, SenderStats
-from .utils import matches_pattern
+from .utils import matches_normalized_pattern
 
 logger = logging.getLogger("nothx.classifier.patterns")
 
@@ -50,6 +50,11 @@ class PatternMatcher:
 
     def __init__(self, patterns_file: Path | None = None):
         self.patterns = self._load_patterns(patterns_file)
+        # Lowercase once here so match() compares without per-call lowering
+        self._normalized = {
+            key: [(pattern.lower(), pattern) for pattern in self.patterns.get(key, [])]
+            for key in ("block_patterns", "keep_patterns", "unsub_patterns")
+        }
 
     def _load_patterns(self, patterns_file: Path | None) -> dict:
         """Load patterns from a user-provided file, or the packaged defaults."""
@@ -66,8 +71,8 @@ class PatternMatcher:
         domain = sender.domain.lower()
 
         # Check block patterns first (highest priority for presets)
-        for pattern in self.patterns.get("block_patterns", []):
-            if matches_pattern(domain, pattern):
+        for normalized, pattern in self._normalized["block_patterns"]:
+            if matches_normalized_pattern(domain, normalized):
                 return Classification(
                     email_type=EmailType.MARKETING,
                     action=Action.BLOCK,
@@ -80,8 +85,8 @@ class PatternMatcher:
         # domain shape such as ``security.*`` or ``*.gov`` is not proof that a
         # particular delivery is wanted, and must never override phishing or
         # authentication evidence.  It only keeps automation behind review.
-        for pattern in self.patterns.get("keep_patterns", []):
-            if matches_pattern(domain, pattern):
+        for normalized, pattern in self._normalized["keep_patterns"]:
+            if matches_normalized_pattern(domain, normalized):
                 return Classification(
                     email_type=EmailType.UNKNOWN,
                     action=Action.REVIEW,
@@ -91,8 +96,8 @@ class PatternMatcher:
                 )
 
         # Check unsub patterns
-        for pattern in self.patterns.get("unsub_patterns", []):
-            if matches_pattern(domain, pattern):
+        for normalized, pattern in self._normalized["unsub_patterns"]:
+            if matches_normalized_pattern(domain, normalized):
                 return Classification(
                     email_type=EmailType.MARKETING,
                     action=Action.UNSUB,
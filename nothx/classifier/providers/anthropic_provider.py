@@ -3,7 +3,14 @@
 import logging
 from typing import Any
 
-from .base import BaseAIProvider, ProviderError, ProviderErrorType, ProviderResponse
+from .base import (
+    BaseAIProvider,
+    ProviderError,
+    ProviderErrorType,
+    ProviderResponse,
+    classify_error_message,
+    make_sanitizer,
+)
 
 logger = logging.getLogger("nothx.providers.anthropic")
 
@@ -29,16 +36,22 @@ def _normalize_model(model: str) -> str:
     return MODEL_REPLACEMENTS.get(model, model)
 
 
-def _sanitize_error_message(error: Exception) -> str:
-    """Sanitize error message to avoid exposing API keys."""
-    msg = str(error)
-    # Common patterns that might contain API keys
-    sensitive_patterns = ["api_key=", "api-key=", "authorization:", "bearer ", "sk-"]
-    msg_lower = msg.lower()
-    for pattern in sensitive_patterns:
-        if pattern in msg_lower:
-            return "API error (details redacted for security)"
-    return msg
+_sanitize_error_message = make_sanitizer("sk-")
+
+
+_sdk: Any = None
+
+
+def _load_sdk() -> Any:
+    """Import the Anthropic SDK on first use and reuse it afterwards."""
+    global _sdk
+    if _sdk is None:
+        try:
+            import anthropic
+        except ImportError as err:
+            raise ImportError("Anthropic SDK not installed. Run: pip install anthropic") from err
+        _sdk = anthropic
+    return _sdk
 
 
 class AnthropicProvider(BaseAIProvider):
@@ -76,14 +89,7 @@ class AnthropicProvider(BaseAIProvider):
     def _get_client(self):
         """Get or create Anthropic client."""
         if self._client is None:
-            try:
-                import anthropic
-
-                self._client = anthropic.Anthropic(api_key=self.api_key)
-            except ImportError as err:
-                raise ImportError(
-                    "Anthropic SDK not installed. Run: pip install anthropic"
-                ) from err
+            self._client = _load_sdk().Anthropic(api_key=self.api_key)
         return self._client
 
     def is_available(self) -> bool:
@@ -122,8 +128,7 @@ class AnthropicProvider(BaseAIProvider):
     def complete(self, prompt: str, max_tokens: int = 4096) -> ProviderResponse:
         """Send prompt to Claude and get response."""
         try:
-            import anthropic
-
+            anthropic = _load_sdk()
             client = self._get_client()
             response = client.messages.create(
                 model=self.model,
@@ -185,14 +190,24 @@ class AnthropicProvider(BaseAIProvider):
                 cause=e,
             ) from e
         except Exception as e:
+            error_type, retryable = classify_error_message(str(e))
             raise ProviderError(
-                error_type=ProviderErrorType.UNKNOWN,
+                error_type=error_type,
                 message=_sanitize_error_message(e),
                 provider=self.name,
-                retryable=False,
+                retryable=retryable,
                 cause=e,
             ) from e
 
+    def warmup(self) -> None:
+        """Load the SDK and open the API connection with a cheap request."""
+        if not self.api_key:
+            return
+        try:
+            self._get_client().models.list(limit=1)
+        except Exception as e:
+            logger.debug("Anthropic warmup failed: %s", _sanitize_error_message(e))
+
     def test_connection(self) -> tuple[bool, str]:
         """Test Anthropic API connection."""
         if not self.api_key:
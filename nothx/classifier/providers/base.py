@@ -1,6 +1,10 @@
 """Base class for AI providers."""
 
+import functools
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -19,6 +23,76 @@ class ProviderErrorType(Enum):
     UNKNOWN = "unknown"
 
 
+# Fallback classification for exceptions an SDK does not raise as a typed
+# error: (message keywords, error type, retryable). Checked in order against
+# the lowercased message; the first entry with a matching keyword wins.
+ERROR_KEYWORDS: tuple[tuple[tuple[str, ...], ProviderErrorType, bool], ...] = (
+    (
+        ("rate limit", "rate_limit", "ratelimit", "quota", "too many requests"),
+        ProviderErrorType.RATE_LIMIT_ERROR,
+        True,
+    ),
+    (
+        ("unauthorized", "authentication", "permission denied", "invalid api key"),
+        ProviderErrorType.AUTHENTICATION_ERROR,
+        False,
+    ),
+    (("timed out", "timeout", "deadline exceeded"), ProviderErrorType.TIMEOUT_ERROR, True),
+    (
+        ("connection", "unreachable", "service unavailable"),
+        ProviderErrorType.CONNECTION_ERROR,
+        True,
+    ),
+)
+
+
+def classify_error_message(message: str) -> tuple[ProviderErrorType, bool]:
+    """Classify an untyped provider error from its message.
+
+    Returns:
+        Tuple of (error_type, retryable); (UNKNOWN, False) if nothing matches
+    """
+    message = message.lower()
+    for keywords, error_type, retryable in ERROR_KEYWORDS:
+        if any(keyword in message for keyword in keywords):
+            return error_type, retryable
+    return ProviderErrorType.UNKNOWN, False
+
+
+# Markers that suggest an error message echoes credentials back, shared by all
+# providers; each provider adds its own API key prefix.
+SENSITIVE_MARKERS = ("api_key=", "api-key=", "authorization:", "bearer ")
+REDACTED_ERROR_MESSAGE = "API error (details redacted for security)"
+
+
+def make_sanitizer(key_prefix: str) -> Callable[[Exception], str]:
+    """Build a provider's error-message sanitizer.
+
+    Args:
+        key_prefix: The provider's API key prefix (e.g. "sk-")
+
+    Returns:
+        Function mapping an exception to its message, or to a redaction
+        placeholder if the message looks like it contains credentials
+    """
+    pattern = re.compile(
+        "|".join(re.escape(marker) for marker in (*SENSITIVE_MARKERS, key_prefix)),
+        re.IGNORECASE,
+    )
+
+    @functools.lru_cache(maxsize=128)
+    def _redact(message: str) -> str:
+        if pattern.search(message):
+            return REDACTED_ERROR_MESSAGE
+        return message
+
+    def sanitize_error_message(error: Exception) -> str:
+        """Sanitize error message to avoid exposing API keys."""
+        return _redact(str(error))
+
+    return sanitize_error_message
+
+
 @dataclass
 class ProviderError(Exception):
     """Structured error from AI providers."""
@@ -40,7 +114,7 @@ class ProviderError(Exception):
         return "".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderResponse:
     """Standardized response from AI providers."""
 
@@ -89,6 +163,111 @@ class BaseAIProvider(ABC):
         """
         pass
 
+    def stream(self, prompt: str, max_tokens: int = 4096) -> Iterator[str]:
+        """Send a prompt and yield the completion text as it arrives.
+
+        Providers without native streaming yield the full completion as a
+        single chunk.
+
+        Args:
+            prompt: The prompt to send
+            max_tokens: Maximum tokens in response
+
+        Yields:
+            Successive pieces of the completion text
+        """
+        yield self.complete(prompt, max_tokens=max_tokens).text
+
+    def complete_many(
+        self, prompts: list[str], max_tokens: int = 4096, max_concurrency: int = 8
+    ) -> list[ProviderResponse | ProviderError]:
+        """Send several prompts concurrently.
+
+        Each prompt is a separate ``complete`` call; a bounded thread pool
+        overlaps their network round-trips.
+
+        Args:
+            prompts: The prompts to send
+            max_tokens: Maximum tokens in each response
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            One entry per prompt, in the same order: the ProviderResponse, or
+            the ProviderError that prompt failed with
+        """
+        if not prompts:
+            return []
+
+        def _complete_one(prompt: str) -> ProviderResponse | ProviderError:
+            try:
+                return self.complete(prompt, max_tokens=max_tokens)
+            except ProviderError as e:
+                return e
+
+        workers = max(1, min(max_concurrency, len(prompts)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_complete_one, prompts))
+
+    async def acomplete(self, prompt: str, max_tokens: int = 4096) -> ProviderResponse:
+        """Async variant of ``complete``.
+
+        Runs the blocking call in a worker thread so it can be awaited
+        alongside other coroutines.
+        """
+        # asyncio is imported here rather than at module level: the CLI never
+        # awaits providers, and asyncio is a large share of its import time.
+        import asyncio
+
+        return await asyncio.to_thread(self.complete, prompt, max_tokens)
+
+    async def acomplete_many(
+        self, prompts: list[str], max_tokens: int = 4096, max_concurrency: int = 8
+    ) -> list[ProviderResponse | ProviderError]:
+        """Async variant of ``complete_many``.
+
+        At most ``max_concurrency`` requests are in flight at once. Results
+        come back in prompt order, with failures as ProviderError entries.
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _complete_one(prompt: str) -> ProviderResponse | ProviderError:
+            async with semaphore:
+                try:
+                    return await self.acomplete(prompt, max_tokens=max_tokens)
+                except ProviderError as e:
+                    return e
+
+        return list(await asyncio.gather(*(_complete_one(p) for p in prompts)))
+
+    def confirm(self, prompt: str, max_tokens: int = 4096) -> None:
+        """Mark the response to this prompt as usable.
+
+        Caching wrappers only keep a response beyond the current run once the
+        caller has parsed it and confirmed it. Providers without a cache
+        ignore it.
+        """
+        return None
+
+    def invalidate(self, prompt: str, max_tokens: int = 4096) -> None:
+        """Forget any cached response for this prompt.
+
+        Callers use this when a response turned out to be unusable (e.g. it
+        did not parse), so asking again reaches the model instead of
+        replaying the same reply. Providers without a cache ignore it.
+        """
+        return None
+
+    def warmup(self) -> None:
+        """Prepare the provider before the first real request.
+
+        Providers override this to load their SDK and open a connection so
+        the first ``complete`` call does not pay that setup latency. It is
+        best-effort and must not raise.
+        """
+        return None
+
     @abstractmethod
     def test_connection(self) -> tuple[bool, str]:
         """Test if the provider connection works.
@@ -0,0 +1,155 @@
+"""Response cache for AI providers."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+
+from ... import db
+from .base import BaseAIProvider, ProviderResponse
+
+logger = logging.getLogger("nothx.providers.cache")
+
+# How long a persisted response may be reused on later runs
+PERSISTENT_CACHE_MAX_AGE = timedelta(days=30)
+
+
+class CachingProvider(BaseAIProvider):
+    """Wrap a provider and reuse responses for repeated identical prompts.
+
+    Entries are keyed on provider, model, a digest of the prompt and
+    max_tokens, and evicted least-recently-used once ``max_size`` is
+    reached. Failed calls are never cached, and callers ``invalidate`` a
+    response that turned out to be unusable.
+
+    With ``persist`` enabled, responses are also stored in the database
+    under a SHA-256 of the same fields, so a later run asking the same
+    question skips the API call. Only the hash is stored, not the prompt,
+    and a fresh response is only written once the caller ``confirm``s it
+    parsed, so a truncated reply is never replayed on later runs.
+    """
+
+    def __init__(self, provider: BaseAIProvider, max_size: int = 1024, persist: bool = False):
+        self.provider = provider
+        self.max_size = max_size
+        self.persist = persist
+        self._cache: OrderedDict[tuple[str, str, bytes, int], ProviderResponse] = OrderedDict()
+        # Fresh responses waiting for confirm() before they are persisted
+        self._unconfirmed: dict[tuple[str, str, bytes, int], tuple[str, ProviderResponse]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    @property
+    def default_model(self) -> str:
+        return self.provider.default_model
+
+    @property
+    def model(self) -> str:
+        return getattr(self.provider, "model", self.provider.default_model)
+
+    def get_model_options(self) -> list[str]:
+        return self.provider.get_model_options()
+
+    def is_available(self) -> bool:
+        return self.provider.is_available()
+
+    def warmup(self) -> None:
+        self.provider.warmup()
+
+    def test_connection(self) -> tuple[bool, str]:
+        return self.provider.test_connection()
+
+    def _memory_key(self, prompt: str, max_tokens: int) -> tuple[str, str, bytes, int]:
+        """Key for the in-memory cache."""
+        digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+        return (self.name, self.model, digest, max_tokens)
+
+    def complete(self, prompt: str, max_tokens: int = 4096) -> ProviderResponse:
+        """Return the cached response for this prompt, or fetch and cache it."""
+        key = self._memory_key(prompt, max_tokens)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        response = None
+        persistent_key = None
+        if self.persist:
+            persistent_key = self._persistent_key(prompt, max_tokens)
+            response = self._load_persisted(persistent_key)
+        pending = None
+        if response is None:
+            response = self.provider.complete(prompt, max_tokens=max_tokens)
+            if persistent_key is not None:
+                pending = (persistent_key, response)
+
+        with self._lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            if pending is not None:
+                self._unconfirmed[key] = pending
+            while len(self._cache) > self.max_size:
+                evicted, _ = self._cache.popitem(last=False)
+                self._unconfirmed.pop(evicted, None)
+        return response
+
+    def confirm(self, prompt: str, max_tokens: int = 4096) -> None:
+        """Persist this prompt's fresh response now that it is known to parse."""
+        with self._lock:
+            pending = self._unconfirmed.pop(self._memory_key(prompt, max_tokens), None)
+        if pending is not None:
+            self._store_persisted(*pending)
+
+    def _persistent_key(self, prompt: str, max_tokens: int) -> str:
+        """Content-addressed key for the database cache."""
+        material = f"{self.name}\0{self.model}\0{max_tokens}\0{prompt}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _load_persisted(self, key: str) -> ProviderResponse | None:
+        """Look up a stored response; database problems count as a miss."""
+        try:
+            row = db.get_cached_llm(key, max_age=PERSISTENT_CACHE_MAX_AGE)
+        except sqlite3.Error as e:
+            logger.debug("AI response cache lookup failed: %s", e)
+            return None
+        if row is None:
+            return None
+        return ProviderResponse(text=row["response"], model=row["model"], usage=None)
+
+    def _store_persisted(self, key: str, response: ProviderResponse) -> None:
+        """Store a fresh response; failing to cache never fails the call."""
+        try:
+            db.put_cached_llm(
+                key,
+                self.name,
+                response.model,
+                response.text,
+                max_age=PERSISTENT_CACHE_MAX_AGE,
+            )
+        except sqlite3.Error as e:
+            logger.debug("AI response cache write failed: %s", e)
+
+    def invalidate(self, prompt: str, max_tokens: int = 4096) -> None:
+        """Drop the cached response for this prompt so the next call refetches."""
+        key = self._memory_key(prompt, max_tokens)
+        with self._lock:
+            self._cache.pop(key, None)
+            self._unconfirmed.pop(key, None)
+        if self.persist:
+            # A response persisted by an earlier version may not parse either
+            try:
+                db.delete_cached_llm(self._persistent_key(prompt, max_tokens))
+            except sqlite3.Error as e:
+                logger.debug("AI response cache delete failed: %s", e)
+
+    def clear_cache(self) -> None:
+        """Drop every in-memory cached response."""
+        with self._lock:
+            self._cache.clear()
+            self._unconfirmed.clear()
@@ -47,6 +47,8 @@ def get_provider(
     api_key: str | None = None,
     model: str | None = None,
     api_base: str | None = None,
+    cache_size: int = 0,
+    persist_cache: bool = False,
 ) -> BaseAIProvider | None:
     """Create an AI provider instance.
 
@@ -55,6 +57,8 @@ def get_provider(
         api_key: API key for the provider (not needed for ollama/none)
         model: Model to use (uses provider default if not specified)
         api_base: Custom API base URL (for ollama or custom endpoints)
+        cache_size: Reuse up to this many responses for repeated prompts (0 disables)
+        persist_cache: Also keep cached responses in the database across runs
 
     Returns:
         BaseAIProvider instance or None if provider is "none"
@@ -74,22 +78,28 @@ def get_provider(
     if provider_name == "anthropic":
         from .anthropic_provider import AnthropicProvider
 
-        return AnthropicProvider(api_key=api_key, model=model)
+        provider: BaseAIProvider = AnthropicProvider(api_key=api_key, model=model)
 
     elif provider_name == "openai":
         from .openai_provider import OpenAIProvider
 
-        return OpenAIProvider(api_key=api_key, model=model, api_base=api_base)
+        provider = OpenAIProvider(api_key=api_key, model=model, api_base=api_base)
 
     elif provider_name == "gemini":
         from .gemini_provider import GeminiProvider
 
-        return GeminiProvider(api_key=api_key, model=model)
+        provider = GeminiProvider(api_key=api_key, model=model)
 
     elif provider_name == "ollama":
         from .ollama_provider import OllamaProvider
 
-        return OllamaProvider(api_base=api_base, model=model)
+        provider = OllamaProvider(api_base=api_base, model=model)
 
     else:
         raise ValueError(f"Provider {provider_name} not implemented")
+
+    if cache_size > 0:
+        from .cache import CachingProvider
+
+        return CachingProvider(provider, max_size=cache_size, persist=persist_cache)
+    return provider
@@ -1,28 +1,55 @@
 """Google Gemini provider implementation."""
 
 import logging
+import threading
 from typing import Any
 
-from .base import BaseAIProvider, ProviderError, ProviderErrorType, ProviderResponse
+from .base import (
+    BaseAIProvider,
+    ProviderError,
+    ProviderErrorType,
+    ProviderResponse,
+    classify_error_message,
+    make_sanitizer,
+)
 
 logger = logging.getLogger("nothx.providers.gemini")
 
 
-def _sanitize_error_message(error: Exception) -> str:
-    """Sanitize error message to avoid exposing API keys."""
-    msg = str(error)
-    # Common patterns that might contain API keys
-    sensitive_patterns = ["api_key=", "api-key=", "authorization:", "bearer ", "aiza"]
-    msg_lower = msg.lower()
-    for pattern in sensitive_patterns:
-        if pattern in msg_lower:
-            return "API error (details redacted for security)"
-    return msg
+_sanitize_error_message = make_sanitizer("aiza")
+
+
+_sdk: Any = None
+_sdk_exceptions: Any = None
+
+
+def _load_sdk() -> tuple[Any, Any]:
+    """Import the Gemini SDK on first use and reuse it afterwards.
+
+    Returns:
+        Tuple of (google.generativeai, google.api_core.exceptions)
+    """
+    global _sdk, _sdk_exceptions
+    if _sdk is None:
+        try:
+            import google.generativeai as genai
+            from google.api_core import exceptions as google_exceptions
+        except ImportError as err:
+            raise ImportError(
+                "Google Generative AI SDK not installed. Run: pip install google-generativeai"
+            ) from err
+        _sdk, _sdk_exceptions = genai, google_exceptions
+    return _sdk, _sdk_exceptions
 
 
 class GeminiProvider(BaseAIProvider):
     """Google Gemini API provider."""
 
+    # genai.configure() is process-wide and discards the SDK's cached gRPC
+    # clients, so only reconfigure when the API key actually changes.
+    _configured_key: str | None = None
+    _configure_lock = threading.Lock()
+
     def __init__(self, api_key: str | None, model: str | None = None):
         self.api_key = api_key
         self.model = model or self.default_model
@@ -46,15 +73,12 @@ class GeminiProvider(BaseAIProvider):
     def _get_client(self):
         """Get or create Gemini client."""
         if self._client is None:
-            try:
-                import google.generativeai as genai
-
-                genai.configure(api_key=self.api_key)
-                self._client = genai.GenerativeModel(self.model)
-            except ImportError as err:
-                raise ImportError(
-                    "Google Generative AI SDK not installed. Run: pip install google-generativeai"
-                ) from err
+            genai, _ = _load_sdk()
+            with GeminiProvider._configure_lock:
+                if GeminiProvider._configured_key != self.api_key:
+                    genai.configure(api_key=self.api_key)
+                    GeminiProvider._configured_key = self.api_key
+            self._client = genai.GenerativeModel(self.model)
         return self._client
 
     def is_available(self) -> bool:
@@ -64,8 +88,7 @@ class GeminiProvider(BaseAIProvider):
     def complete(self, prompt: str, max_tokens: int = 4096) -> ProviderResponse:
         """Send prompt to Gemini and get response."""
         try:
-            from google.api_core import exceptions as google_exceptions
-
+            _, google_exceptions = _load_sdk()
             client = self._get_client()
 
             # Gemini uses generation_config for max tokens
@@ -76,10 +99,11 @@ class GeminiProvider(BaseAIProvider):
 
             # Extract usage if available
             usage = None
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
+            usage_metadata = getattr(response, "usage_metadata", None)
+            if usage_metadata:
                 usage = {
-                    "input_tokens": getattr(response.usage_metadata, "prompt_token_count", 0),
-                    "output_tokens": getattr(response.usage_metadata, "candidates_token_count", 0),
+                    "input_tokens": usage_metadata.prompt_token_count,
+                    "output_tokens": usage_metadata.candidates_token_count,
                 }
 
             return ProviderResponse(
@@ -122,14 +146,26 @@ class GeminiProvider(BaseAIProvider):
                 cause=e,
             ) from e
         except Exception as e:
+            error_type, retryable = classify_error_message(str(e))
             raise ProviderError(
-                error_type=ProviderErrorType.UNKNOWN,
+                error_type=error_type,
                 message=_sanitize_error_message(e),
                 provider=self.name,
-                retryable=False,
+                retryable=retryable,
                 cause=e,
             ) from e
 
+    def warmup(self) -> None:
+        """Load the SDK and open the API connection with a cheap request."""
+        if not self.api_key:
+            return
+        try:
+            self._get_client()
+            genai, _ = _load_sdk()
+            genai.get_model(f"models/{self.model}")
+        except Exception as e:
+            logger.debug("Gemini warmup failed: %s", _sanitize_error_message(e))
+
     def test_connection(self) -> tuple[bool, str]:
         """Test Gemini API connection."""
         if not self.api_key:
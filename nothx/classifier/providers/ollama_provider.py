@@ -1,13 +1,36 @@
 """Ollama local model provider implementation."""
 
+import json
 import logging
+import time
+from collections.abc import Iterator
+from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .base import BaseAIProvider, ProviderError, ProviderErrorType, ProviderResponse
+from .base import (
+    BaseAIProvider,
+    ProviderError,
+    ProviderErrorType,
+    ProviderResponse,
+    classify_error_message,
+)
 
 logger = logging.getLogger("nothx.providers.ollama")
 
+# How long a /api/tags response is reused before asking the server again
+TAGS_CACHE_TTL = 30.0
+
+# Request timeouts in seconds. Local models can be slow to generate (and to
+# load on first use), so generation gets far longer than the tags lookup.
+TAGS_TIMEOUT = 5
+GENERATE_TIMEOUT = 120
+TEST_GENERATE_TIMEOUT = 30
+
+# Request body for the connection test's tiny generation
+TEST_GENERATE_BODY = {"prompt": "Say 'ok'", "stream": False, "options": {"num_predict": 10}}
+
 
 class OllamaProvider(BaseAIProvider):
     """Ollama local model provider.
@@ -25,6 +48,13 @@ class OllamaProvider(BaseAIProvider):
         self.api_base = api_base or "http://localhost:11434"
         self.model = model or self.default_model
         self._available: bool | None = None
+        self._tags_cache: tuple[float, dict[str, Any] | None] | None = None
+        # One keep-alive session so repeated calls reuse pooled connections
+        # instead of reconnecting to the Ollama server every time.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     @property
     def name(self) -> str:
@@ -34,15 +64,30 @@ class OllamaProvider(BaseAIProvider):
     def default_model(self) -> str:
         return "llama3.2"
 
+    def _fetch_tags(self) -> dict[str, Any] | None:
+        """Return the server's /api/tags payload, or None if it did not respond OK.
+
+        Responses are reused for TAGS_CACHE_TTL seconds so availability
+        checks, model listing and connection tests share one request.
+        Request errors are raised and not cached.
+        """
+        now = time.monotonic()
+        if self._tags_cache is not None and now - self._tags_cache[0] < TAGS_CACHE_TTL:
+            return self._tags_cache[1]
+
+        response = self._session.get(
+            f"{self.api_base}/api/tags",
+            timeout=TAGS_TIMEOUT,
+        )
+        data = json.loads(response.content) if response.ok else None
+        self._tags_cache = (now, data)
+        return data
+
     def get_model_options(self) -> list[str]:
         """Get list of available local models."""
         try:
-            response = requests.get(
-                f"{self.api_base}/api/tags",
-                timeout=5,
-            )
-            if response.ok:
-                data = response.json()
+            data = self._fetch_tags()
+            if data is not None:
                 return [m["name"] for m in data.get("models", [])]
         except Exception:
             pass
@@ -62,11 +107,7 @@ class OllamaProvider(BaseAIProvider):
             return self._available
 
         try:
-            response = requests.get(
-                f"{self.api_base}/api/tags",
-                timeout=5,
-            )
-            self._available = response.ok
+            self._available = self._fetch_tags() is not None
         except Exception:
             self._available = False
 
@@ -75,7 +116,7 @@ class OllamaProvider(BaseAIProvider):
     def complete(self, prompt: str, max_tokens: int = 4096) -> ProviderResponse:
         """Send prompt to Ollama and get response."""
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_base}/api/generate",
                 json={
                     "model": self.model,
@@ -85,11 +126,11 @@ class OllamaProvider(BaseAIProvider):
                         "num_predict": max_tokens,
                     },
                 },
-                timeout=120,  # Local models can be slow
+                timeout=GENERATE_TIMEOUT,
             )
 
             response.raise_for_status()
-            data = response.json()
+            data = json.loads(response.content)
 
             usage = None
             if "prompt_eval_count" in data or "eval_count" in data:
@@ -103,59 +144,109 @@ class OllamaProvider(BaseAIProvider):
                 model=self.model,
                 usage=usage,
             )
-        except requests.exceptions.HTTPError as e:
+        except Exception as e:
+            raise self._to_provider_error(e) from e
+
+    def stream(self, prompt: str, max_tokens: int = 4096) -> Iterator[str]:
+        """Stream the completion from Ollama as it is generated."""
+        try:
+            with self._session.post(
+                f"{self.api_base}/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": True,
+                    "options": {
+                        "num_predict": max_tokens,
+                    },
+                },
+                timeout=GENERATE_TIMEOUT,  # Applies per read, so long generations keep streaming
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        raise ProviderError(
+                            error_type=ProviderErrorType.MODEL_ERROR,
+                            message=f"Ollama error: {chunk['error']}",
+                            provider=self.name,
+                            retryable=False,
+                        )
+                    text = chunk.get("response", "")
+                    if text:
+                        yield text
+                    if chunk.get("done"):
+                        return
+        except ProviderError:
+            raise
+        except Exception as e:
+            raise self._to_provider_error(e) from e
+
+    def _to_provider_error(self, e: Exception) -> ProviderError:
+        """Map a failed Ollama request onto a structured ProviderError."""
+        if isinstance(e, requests.exceptions.HTTPError):
             error_type = ProviderErrorType.UNKNOWN
             if e.response is not None:
                 if e.response.status_code == 404:
                     error_type = ProviderErrorType.MODEL_ERROR
                 elif e.response.status_code == 429:
                     error_type = ProviderErrorType.RATE_LIMIT_ERROR
-            raise ProviderError(
+            return ProviderError(
                 error_type=error_type,
                 message=f"Ollama HTTP error: {e}",
                 provider=self.name,
                 retryable=error_type == ProviderErrorType.RATE_LIMIT_ERROR,
                 cause=e,
-            ) from e
-        except requests.exceptions.Timeout as e:
-            raise ProviderError(
+            )
+        if isinstance(e, requests.exceptions.Timeout):
+            return ProviderError(
                 error_type=ProviderErrorType.TIMEOUT_ERROR,
                 message="Ollama request timed out",
                 provider=self.name,
                 retryable=True,
                 cause=e,
-            ) from e
-        except requests.exceptions.ConnectionError as e:
-            raise ProviderError(
+            )
+        if isinstance(e, requests.exceptions.ConnectionError):
+            return ProviderError(
                 error_type=ProviderErrorType.CONNECTION_ERROR,
                 message=f"Cannot connect to Ollama at {self.api_base}",
                 provider=self.name,
                 retryable=True,
                 cause=e,
-            ) from e
+            )
+        error_type, retryable = classify_error_message(str(e))
+        return ProviderError(
+            error_type=error_type,
+            message=str(e),
+            provider=self.name,
+            retryable=retryable,
+            cause=e,
+        )
+
+    def warmup(self) -> None:
+        """Ask Ollama to load the model so the first generation skips the load."""
+        try:
+            # A generate request without a prompt only loads the model
+            self._session.post(
+                f"{self.api_base}/api/generate",
+                json={"model": self.model},
+                timeout=GENERATE_TIMEOUT,
+            )
         except Exception as e:
-            raise ProviderError(
-                error_type=ProviderErrorType.UNKNOWN,
-                message=str(e),
-                provider=self.name,
-                retryable=False,
-                cause=e,
-            ) from e
+            logger.debug("Ollama warmup failed: %s", e)
 
     def test_connection(self) -> tuple[bool, str]:
         """Test Ollama connection."""
         try:
             # First check if Ollama is running
-            response = requests.get(
-                f"{self.api_base}/api/tags",
-                timeout=5,
-            )
-
-            if not response.ok:
+            data = self._fetch_tags()
+            if data is None:
                 return False, f"Ollama not responding at {self.api_base}"
 
             # Check if our model is available
-            data = response.json()
             models = [m["name"] for m in data.get("models", [])]
 
             # Model names can include :tag, so check prefix
@@ -171,15 +262,10 @@ class OllamaProvider(BaseAIProvider):
                 )
 
             # Test actual generation
-            test_response = requests.post(
+            test_response = self._session.post(
                 f"{self.api_base}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": "Say 'ok'",
-                    "stream": False,
-                    "options": {"num_predict": 10},
-                },
-                timeout=30,
+                json={**TEST_GENERATE_BODY, "model": self.model},
+                timeout=TEST_GENERATE_TIMEOUT,
             )
 
             if test_response.ok:
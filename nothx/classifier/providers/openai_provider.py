@@ -1,28 +1,57 @@
 """OpenAI GPT provider implementation."""
 
+import asyncio
+import json
 import logging
+import re
+import threading
+import time
 from typing import Any
 
-from .base import BaseAIProvider, ProviderError, ProviderErrorType, ProviderResponse
+from .base import (
+    BaseAIProvider,
+    ProviderError,
+    ProviderErrorType,
+    ProviderResponse,
+    classify_error_message,
+    make_sanitizer,
+)
 
 logger = logging.getLogger("nothx.providers.openai")
 
+# Batch API job states that will never produce (more) output
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
 
-def _sanitize_error_message(error: Exception) -> str:
-    """Sanitize error message to avoid exposing API keys."""
-    msg = str(error)
-    # Common patterns that might contain API keys
-    sensitive_patterns = ["api_key=", "api-key=", "authorization:", "bearer ", "sk-"]
-    msg_lower = msg.lower()
-    for pattern in sensitive_patterns:
-        if pattern in msg_lower:
-            return "API error (details redacted for security)"
-    return msg
+# The request id at the start of a Batch API output line, for lines that
+# are too damaged to parse as JSON
+_CUSTOM_ID_RE = re.compile(r'"custom_id"\s*:\s*"(\d+)"')
+
+
+_sanitize_error_message = make_sanitizer("sk-")
+
+
+_sdk: Any = None
+
+
+def _load_sdk() -> Any:
+    """Import the OpenAI SDK on first use and reuse it afterwards."""
+    global _sdk
+    if _sdk is None:
+        try:
+            import openai
+        except ImportError as err:
+            raise ImportError("OpenAI SDK not installed. Run: pip install openai") from err
+        _sdk = openai
+    return _sdk
 
 
 class OpenAIProvider(BaseAIProvider):
     """OpenAI GPT API provider."""
 
+    # Clients keyed by (api_key, api_base), shared across instances
+    _client_cache: dict[tuple[str | None, str | None], Any] = {}
+    _client_cache_lock = threading.Lock()
+
     def __init__(
         self,
         api_key: str | None,
@@ -51,19 +80,37 @@ class OpenAIProvider(BaseAIProvider):
         ]
 
     def _get_client(self):
-        """Get or create OpenAI client."""
+        """Get or create OpenAI client.
+
+        Clients are shared by every provider instance with the same key and
+        endpoint, so they also share one connection pool.
+        """
         if self._client is None:
-            try:
-                from openai import OpenAI
-
-                if self.api_base:
-                    self._client = OpenAI(api_key=self.api_key, base_url=self.api_base)
-                else:
-                    self._client = OpenAI(api_key=self.api_key)
-            except ImportError as err:
-                raise ImportError("OpenAI SDK not installed. Run: pip install openai") from err
+            key = (self.api_key, self.api_base)
+            with self._client_cache_lock:
+                client = self._client_cache.get(key)
+                if client is None:
+                    openai = _load_sdk()
+                    if self.api_base:
+                        client = openai.OpenAI(api_key=self.api_key, base_url=self.api_base)
+                    else:
+                        client = openai.OpenAI(api_key=self.api_key)
+                    self._client_cache[key] = client
+            self._client = client
         return self._client
 
+    def _new_async_client(self):
+        """Create an AsyncOpenAI client.
+
+        Async clients hold connections bound to the event loop that opened
+        them, so each async call owns one and closes it when it is done
+        rather than leaving its pool behind for a later loop.
+        """
+        openai = _load_sdk()
+        if self.api_base:
+            return openai.AsyncOpenAI(api_key=self.api_key, base_url=self.api_base)
+        return openai.AsyncOpenAI(api_key=self.api_key)
+
     def is_available(self) -> bool:
         """Check if OpenAI is configured."""
         return bool(self.api_key)
@@ -71,66 +118,216 @@ class OpenAIProvider(BaseAIProvider):
     def complete(self, prompt: str, max_tokens: int = 4096) -> ProviderResponse:
         """Send prompt to GPT and get response."""
         try:
-            from openai import (
-                APIConnectionError,
-                APITimeoutError,
-                AuthenticationError,
-                RateLimitError,
-            )
-
             client = self._get_client()
             response = client.chat.completions.create(
                 model=self.model,
                 max_tokens=max_tokens,
                 messages=[{"role": "user", "content": prompt}],
             )
-
-            usage = None
-            if response.usage:
-                usage = {
-                    "input_tokens": response.usage.prompt_tokens,
-                    "output_tokens": response.usage.completion_tokens,
-                }
-
-            return ProviderResponse(
-                text=response.choices[0].message.content or "",
-                model=self.model,
-                usage=usage,
-            )
+            return self._to_response(response)
         except ImportError:
             raise
-        except RateLimitError as e:
-            raise ProviderError(
+        except Exception as e:
+            raise self._to_provider_error(e) from e
+
+    async def acomplete(self, prompt: str, max_tokens: int = 4096) -> ProviderResponse:
+        """Send prompt to GPT without blocking the event loop.
+
+        Uses the SDK's native async client rather than a worker thread.
+        """
+        results = await self.acomplete_many([prompt], max_tokens=max_tokens)
+        if isinstance(results[0], ProviderError):
+            raise results[0]
+        return results[0]
+
+    async def acomplete_many(
+        self, prompts: list[str], max_tokens: int = 4096, max_concurrency: int = 8
+    ) -> list[ProviderResponse | ProviderError]:
+        """Send several prompts over one AsyncOpenAI client.
+
+        The client's connection pool is shared by every request of the call
+        and closed before returning. See the base class for the result shape.
+        """
+        if not prompts:
+            return []
+        client = self._new_async_client()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _complete_one(prompt: str) -> ProviderResponse | ProviderError:
+            async with semaphore:
+                try:
+                    response = await client.chat.completions.create(
+                        model=self.model,
+                        max_tokens=max_tokens,
+                        messages=[{"role": "user", "content": prompt}],
+                    )
+                    return self._to_response(response)
+                except Exception as e:
+                    return self._to_provider_error(e)
+
+        try:
+            return list(await asyncio.gather(*(_complete_one(p) for p in prompts)))
+        finally:
+            await client.close()
+
+    def _to_response(self, response: Any) -> ProviderResponse:
+        """Build a ProviderResponse from a chat completion."""
+        usage = None
+        response_usage = response.usage
+        if response_usage:
+            usage = {
+                "input_tokens": response_usage.prompt_tokens,
+                "output_tokens": response_usage.completion_tokens,
+            }
+
+        return ProviderResponse(
+            text=response.choices[0].message.content or "",
+            model=self.model,
+            usage=usage,
+        )
+
+    def _to_provider_error(self, e: Exception) -> ProviderError:
+        """Map an exception raised by the SDK to a ProviderError."""
+        openai = _load_sdk()
+        if isinstance(e, openai.RateLimitError):
+            return ProviderError(
                 error_type=ProviderErrorType.RATE_LIMIT_ERROR,
                 message=str(e),
                 provider=self.name,
                 retryable=True,
                 cause=e,
-            ) from e
-        except AuthenticationError as e:
-            raise ProviderError(
+            )
+        if isinstance(e, openai.AuthenticationError):
+            return ProviderError(
                 error_type=ProviderErrorType.AUTHENTICATION_ERROR,
                 message=_sanitize_error_message(e),
                 provider=self.name,
                 retryable=False,
                 cause=e,
-            ) from e
-        except APITimeoutError as e:
-            raise ProviderError(
+            )
+        if isinstance(e, openai.APITimeoutError):
+            return ProviderError(
                 error_type=ProviderErrorType.TIMEOUT_ERROR,
                 message=str(e),
                 provider=self.name,
                 retryable=True,
                 cause=e,
-            ) from e
-        except APIConnectionError as e:
-            raise ProviderError(
+            )
+        if isinstance(e, openai.APIConnectionError):
+            return ProviderError(
                 error_type=ProviderErrorType.CONNECTION_ERROR,
                 message=str(e),
                 provider=self.name,
                 retryable=True,
                 cause=e,
-            ) from e
+            )
+        error_type, retryable = classify_error_message(str(e))
+        return ProviderError(
+            error_type=error_type,
+            message=_sanitize_error_message(e),
+            provider=self.name,
+            retryable=retryable,
+            cause=e,
+        )
+
+    def complete_batch(
+        self,
+        prompts: list[str],
+        max_tokens: int = 4096,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        timeout: float = 24 * 60 * 60,
+    ) -> list[ProviderResponse | ProviderError]:
+        """Run prompts through the OpenAI Batch API and wait for the results.
+
+        Batch jobs are billed at a discount and are not subject to the
+        per-minute request limits, but complete asynchronously (within 24
+        hours), so this suits offline classification rather than
+        interactive runs.
+
+        Args:
+            prompts: The prompts to send
+            max_tokens: Maximum tokens in each response
+            poll_interval: Initial delay between status checks, in seconds
+            max_poll_interval: Upper bound for the backed-off poll delay
+            timeout: Give up waiting after this many seconds
+
+        Returns:
+            One entry per prompt, in the same order: the ProviderResponse, or
+            a ProviderError for requests the batch could not complete
+
+        Raises:
+            ProviderError: If the batch cannot be submitted, fails as a
+                whole, or does not finish within ``timeout``
+        """
+        if not prompts:
+            return []
+
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "max_tokens": max_tokens,
+                        "messages": [{"role": "user", "content": prompt}],
+                    },
+                }
+            )
+            for index, prompt in enumerate(prompts)
+        ]
+
+        try:
+            client = self._get_client()
+            input_file = client.files.create(
+                file=("nothx-batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            logger.info(
+                "Submitted OpenAI batch %s with %d requests",
+                batch.id,
+                len(prompts),
+                extra={"batch_id": batch.id, "request_count": len(prompts)},
+            )
+
+            deadline = time.monotonic() + timeout
+            delay = poll_interval
+            while batch.status not in BATCH_TERMINAL_STATUSES:
+                if time.monotonic() + delay > deadline:
+                    raise ProviderError(
+                        error_type=ProviderErrorType.TIMEOUT_ERROR,
+                        message=f"OpenAI batch {batch.id} did not finish in time",
+                        provider=self.name,
+                        details={"batch_id": batch.id, "status": batch.status},
+                        retryable=True,
+                    )
+                time.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+                batch = client.batches.retrieve(batch.id)
+
+            if batch.status != "completed":
+                raise ProviderError(
+                    error_type=ProviderErrorType.INVALID_REQUEST,
+                    message=f"OpenAI batch {batch.id} ended with status {batch.status}",
+                    provider=self.name,
+                    details={"batch_id": batch.id, "status": batch.status},
+                    retryable=batch.status == "expired",
+                )
+
+            output_text = ""
+            if batch.output_file_id:
+                output_text = client.files.content(batch.output_file_id).text
+        except ImportError:
+            raise
+        except ProviderError:
+            raise
         except Exception as e:
             raise ProviderError(
                 error_type=ProviderErrorType.UNKNOWN,
@@ -140,6 +337,79 @@ class OpenAIProvider(BaseAIProvider):
                 cause=e,
             ) from e
 
+        results: list[ProviderResponse | ProviderError] = [
+            ProviderError(
+                error_type=ProviderErrorType.UNKNOWN,
+                message="No result returned for this batch request",
+                provider=self.name,
+                retryable=True,
+            )
+            for _ in prompts
+        ]
+        for line in output_text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                # A damaged line loses only its own request; salvage the id
+                # if it survived so that entry says why
+                logger.warning("Skipping malformed OpenAI batch output line: %s", e)
+                id_match = _CUSTOM_ID_RE.search(line)
+                if id_match and int(id_match.group(1)) < len(prompts):
+                    results[int(id_match.group(1))] = ProviderError(
+                        error_type=ProviderErrorType.PARSE_ERROR,
+                        message="Batch output line was not valid JSON",
+                        provider=self.name,
+                        retryable=True,
+                        cause=e,
+                    )
+                continue
+            try:
+                index = int(record["custom_id"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not 0 <= index < len(prompts):
+                continue
+            results[index] = self._parse_batch_record(record)
+        return results
+
+    def _parse_batch_record(self, record: dict) -> ProviderResponse | ProviderError:
+        """Convert one Batch API output line into a response or error."""
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            error = record.get("error") or body.get("error") or {}
+            return ProviderError(
+                error_type=ProviderErrorType.INVALID_REQUEST,
+                message=str(error.get("message") or "Batch request failed"),
+                provider=self.name,
+                details={"status_code": response.get("status_code")},
+                retryable=response.get("status_code") == 429,
+            )
+
+        usage = None
+        if body.get("usage"):
+            usage = {
+                "input_tokens": body["usage"].get("prompt_tokens", 0),
+                "output_tokens": body["usage"].get("completion_tokens", 0),
+            }
+        choices = body.get("choices") or [{}]
+        return ProviderResponse(
+            text=(choices[0].get("message") or {}).get("content") or "",
+            model=self.model,
+            usage=usage,
+        )
+
+    def warmup(self) -> None:
+        """Load the SDK and open the API connection with a cheap request."""
+        if not self.api_key:
+            return
+        try:
+            self._get_client().models.retrieve(self.model)
+        except Exception as e:
+            logger.debug("OpenAI warmup failed: %s", _sanitize_error_message(e))
+
     def test_connection(self) -> tuple[bool, str]:
         """Test OpenAI API connection."""
         if not self.api_key:
@@ -1,19 +1,147 @@
 """Layer 1: User-defined rules for classification."""
 
+import fnmatch
 import logging
+import re
+import sys
+from dataclasses import dataclass, field
 
 from .. import db
 from ..models import Action, Classification, EmailType, SenderStats
-from .utils import matches_pattern
 
 logger = logging.getLogger("nothx.classifier.rules")
 
+# Plain dict lookup instead of Action(value), which goes through EnumMeta.__call__
+_ACTION_BY_VALUE = {action.value: action for action in Action}
+_VALID_ACTION_VALUES = tuple(_ACTION_BY_VALUE)
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledRule:
+    """A user rule validated once at load time."""
+
+    index: int  # Position in priority order; lower wins
+    key: str  # What the rule's bucket compares the domain against
+    action: Action
+    pattern: str  # As the user wrote it
+    reasoning: str  # Built once here rather than on every match
+
+
+@dataclass
+class _CompiledRules:
+    """User rules pre-sorted into buckets by pattern shape.
+
+    Every bucket yields at most its highest-priority hit (dict buckets keep
+    the first rule per key, list buckets are in priority order); ``match``
+    then takes the candidate with the lowest position across buckets,
+    preserving the first-match-wins semantics of a linear scan.
+    """
+
+    exact: dict[str, _CompiledRule] = field(default_factory=dict)  # "news.example.com"
+    # Keyed by the text up to and including a dot, and by a dot and
+    # everything after it, so a domain is checked once per dot it contains
+    prefix: dict[str, _CompiledRule] = field(default_factory=dict)  # "marketing.*"
+    suffix: dict[str, _CompiledRule] = field(default_factory=dict)  # "*.example.com"
+    contains: list[_CompiledRule] = field(default_factory=list)  # "*bank*"
+    # One alternation over every contains-rule substring: a single scan of the
+    # domain rules out the whole contains bucket in the common no-hit case.
+    contains_any: re.Pattern[str] | None = None
+    # Anything else with "*"; matched through one union regex built at load
+    # time, whose named groups map to rules through glob_by_group
+    glob: list[_CompiledRule] = field(default_factory=list)
+    glob_any: re.Pattern[str] | None = None
+    glob_by_group: dict[str, _CompiledRule] = field(default_factory=dict)
+    # Position of the first wildcard rule; an exact hit before it cannot be beaten
+    first_wildcard: int = sys.maxsize
+
+
+def _glob_body(pattern: str) -> str:
+    """Translate a glob to regex source without fnmatch's end anchor."""
+    return fnmatch.translate(pattern).removesuffix(r"\Z")
+
+
+def _compile_rules(rules: list[dict]) -> _CompiledRules:
+    """Validate and bucket rules once so matching does no per-rule parsing."""
+    compiled = _CompiledRules()
+    for index, rule in enumerate(rules):
+        raw_pattern = rule["pattern"]
+        pattern = raw_pattern.lower()
+        action_str = rule["action"]
+
+        # Validate action value
+        action = _ACTION_BY_VALUE.get(action_str)
+        if action is None:
+            # Log invalid rules instead of silently skipping
+            logger.warning(
+                "Skipping rule with invalid action: pattern='%s', action='%s'",
+                raw_pattern,
+                action_str,
+                extra={
+                    "pattern": raw_pattern,
+                    "invalid_action": action_str,
+                    "valid_actions": _VALID_ACTION_VALUES,
+                },
+            )
+            continue
+
+        reasoning = f"Matched user rule: {pattern}"
+
+        # Any pattern matches a domain equal to it, wildcards included
+        compiled.exact.setdefault(
+            pattern, _CompiledRule(index, pattern, action, raw_pattern, reasoning)
+        )
+
+        if pattern.endswith(".*"):
+            key = pattern[:-2] + "."
+            compiled.prefix.setdefault(
+                key, _CompiledRule(index, key, action, raw_pattern, reasoning)
+            )
+        elif pattern.startswith("*."):
+            key = pattern[1:]
+            compiled.suffix.setdefault(
+                key, _CompiledRule(index, key, action, raw_pattern, reasoning)
+            )
+        elif "*" in pattern:
+            core = pattern[1:-1]
+            if (
+                len(pattern) > 2
+                and pattern[0] == "*"
+                and pattern[-1] == "*"
+                and not any(c in core for c in "*?[")
+            ):
+                compiled.contains.append(_CompiledRule(index, core, action, raw_pattern, reasoning))
+            else:
+                compiled.glob.append(_CompiledRule(index, pattern, action, raw_pattern, reasoning))
+        else:
+            continue  # Exact pattern, already indexed above
+        compiled.first_wildcard = min(compiled.first_wildcard, index)
+    if compiled.glob:
+        # Alternatives are tried left to right and fullmatch backtracks past
+        # ones that cannot reach the end, so the group that matches belongs
+        # to the earliest matching rule.
+        compiled.glob_by_group = {f"r{i}": entry for i, entry in enumerate(compiled.glob)}
+        compiled.glob_any = re.compile(
+            "|".join(
+                f"(?P<{group}>{_glob_body(entry.key)})"
+                for group, entry in compiled.glob_by_group.items()
+            )
+        )
+    if compiled.contains:
+        compiled.contains_any = re.compile(
+            "|".join(re.escape(entry.key) for entry in compiled.contains)
+        )
+    return compiled
+
 
 class RulesMatcher:
     """Matches senders against user-defined rules."""
 
+    __slots__ = ("_rules", "_compiled", "_overrides")
+
     def __init__(self):
         self._rules: list[dict] | None = None
+        self._compiled: _CompiledRules | None = None
+        self._overrides: dict[str, str] | None = None
 
     def _load_rules(self) -> list[dict]:
         """Load rules from database."""
@@ -21,40 +149,68 @@ class RulesMatcher:
             self._rules = db.get_rules()
         return self._rules
 
+    def _load_compiled(self) -> _CompiledRules:
+        """Load rules and compile them into match buckets."""
+        if self._compiled is None:
+            self._compiled = _compile_rules(self._load_rules())
+        return self._compiled
+
+    def _load_overrides(self) -> dict[str, str]:
+        """Load all sender overrides in one query instead of one per sender."""
+        if self._overrides is None:
+            self._overrides = db.get_user_overrides()
+        return self._overrides
+
     def reload(self) -> None:
-        """Force reload of rules from database."""
+        """Force reload of rules and overrides from database."""
         self._rules = None
+        self._compiled = None
+        self._overrides = None
+
+    def _find_rule(self, domain: str) -> _CompiledRule | None:
+        """Return the highest-priority rule matching a lowercased domain."""
+        compiled = self._load_compiled()
+        best = compiled.exact.get(domain)
+        # Common case: an exact rule listed ahead of every wildcard wins outright
+        if best is not None and best.index < compiled.first_wildcard:
+            return best
+
+        def better(entry: _CompiledRule) -> bool:
+            return best is None or entry.index < best.index
+
+        if compiled.prefix or compiled.suffix:
+            # "*.example.com" also matches the bare "example.com"
+            candidates = [compiled.suffix.get("." + domain)]
+            dot = domain.find(".")
+            while dot != -1:
+                candidates.append(compiled.prefix.get(domain[: dot + 1]))
+                candidates.append(compiled.suffix.get(domain[dot:]))
+                dot = domain.find(".", dot + 1)
+            for entry in candidates:
+                if entry is not None and better(entry):
+                    best = entry
+        if compiled.contains_any is not None and compiled.contains_any.search(domain):
+            for entry in compiled.contains:
+                if better(entry) and entry.key in domain:
+                    best = entry
+                    break
+        if compiled.glob_any is not None:
+            glob_match = compiled.glob_any.fullmatch(domain)
+            if glob_match is not None and glob_match.lastgroup is not None:
+                entry = compiled.glob_by_group[glob_match.lastgroup]
+                if better(entry):
+                    best = entry
+        return best
 
     def match(self, sender: SenderStats) -> Classification | None:
         """
         Check if sender matches any user rule.
         Returns Classification if match found, None otherwise.
         """
-        rules = self._load_rules()
-
-        for rule in rules:
-            pattern = rule["pattern"].lower()
-            action_str = rule["action"]
-
-            # Validate action value
-            try:
-                action = Action(action_str)
-            except ValueError:
-                # Log invalid rules instead of silently skipping
-                logger.warning(
-                    "Skipping rule with invalid action: pattern='%s', action='%s'",
-                    pattern,
-                    action_str,
-                    extra={
-                        "pattern": pattern,
-                        "invalid_action": action_str,
-                        "valid_actions": [a.value for a in Action],
-                    },
-                )
-                continue
-
-            # Check if domain matches pattern
-            if matches_pattern(sender.domain, pattern):
+        rule = self._find_rule(sender.domain.lower())
+        if rule is not None:
+            action, pattern = rule.action, rule.pattern
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "Rule matched: %s -> %s (pattern: %s)",
                     sender.domain,
@@ -66,34 +222,19 @@ class RulesMatcher:
                         "pattern": pattern,
                     },
                 )
-                return Classification(
-                    email_type=EmailType.UNKNOWN,
-                    action=action,
-                    confidence=1.0,
-                    reasoning=f"Matched user rule: {pattern}",
-                    source="user_rule",
-                )
+            return Classification(
+                email_type=EmailType.UNKNOWN,
+                action=action,
+                confidence=1.0,
+                reasoning=rule.reasoning,
+                source="user_rule",
+            )
 
         # Check if there's a user override in the sender record
-        sender_record = db.get_sender(sender.domain)
-        if sender_record and sender_record.get("user_override"):
-            override_str = sender_record["user_override"]
-            try:
-                override_action = Action(override_str)
-                logger.debug(
-                    "User override applied: %s -> %s",
-                    sender.domain,
-                    override_action.value,
-                    extra={"domain": sender.domain, "action": override_action.value},
-                )
-                return Classification(
-                    email_type=EmailType.UNKNOWN,
-                    action=override_action,
-                    confidence=1.0,
-                    reasoning="User override",
-                    source="user_rule",
-                )
-            except ValueError:
+        override_str = self._load_overrides().get(sender.domain)
+        if override_str:
+            override_action = _ACTION_BY_VALUE.get(override_str)
+            if override_action is None:
                 # Log invalid override instead of silently skipping
                 logger.warning(
                     "Sender %s has invalid user_override value: '%s'",
@@ -102,9 +243,24 @@ class RulesMatcher:
                     extra={
                         "domain": sender.domain,
                         "invalid_override": override_str,
-                        "valid_actions": [a.value for a in Action],
+                        "valid_actions": _VALID_ACTION_VALUES,
                     },
                 )
+            else:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "User override applied: %s -> %s",
+                        sender.domain,
+                        override_action.value,
+                        extra={"domain": sender.domain, "action": override_action.value},
+                    )
+                return Classification(
+                    email_type=EmailType.UNKNOWN,
+                    action=override_action,
+                    confidence=1.0,
+                    reasoning="User override",
+                    source="user_rule",
+                )
 
         return None
 
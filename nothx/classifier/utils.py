@@ -20,9 +20,23 @@ def matches_pattern(value: str, pattern: str) -> bool:
     Returns:
         True if the value matches the pattern
     """
-    value = value.lower()
-    pattern = pattern.lower()
+    return matches_normalized_pattern(value.lower(), pattern.lower())
 
+
+def matches_normalized_pattern(value: str, pattern: str) -> bool:
+    """
+    Same as ``matches_pattern`` for inputs that are already lowercase.
+
+    Callers that test one value against many patterns should lowercase both
+    once up front and call this directly.
+
+    Args:
+        value: The lowercased string to check
+        pattern: The lowercased pattern to match against
+
+    Returns:
+        True if the value matches the pattern
+    """
     # Direct match
     if value == pattern:
         return True
@@ -44,8 +58,17 @@ def matches_pattern(value: str, pattern: str) -> bool:
             return True
         return False
 
-    # Handle patterns with * in the middle or elsewhere (e.g., "*bank*")
+    # Handle plain contains patterns like "*bank*" with a substring test
+    if (
+        len(pattern) > 2
+        and pattern[0] == "*"
+        and pattern[-1] == "*"
+        and not any(c in pattern[1:-1] for c in "*?[")
+    ):
+        return pattern[1:-1] in value
+
+    # Handle patterns with * in the middle or elsewhere (e.g., "mail*.com")
     if "*" in pattern:
-        return fnmatch.fnmatch(value, pattern)
+        return fnmatch.fnmatchcase(value, pattern)
 
     return False
@@ -2,28 +2,36 @@
 
 import csv
 import hashlib
+import importlib.util
+import itertools
 import json
 import logging
+import operator
+import os
 import re
+import sqlite3
+import sys
+import tempfile
+import threading
 import uuid
-import webbrowser
+from collections import defaultdict
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 import click
-import humanize
-import questionary
-from questionary import Style as QStyle
-from rich.columns import Columns
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
-from rich.rule import Rule
-from rich.table import Table
-from rich.tree import Tree
+from rich.text import Text
 
 from . import __version__, db, msauth
 from .classifier import ClassificationEngine, get_learner
 from .classifier.ai import test_ai_connection
+from .completions import SHELLS, completion_script
 from .config import (
     CONSENT_REVOKED,
     CURRENT_MAILBOX_MUTATION_CONSENT_VERSION,
@@ -61,42 +69,191 @@ from .unsubscriber import (
 logger = logging.getLogger(__name__)
 
 
+def _lazy_import(name: str) -> ModuleType:
+    """Return a module whose code only runs on first attribute access.
+
+    questionary alone (via prompt_toolkit) is a large share of CLI start-up,
+    and most commands never prompt, so it is only loaded when one does.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+questionary = _lazy_import("questionary")
+webbrowser = _lazy_import("webbrowser")
+
+
 # Questionary style — orange1 highlight matching our logo color
-Q_STYLE = QStyle(
-    [
-        ("highlighted", "fg:#ffaf00"),
-        ("pointer", "fg:#ffaf00"),
-        ("selected", "fg:#ffaf00"),
-        ("qmark", "fg:#ffaf00"),
-        ("answer", "fg:#ffaf00"),
-    ]
-)
+Q_STYLE_RULES = [
+    ("highlighted", "fg:#ffaf00"),
+    ("pointer", "fg:#ffaf00"),
+    ("selected", "fg:#ffaf00"),
+    ("qmark", "fg:#ffaf00"),
+    ("answer", "fg:#ffaf00"),
+]
 Q_POINTER = "›"
-Q_COMMON: dict[str, Any] = {
-    "instruction": " ",
-    "style": Q_STYLE,
-    "pointer": Q_POINTER,
-    "qmark": "",
-}
 
 # Style for text/password prompts — label goes in qmark for column-0 alignment
-Q_INPUT_STYLE = QStyle(
-    [
-        ("qmark", "bold fg:#a0a0a0"),  # match header style
-        ("answer", "fg:#ffaf00"),
-        ("text", "fg:#ffaf00"),
-    ]
+Q_INPUT_STYLE_RULES = [
+    ("qmark", "bold fg:#a0a0a0"),  # match header style
+    ("answer", "fg:#ffaf00"),
+    ("text", "fg:#ffaf00"),
+]
+
+
+# (label, value) pairs for fixed selectors; questionary.Choice objects are
+# only built from them when a prompt is shown (see _choices).
+_YES_NO_CHOICES = (("Yes", "yes"), ("No", "no"))
+_REVIEW_CHOICES = (
+    ("Unsubscribe - Stop receiving emails", "unsub"),
+    ("Keep - Continue receiving", "keep"),
+    ("Block - Block sender entirely", "block"),
+    ("Skip - Decide later", "skip"),
+)
+_MANUAL_SUBSCRIPTION_CHOICES = (
+    ("Keep future mail", "keep"),
+    ("Block future mail / move to Junk", "block"),
+    ("Skip", "skip"),
+)
+_SCAN_UNSUB_REVIEW_CHOICES = (
+    ("Unsubscribe (AI recommendation)", "unsub"),
+    ("Keep instead", "keep"),
+    ("Skip for now", "skip"),
+)
+_SCAN_KEEP_REVIEW_CHOICES = (
+    ("Keep (AI recommendation)", "keep"),
+    ("Unsubscribe instead", "unsub"),
+    ("Skip for now", "skip"),
 )
+_WELCOME_CHOICES_UNCONFIGURED = (
+    ("Set up email accounts and API key", "init"),
+    ("View all commands", "help"),
+    ("Exit", "exit"),
+)
+_WELCOME_CHOICES_CONFIGURED = (
+    ("Scan inbox and unsubscribe", "run"),
+    ("Show current stats", "status"),
+    ("Review pending decisions", "review"),
+    ("List all tracked senders", "senders"),
+    ("View all commands", "help"),
+    ("Exit", "exit"),
+)
+
+
+def _choices(pairs: tuple[tuple[str, Any], ...]) -> list[Any]:
+    """Build questionary choices from (label, value) pairs (loads questionary)."""
+    return [questionary.Choice(label, value=value) for label, value in pairs]
+
+
+def _q_style() -> Any:
+    """Build the select/confirm prompt style (loads questionary)."""
+    return questionary.Style(Q_STYLE_RULES)
+
+
+def _q_input_style() -> Any:
+    """Build the text/password prompt style (loads questionary)."""
+    return questionary.Style(Q_INPUT_STYLE_RULES)
+
+
+def _q_common() -> dict[str, Any]:
+    """Keyword arguments shared by every styled questionary.select."""
+    return {
+        "instruction": " ",
+        "style": _q_style(),
+        "pointer": Q_POINTER,
+        "qmark": "",
+    }
+
 
 # Vertical line prefix for indented content under section headers
 _L = "[muted]│[/muted]"
 
+# Account connection tests that may run at once during `nothx init`
+ACCOUNT_TEST_WORKERS = 4
+
+# Unsubscribe requests that may be in flight at once during `nothx run`
+UNSUBSCRIBE_WORKERS = 8
+
+# `nothx search news*` is a prefix search, answered by a range scan on domain
+_PREFIX_PATTERN = re.compile(r"([A-Za-z0-9.-]*)\*")
+
+# Matches shown by a prefix search, which lists domains alphabetically
+SEARCH_PREFIX_LIMIT = 200
+
+# Theme style for each sender status in listings
+SENDER_STATUS_STYLES = {
+    "unsubscribed": "unsubscribe",
+    "keep": "keep",
+    "blocked": "block",
+    "unknown": "review",
+}
+
+# Rows shown by the `nothx senders` table
+SENDERS_DISPLAY_LIMIT = 50
+
+# Write buffer for `nothx export`, so large exports flush in few syscalls
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Last db.get_stats() snapshot, kept next to the database for the welcome screen
+STATS_CACHE_FILENAME = ".stats_cache.json"
+
+
+def _naturaltime(value: datetime) -> str:
+    """Relative time such as "3 hours ago".
+
+    humanize loads locale data on import, so it is only imported once a
+    timestamp actually needs formatting.
+    """
+    import humanize
+
+    return humanize.naturaltime(value)
+
+
+def _last_seen_formatter() -> Callable[[str], str]:
+    """Build a memoized formatter for the last_seen column of one listing.
+
+    Senders found in the same scan share a timestamp, so each distinct value
+    is parsed and humanized once. Unparseable values show their date part.
+    """
+
+    @lru_cache(maxsize=4096)
+    def format_last_seen(last_seen: str) -> str:
+        if not last_seen:
+            return ""
+        try:
+            return _naturaltime(datetime.fromisoformat(last_seen))
+        except (ValueError, TypeError):
+            return last_seen[:10]
+
+    return format_last_seen
+
+
+def _dump_json(obj: Any) -> str:
+    """Serialize ``--json`` output, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2, default=str)
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+
 
 def _key(k: str) -> str:
     """Render a single keycap with rounded pill shape using half-block edges."""
     return f"[#505050]▐[/][#808080 on #505050] {k} [/][#505050]▌[/]"
 
 
+# Navigation hint shown beside the first select header of a session
+_KEY_HINTS = f"{_key('↑')} {_key('↓')} [dim]navigate[/dim]  {_key('⏎')} [dim]select[/dim]"
+
 _key_hints_shown = False
 
 
@@ -106,18 +263,19 @@ def _styled_select(choices: list, **kwargs) -> str | None:
         "",
         choices=choices,
         instruction=" ",
-        style=Q_STYLE,
+        style=_q_style(),
         qmark="",
         pointer=Q_POINTER,
         **kwargs,
     ).ask()
     if result is not None:
         # Find display label from Choice objects or plain strings
-        label = str(result)
-        for c in choices:
-            if isinstance(c, questionary.Choice) and c.value == result:
-                label = str(c.title) if c.title is not None else label
-                break
+        label_by_value = {
+            c.value: str(c.title)
+            for c in choices
+            if isinstance(c, questionary.Choice) and c.title is not None
+        }
+        label = label_by_value.get(result, str(result))
         # Overwrite questionary's answer line with styled ✓ version
         # The \n ensures 1 blank line between the preceding header and ✓,
         # matching the gap questionary's blank prompt provided during browsing.
@@ -132,11 +290,7 @@ def _select_header(label: str) -> None:
     global _key_hints_shown
     if not _key_hints_shown:
         _key_hints_shown = True
-        console.print(
-            f"\n\n[header]{label}[/header]    "
-            f"{_key('↑')} {_key('↓')} [dim]navigate[/dim]  "
-            f"{_key('⏎')} [dim]select[/dim]"
-        )
+        console.print(f"\n\n[header]{label}[/header]    {_KEY_HINTS}")
     else:
         console.print(f"\n[header]{label}[/header]")
 
@@ -144,11 +298,7 @@ def _select_header(label: str) -> None:
 def _styled_confirm(message: str, default: bool = True) -> bool:
     """Styled yes/no selector matching the overall UI style."""
     console.print(f"\n[header]{message}[/header]")
-    choices = [
-        questionary.Choice("Yes", value="yes"),
-        questionary.Choice("No", value="no"),
-    ]
-    result = _styled_select(choices)
+    result = _styled_select(_choices(_YES_NO_CHOICES))
     return result == "yes"
 
 
@@ -1206,8 +1356,7 @@ def _change_sender_status(
         db.update_sender_status(domain, sender_status)
         console.print(f"{_L} [block]→ Blocked[/block] ({moved} moved, {failed} partial/failed)")
     else:
-        db.set_user_override(domain, new_status)
-        db.update_sender_status(domain, sender_status)
+        db.set_user_decision(domain, new_status, sender_status)
         console.print(f"{_L} [{style}]→ {label}[/{style}]")
 
     # Build AI recommendation from sender data
@@ -1240,43 +1389,49 @@ def _change_sender_status(
 
     learner = get_learner()
     learner.update_from_action(action_record)
+    _invalidate_stats_cache()
 
     return status_changed
 
 
 # Simple email validation regex
-EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+EMAIL_REGEX = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", re.ASCII)
 
 
 def _is_valid_email(email: str) -> bool:
     """Validate email address format."""
-    if not email:
+    if not email or "@" not in email:
         return False
-    return bool(EMAIL_REGEX.match(email.strip()))
+    return EMAIL_REGEX.fullmatch(email.strip()) is not None
+
+
+def _guide_text(*lines: str) -> str:
+    """Compose guide lines into one markup string, guttering indented steps."""
+    return "\n".join(f"{_L}{line[1:]}" if line.startswith("  ") else line for line in lines)
 
 
 # Provider-specific app password instructions
-APP_PASSWORD_INSTRUCTIONS: dict[str, tuple[str, ...]] = {
-    "gmail": (
+APP_PASSWORD_INSTRUCTIONS: dict[str, str] = {
+    "gmail": _guide_text(
         "[warning]For Gmail, you need an App Password:[/warning]",
         "  1. Go to [link=https://myaccount.google.com/apppasswords]myaccount.google.com/apppasswords[/link]",
         "  2. Generate a new password for 'nothx'",
         "  3. Copy the 16-character code\n",
     ),
-    "outlook": (
+    "outlook": _guide_text(
         "[warning]For Outlook/Live/Hotmail, you need an App Password:[/warning]",
         "  1. Go to [link=https://account.live.com/proofs/AppPassword]account.live.com/proofs/AppPassword[/link]",
         "  2. You may need to enable 2FA first at [link=https://account.microsoft.com/security]account.microsoft.com/security[/link]",
         "  3. Generate a new app password and copy it\n",
     ),
-    "yahoo": (
+    "yahoo": _guide_text(
         "[warning]For Yahoo Mail, you need an App Password:[/warning]",
         "  1. Go to [link=https://login.yahoo.com/account/security]login.yahoo.com/account/security[/link]",
         "  2. Enable 2-Step Verification if not already enabled",
         "  3. Click 'Generate app password' and select 'Other App'",
         "  4. Copy the generated password\n",
     ),
-    "icloud": (
+    "icloud": _guide_text(
         "[warning]For iCloud Mail, you need an App-Specific Password:[/warning]",
         "  1. Go to [link=https://appleid.apple.com/account/manage]appleid.apple.com[/link]",
         "  2. Sign in and go to 'Sign-In and Security' > 'App-Specific Passwords'",
@@ -1286,22 +1441,22 @@ APP_PASSWORD_INSTRUCTIONS: dict[str, tuple[str, ...]] = {
 }
 
 # Provider-specific API key setup instructions
-API_KEY_INSTRUCTIONS: dict[str, tuple[str, ...]] = {
-    "anthropic": (
+API_KEY_INSTRUCTIONS: dict[str, str] = {
+    "anthropic": _guide_text(
         "[warning]To get your Anthropic API key:[/warning]",
         "  1. Go to [link=https://console.anthropic.com]console.anthropic.com[/link]",
         "  2. Sign in or create an account",
         "  3. Go to 'Settings' > 'API Keys'",
         "  4. Click 'Create Key' and copy it\n",
     ),
-    "openai": (
+    "openai": _guide_text(
         "[warning]To get your OpenAI API key:[/warning]",
         "  1. Go to [link=https://platform.openai.com/api-keys]platform.openai.com/api-keys[/link]",
         "  2. Sign in or create an account",
         "  3. Click 'Create new secret key'",
         "  4. Copy the key (it won't be shown again)\n",
     ),
-    "gemini": (
+    "gemini": _guide_text(
         "[warning]To get your Google AI API key:[/warning]",
         "  1. Go to [link=https://aistudio.google.com/apikey]aistudio.google.com/apikey[/link]",
         "  2. Sign in with your Google account",
@@ -1311,28 +1466,30 @@ API_KEY_INSTRUCTIONS: dict[str, tuple[str, ...]] = {
 }
 
 # Provider-specific troubleshooting tips
-TROUBLESHOOTING_TIPS: dict[str, tuple[str, ...]] = {
-    "gmail": (
+TROUBLESHOOTING_TIPS: dict[str, str] = {
+    "gmail": _guide_text(
         "  • Verify your app password at [link=https://myaccount.google.com/apppasswords]myaccount.google.com/apppasswords[/link]",
     ),
-    "outlook": (
+    "outlook": _guide_text(
         "  • Verify your app password at [link=https://account.live.com/proofs/AppPassword]account.live.com/proofs/AppPassword[/link]",
     ),
-    "yahoo": (
+    "yahoo": _guide_text(
         "  • Verify your app password at [link=https://login.yahoo.com/account/security]login.yahoo.com/account/security[/link]",
         "  • Make sure 2-Step Verification is enabled",
     ),
-    "icloud": (
+    "icloud": _guide_text(
         "  • Verify your app password at [link=https://appleid.apple.com/account/manage]appleid.apple.com[/link]",
         "  • Go to 'Sign-In and Security' > 'App-Specific Passwords'",
     ),
 }
 
 
+@lru_cache(maxsize=1)
 def _get_greeting() -> str:
-    """Get time-based greeting with user's first name if available."""
-    import os as _os
+    """Get time-based greeting with user's first name if available.
 
+    Computed once per process so the welcome screen and ``init`` agree.
+    """
     hour = datetime.now().hour
     if 5 <= hour < 12:
         emoji, greeting = "☀️", "Good morning"
@@ -1343,21 +1500,88 @@ def _get_greeting() -> str:
     else:
         emoji, greeting = "🌙", "Hey there"
 
-    name = None
-    for var in ("USER", "USERNAME", "LOGNAME"):
-        if username := _os.environ.get(var):
-            name = username.split(".")[0].capitalize()
-            break
-
-    if name:
-        return f"{emoji} {greeting}, {name}!"
+    username = os.environ.get("USER") or os.environ.get("USERNAME") or os.environ.get("LOGNAME")
+    if username:
+        return f"{emoji} {greeting}, {username.split('.')[0].capitalize()}!"
     return f"{emoji} {greeting}!"
 
 
+# Serializes snapshot writes with invalidation, so a background refresh that
+# queried before a change can never land after the change dropped the snapshot
+_stats_cache_lock = threading.Lock()
+
+
+def _stats_cache_path(db_path: Path) -> Path:
+    """Path of the stats snapshot belonging to the database at ``db_path``."""
+    return db_path.with_name(STATS_CACHE_FILENAME)
+
+
+def _refresh_stats_cache(db_path: Path) -> dict:
+    """Query fresh stats and rewrite the snapshot for ``db_path``."""
+    cache_path = _stats_cache_path(db_path)
+    tmp_path: str | None = None
+    with _stats_cache_lock:
+        stats = db.get_stats()
+        try:
+            # A private temporary file per writer, so concurrent refreshes from
+            # several processes never interleave before the atomic rename
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_path.parent, prefix=".stats-", suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_path = tmp.name
+                tmp.write(json.dumps(stats))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug("Could not write stats cache %s: %s", cache_path, e)
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+    return stats
+
+
+def _invalidate_stats_cache() -> None:
+    """Drop the stats snapshot after a change to the figures it holds."""
+    cache_path = _stats_cache_path(db.get_db_path())
+    with _stats_cache_lock:
+        try:
+            cache_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug("Could not remove stats cache %s: %s", cache_path, e)
+
+
+def _refresh_stats_cache_quietly(db_path: Path) -> None:
+    """Refresh the stats snapshot, logging instead of raising on failure."""
+    # From a background thread the database may have been switched since the
+    # thread started; a snapshot of another database would be wrong.
+    if db.get_db_path() != db_path:
+        return
+    try:
+        _refresh_stats_cache(db_path)
+    except (sqlite3.Error, OSError) as e:
+        logger.debug("Background stats refresh failed: %s", e)
+
+
+def _cached_stats() -> dict:
+    """Stats for the welcome screen, served stale-while-revalidate.
+
+    The previous snapshot is returned immediately and refreshed by a daemon
+    thread for next time; only a missing or unreadable snapshot blocks on
+    SQLite. A fresh install has no database and therefore no stats.
+    """
+    db_path = db.get_db_path()
+    if not db_path.exists():
+        return {}
+    try:
+        cached = json.loads(_stats_cache_path(db_path).read_text())
+    except (OSError, ValueError):
+        cached = None
+    if not isinstance(cached, dict):
+        return _refresh_stats_cache(db_path)
+    threading.Thread(target=_refresh_stats_cache_quietly, args=(db_path,), daemon=True).start()
+    return cached
+
+
 def _build_version_line(config: Config) -> str:
     """Build the version + status string for display."""
-    import sqlite3
-
     status_parts = [f"v{__version__}"]
 
     account_count = len(config.accounts)
@@ -1366,13 +1590,13 @@ def _build_version_line(config: Config) -> str:
     else:
         status_parts.append("not configured")
 
+    # Read-only: no schema check here, and stats come from the cached snapshot
     try:
-        db.init_db()
-        stats = db.get_stats()
+        stats = _cached_stats()
         if stats.get("last_run"):
             try:
                 last_run = datetime.fromisoformat(stats["last_run"])
-                status_parts.append(f"last scan {humanize.naturaltime(last_run)}")
+                status_parts.append(f"last scan {_naturaltime(last_run)}")
             except (ValueError, TypeError):
                 pass
         if stats.get("pending_review", 0) > 0:
@@ -1385,8 +1609,6 @@ def _build_version_line(config: Config) -> str:
 
 def _get_previous_run_summary_text() -> str | None:
     """Get brief summary text from the last run, or None."""
-    import sqlite3
-
     try:
         activity = db.get_activity_log(limit=1)
         if activity and activity[0].get("type") == "run":
@@ -1394,7 +1616,7 @@ def _get_previous_run_summary_text() -> str | None:
             timestamp = r.get("timestamp", "")
             try:
                 ts_dt = datetime.fromisoformat(timestamp)
-                time_ago = humanize.naturaltime(ts_dt)
+                time_ago = _naturaltime(ts_dt)
             except (ValueError, TypeError):
                 time_ago = "recently"
 
@@ -1406,6 +1628,11 @@ def _get_previous_run_summary_text() -> str | None:
     return None
 
 
+def _is_interactive() -> bool:
+    """Whether both stdin and stdout are attached to a terminal."""
+    return sys.stdin.isatty() and sys.stdout.isatty()
+
+
 def _show_welcome_screen() -> None:
     """Show welcome screen with gradient panel and interactive command selector."""
     config = Config.load()
@@ -1417,23 +1644,9 @@ def _show_welcome_screen() -> None:
 
     _select_header("Get started")
 
-    if not config.accounts:
-        choices = [
-            questionary.Choice("Set up email accounts and API key", value="init"),
-            questionary.Choice("View all commands", value="help"),
-            questionary.Choice("Exit", value="exit"),
-        ]
-    else:
-        choices = [
-            questionary.Choice("Scan inbox and unsubscribe", value="run"),
-            questionary.Choice("Show current stats", value="status"),
-            questionary.Choice("Review pending decisions", value="review"),
-            questionary.Choice("List all tracked senders", value="senders"),
-            questionary.Choice("View all commands", value="help"),
-            questionary.Choice("Exit", value="exit"),
-        ]
-
-    selected = _styled_select(choices)
+    selected = _styled_select(
+        _choices(_WELCOME_CHOICES_CONFIGURED if config.accounts else _WELCOME_CHOICES_UNCONFIGURED)
+    )
 
     if selected is None or selected == "exit":
         console.print()
@@ -1475,6 +1688,9 @@ def _show_welcome_screen() -> None:
 
 def _show_learning_status(config: Config) -> None:
     """Show learning system status and insights."""
+    from rich.rule import Rule
+    from rich.tree import Tree
+
     learner = get_learner()
     summary = learner.get_learning_summary()
 
@@ -1552,11 +1768,22 @@ def main(ctx):
     """
     ctx.ensure_object(dict)
     if ctx.invoked_subcommand is None:
-        _show_welcome_screen()
+        if _is_interactive():
+            _show_welcome_screen()
+        else:
+            # Pipes and scripts cannot answer the menu; skip loading the
+            # config and prompt stack and print the command list instead.
+            click.echo(ctx.get_help())
 
 
-def _add_email_account(config: Config) -> tuple[str, AccountConfig] | None:
-    """Interactive flow to add an email account. Returns (name, account) or None if cancelled."""
+def _add_email_account(
+    config: Config, test_connection: bool = True
+) -> tuple[str, AccountConfig] | None:
+    """Interactive flow to add an email account. Returns (name, account) or None if cancelled.
+
+    With ``test_connection=False`` the account is returned untested so the
+    caller can run the test in the background (see ``init``).
+    """
     # Email provider selection
     _select_header("Select your email provider")
     provider_choices = [
@@ -1574,7 +1801,7 @@ def _add_email_account(config: Config) -> tuple[str, AccountConfig] | None:
 
     # Email address with validation
     while True:
-        email = questionary.text("", qmark="Email address:", style=Q_INPUT_STYLE).ask()
+        email = questionary.text("", qmark="Email address:", style=_q_input_style()).ask()
         if not email:
             return None
         if _is_valid_email(email):
@@ -1598,7 +1825,7 @@ def _add_email_account(config: Config) -> tuple[str, AccountConfig] | None:
             client_id = questionary.text(
                 "",
                 qmark="Microsoft public-client application ID:",
-                style=Q_INPUT_STYLE,
+                style=_q_input_style(),
             ).ask()
             if not client_id or not client_id.strip():
                 console.print("[warning]A Microsoft application client ID is required.[/warning]")
@@ -1636,13 +1863,8 @@ def _add_email_account(config: Config) -> tuple[str, AccountConfig] | None:
                 auth="oauth",
                 client_id=client_id.strip(),
             )
-            with console.status("Testing connection...", spinner_style="#ffaf00"):
-                success, msg = test_account(account)
-            if not success:
-                msauth.delete_token(email)
-                console.print(f"[error]Connection failed: {msg}[/error]")
+            if test_connection and not _test_account_connection(account):
                 return None
-            console.print("[success]✓ Connected with Microsoft OAuth![/success]\n")
             return _unique_account_name(config, email), account
 
         console.print(
@@ -1653,27 +1875,42 @@ def _add_email_account(config: Config) -> tuple[str, AccountConfig] | None:
     # App password instructions
     if instructions := APP_PASSWORD_INSTRUCTIONS.get(provider):
         console.print()
-        for line in instructions:
-            console.print(f"{_L}{line[1:]}" if line.startswith("  ") else line)
+        console.print(instructions)
     else:
         console.print("\n[warning]Enter your email password or app password.[/warning]\n")
 
-    password = questionary.password("", qmark="App Password:", style=Q_INPUT_STYLE).ask()
+    password = questionary.password("", qmark="App Password:", style=_q_input_style()).ask()
     if not password:
         return None
 
     # Test connection
     account = AccountConfig(provider=provider, email=email, password=password)
+    if test_connection and not _test_account_connection(account):
+        return None
+
+    return _unique_account_name(config, email), account
+
+
+def _test_account_connection(account: AccountConfig) -> bool:
+    """Test an account's IMAP login with a spinner and report the outcome."""
     with console.status("Testing connection...", spinner_style="#ffaf00"):
         success, msg = test_account(account)
+    return _report_connection_result(account, success, msg)
 
-    if not success:
-        console.print(f"[error]Connection failed: {msg}[/error]")
-        return None
 
-    console.print("[success]✓ Connected![/success]\n")
+def _report_connection_result(account: AccountConfig, success: bool, msg: str) -> bool:
+    """Print a connection test outcome, discarding OAuth tokens on failure."""
+    if not success:
+        if account.uses_oauth:
+            msauth.delete_token(account.email)
+        console.print(f"[error]Connection failed for {account.email}: {msg}[/error]")
+        return False
 
-    return _unique_account_name(config, email), account
+    if account.uses_oauth:
+        console.print("[success]✓ Connected with Microsoft OAuth![/success]\n")
+    else:
+        console.print("[success]✓ Connected![/success]\n")
+    return True
 
 
 def _unique_account_name(config: Config, email: str) -> str:
@@ -1689,6 +1926,102 @@ def _unique_account_name(config: Config, email: str) -> str:
     return account_name
 
 
+def _setup_no_ai(config: Config, provider: str) -> None:
+    """Configure heuristics-only classification."""
+    config.ai.enabled = False
+    console.print("Running in heuristics-only mode.\n")
+
+
+def _setup_ollama(config: Config, provider: str) -> None:
+    """Ask for the Ollama URL and model, then test the connection."""
+    config.ai.enabled = True
+    config.ai.api_key = None
+
+    # Ask for Ollama URL
+    console.print()  # Gap after selection
+    api_base = questionary.text(
+        "",
+        default="http://localhost:11434",
+        qmark="Ollama URL:",
+        style=_q_input_style(),
+    ).ask()
+    config.ai.api_base = api_base
+
+    # Ask for model
+    from .classifier.providers.ollama_provider import OllamaProvider
+
+    ollama = OllamaProvider(api_base=api_base)
+    available_models = ollama.get_model_options()
+
+    if available_models:
+        _select_header("Select model")
+        model = _styled_select(available_models, default=available_models[0])
+        if model is not None:
+            config.ai.model = model
+    else:
+        config.ai.model = "llama3.2"
+        console.print("[warning]Could not fetch models. Using default: llama3.2[/warning]")
+
+    with console.status("Testing Ollama connection...", spinner_style="#ffaf00"):
+        success, msg = test_ai_connection(config)
+
+    if success:
+        console.print("[success]✓ Ollama working![/success]\n")
+    else:
+        console.print(f"[warning]Ollama test failed: {msg}[/warning]")
+        console.print("Continuing with heuristics-only mode.\n")
+        config.ai.enabled = False
+
+
+def _setup_cloud_ai(config: Config, provider: str) -> None:
+    """Ask for a cloud provider's API key, then test the connection."""
+    from .classifier.providers import SUPPORTED_PROVIDERS, get_provider
+
+    provider_info = SUPPORTED_PROVIDERS[provider]
+    config.ai.api_base = None  # Clear any stale Ollama URL
+
+    if instructions := API_KEY_INSTRUCTIONS.get(provider):
+        console.print()
+        console.print(instructions)
+
+    api_key = questionary.text(
+        "",
+        qmark=f"{provider_info['name']} API key (leave empty to skip):",
+        style=_q_input_style(),
+    ).ask()
+
+    if api_key and api_key.strip():
+        config.ai.api_key = api_key.strip()
+        config.ai.enabled = True
+
+        # Set default model for provider
+        temp_provider = get_provider(provider, api_key=config.ai.api_key)
+        if temp_provider:
+            config.ai.model = temp_provider.default_model
+
+        with console.status(
+            f"Testing {provider_info['name']} connection...", spinner_style="#ffaf00"
+        ):
+            success, msg = test_ai_connection(config)
+
+        if success:
+            console.print(f"[success]✓ {provider_info['name']} working![/success]\n")
+        else:
+            console.print(f"[warning]AI test failed: {msg}[/warning]")
+            console.print("Continuing with heuristics-only mode.\n")
+            config.ai.enabled = False
+    else:
+        config.ai.enabled = False
+        console.print("Running in heuristics-only mode.\n")
+
+
+# AI setup step for each provider choice in init; cloud providers share one
+_AI_SETUP: dict[str, Callable[[Config, str], None]] = {
+    "none": _setup_no_ai,
+    "ollama": _setup_ollama,
+}
+
+
 @main.command()
 @click.pass_context
 def init(ctx):
@@ -1700,29 +2033,51 @@ def init(ctx):
         version_line = _build_version_line(config)
         print_animated_welcome(greeting, version_line)
 
-    # Multi-account loop
-    account_count = 0
-    while True:
-        result = _add_email_account(config)
-        if result is None:
-            if account_count == 0:
-                console.print(
-                    "[warning]No accounts configured. Run 'nothx init' to try again.[/warning]"
-                )
-                return
-            break
+    # Multi-account loop. Each connection test starts in the background as
+    # soon as its credentials are entered, so it overlaps with the user
+    # entering the next account instead of blocking the prompt.
+    pending: list[tuple[str, AccountConfig, Future[tuple[bool, str]]]] = []
+    with ThreadPoolExecutor(max_workers=ACCOUNT_TEST_WORKERS) as executor:
+        while True:
+            result = _add_email_account(config, test_connection=False)
+            if result is None:
+                break
+
+            account_name, account = result
+            # Reserve the name so the next account gets a distinct one
+            config.accounts[account_name] = account
+            pending.append((account_name, account, executor.submit(test_account, account)))
+
+            # Ask to add another
+            if not _styled_confirm("Add another email account?", default=False):
+                break
+
+        # Report failures the moment they arrive rather than after the
+        # slowest test; successful accounts are then added in entry order.
+        connected: set[str] = set()
+        with console.status("Testing connection...", spinner_style="#ffaf00"):
+            names_by_future = {future: name for name, _, future in pending}
+            for future in as_completed(names_by_future):
+                account_name = names_by_future[future]
+                success, msg = future.result()
+                if success:
+                    connected.add(account_name)
+                else:
+                    _report_connection_result(config.accounts.pop(account_name), success, msg)
 
-        account_name, account = result
-        config.accounts[account_name] = account
+    account_count = 0
+    for account_name, account, _ in pending:
+        if account_name not in connected:
+            continue
+        _report_connection_result(account, True, "")
         if config.default_account is None:
             config.default_account = account_name
         account_count += 1
-
         console.print(f"[success]✓ Added account: {account.email}[/success]")
 
-        # Ask to add another
-        if not _styled_confirm("Add another email account?", default=False):
-            break
+    if account_count == 0:
+        console.print("[warning]No accounts configured. Run 'nothx init' to try again.[/warning]")
+        return
 
     # AI Provider setup
     console.print("\n[header]AI Classification Setup[/header]")
@@ -1749,89 +2104,7 @@ def init(ctx):
 
     config.ai.provider = provider
 
-    if provider == "none":
-        config.ai.enabled = False
-        console.print("Running in heuristics-only mode.\n")
-    elif provider == "ollama":
-        config.ai.enabled = True
-        config.ai.api_key = None
-
-        # Ask for Ollama URL
-        console.print()  # Gap after selection
-        api_base = questionary.text(
-            "",
-            default="http://localhost:11434",
-            qmark="Ollama URL:",
-            style=Q_INPUT_STYLE,
-        ).ask()
-        config.ai.api_base = api_base
-
-        # Ask for model
-        from .classifier.providers.ollama_provider import OllamaProvider
-
-        ollama = OllamaProvider(api_base=api_base)
-        available_models = ollama.get_model_options()
-
-        if available_models:
-            _select_header("Select model")
-            model = _styled_select(available_models, default=available_models[0])
-            if model is not None:
-                config.ai.model = model
-        else:
-            config.ai.model = "llama3.2"
-            console.print("[warning]Could not fetch models. Using default: llama3.2[/warning]")
-
-        with console.status("Testing Ollama connection...", spinner_style="#ffaf00"):
-            success, msg = test_ai_connection(config)
-
-        if success:
-            console.print("[success]✓ Ollama working![/success]\n")
-        else:
-            console.print(f"[warning]Ollama test failed: {msg}[/warning]")
-            console.print("Continuing with heuristics-only mode.\n")
-            config.ai.enabled = False
-    else:
-        # Cloud provider - needs API key
-        provider_info = SUPPORTED_PROVIDERS[provider]
-        config.ai.api_base = None  # Clear any stale Ollama URL
-
-        if provider in API_KEY_INSTRUCTIONS:
-            instructions = API_KEY_INSTRUCTIONS[provider]
-            console.print()
-            for line in instructions:
-                console.print(f"{_L}{line[1:]}" if line.startswith("  ") else line)
-
-        api_key = questionary.text(
-            "",
-            qmark=f"{provider_info['name']} API key (leave empty to skip):",
-            style=Q_INPUT_STYLE,
-        ).ask()
-
-        if api_key and api_key.strip():
-            config.ai.api_key = api_key.strip()
-            config.ai.enabled = True
-
-            # Set default model for provider
-            from .classifier.providers import get_provider
-
-            temp_provider = get_provider(provider, api_key=config.ai.api_key)
-            if temp_provider:
-                config.ai.model = temp_provider.default_model
-
-            with console.status(
-                f"Testing {provider_info['name']} connection...", spinner_style="#ffaf00"
-            ):
-                success, msg = test_ai_connection(config)
-
-            if success:
-                console.print(f"[success]✓ {provider_info['name']} working![/success]\n")
-            else:
-                console.print(f"[warning]AI test failed: {msg}[/warning]")
-                console.print("Continuing with heuristics-only mode.\n")
-                config.ai.enabled = False
-        else:
-            config.ai.enabled = False
-            console.print("Running in heuristics-only mode.\n")
+    _AI_SETUP.get(provider, _setup_cloud_ai)(config, provider)
 
     # Initialize database
     db.init_db()
@@ -1922,6 +2195,8 @@ def account_add():
 @account.command("list")
 def account_list():
     """List configured email accounts."""
+    from rich.table import Table
+
     config = Config.load()
 
     if not config.accounts:
@@ -1939,7 +2214,7 @@ def account_list():
 
     for name, acc in config.accounts.items():
         is_default = "✓" if name == config.default_account else ""
-        table.add_row(name, acc.email, acc.provider, acc.auth, is_default)
+        table.add_row(*map(Text, (name, acc.email, acc.provider, acc.auth, is_default)))
 
     console.print(table)
 
@@ -1981,7 +2256,7 @@ def account_remove():
     # Update default if needed
     if config.default_account == account_name:
         if config.accounts:
-            config.default_account = next(iter(config.accounts.keys()))
+            config.default_account = next(iter(config.accounts))
         else:
             config.default_account = None
 
@@ -2029,15 +2304,20 @@ def run(
     # Validate accounts if specified
     accounts_to_scan: list[str] | None = None
     if account:
-        # Build email-to-name map for efficient lookup
-        email_to_name = {acc_config.email: name for name, acc_config in config.accounts.items()}
+        # Email-to-name map, built on the first value that isn't an account name
+        email_to_name: dict[str, str] | None = None
 
         accounts_to_scan = []
         for acc in account:
             # Support both account name and email address
             if acc in config.accounts:
                 accounts_to_scan.append(acc)
-            elif acc in email_to_name:
+                continue
+            if email_to_name is None:
+                email_to_name = {
+                    acc_config.email: name for name, acc_config in config.accounts.items()
+                }
+            if acc in email_to_name:
                 accounts_to_scan.append(email_to_name[acc])
             else:
                 console.print(f"[error]Account '{acc}' not found.[/error]")
@@ -2065,6 +2345,20 @@ def run(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class _UnsubJob:
+    """One unsubscribe request handed to the pool in `_run_scan`."""
+
+    sender: SenderStats
+    headers: list[EmailHeader]
+    classification: Classification
+    kwargs: dict[str, Any]  # Extra unsubscribe_subscription arguments
+    # The last three are None for legacy (ungrouped) scan results
+    retry_generation: int | None = None
+    claimed_operation: dict[str, Any] | None = None
+    claim_owner: str | None = None
+
+
 def _run_scan(
     config: Config,
     verbose: bool = False,
@@ -2075,6 +2369,9 @@ def _run_scan(
     rescan: bool = False,
 ):
     """Run the main scan and classification process."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+    from rich.tree import Tree
+
     stats = RunStats(
         ran_at=datetime.now(),
         mode="auto" if auto else "interactive",
@@ -2091,6 +2388,11 @@ def _run_scan(
         label = f"({account_count} account{'s' if account_count != 1 else ''})"
     console.print(f"\n[header]Step 1/3: Scanning inbox {label}[/header]")
 
+    engine = ClassificationEngine(config)
+    if not dry_run:
+        # Connect to the AI provider while the inbox scan runs
+        engine.ai.start_warmup()
+
     with Progress(
         SpinnerColumn(style="#ffaf00"),
         TextColumn("[progress.description]{task.description}"),
@@ -2131,8 +2433,9 @@ def _run_scan(
         sender_stats = subscription_stats if authoritative else scan_result.sender_stats
 
     if scan_errors:
-        for err in scan_errors:
-            console.print(f"[warning]! Skipped account: {err}[/warning]")
+        console.print(
+            "\n".join(f"[warning]! Skipped account: {err}[/warning]" for err in scan_errors)
+        )
 
     if not dry_run:
         verification_accounts = (
@@ -2163,7 +2466,6 @@ def _run_scan(
 
     # Phase 2: Classify senders
     console.print("\n[header]Step 2/3: Classifying senders[/header]")
-    engine = ClassificationEngine(config)
 
     with Progress(
         SpinnerColumn(style="#ffaf00"),
@@ -2174,7 +2476,11 @@ def _run_scan(
         transient=True,
     ) as progress:
         task = progress.add_task("Analyzing senders...", total=len(sender_stats))
-        classifications = engine.classify_batch(list(sender_stats.values()), persist=not dry_run)
+        classifications = engine.classify_batch(
+            sender_stats.values(),
+            persist=not dry_run,
+            on_classified=lambda _key, _classification: progress.advance(task),
+        )
         progress.update(task, completed=len(sender_stats))
 
     # Persist AI's content type and its recommended action as separate facts,
@@ -2293,11 +2599,8 @@ def _run_scan(
                         original_source=current.original_source or current.source,
                     )
 
-    # Process results
-    to_unsub = []
-    to_keep = []
-    to_review = []
-    to_block = []
+    # Process results: one pass, grouped by the action each sender ends up with
+    buckets: dict[Action, list[tuple[str, SenderStats, Classification]]] = defaultdict(list)
 
     min_emails = config.thresholds.min_emails_before_action
     deterministic_block_sources = {
@@ -2338,17 +2641,15 @@ def _run_scan(
                 sender.total_emails,
                 min_emails,
             )
-            to_review.append((key, sender, classification))
+            buckets[Action.REVIEW].append((key, sender, classification))
             continue
 
-        if classification.action == Action.UNSUB:
-            to_unsub.append((key, sender, classification))
-        elif classification.action == Action.KEEP:
-            to_keep.append((key, sender, classification))
-        elif classification.action == Action.BLOCK:
-            to_block.append((key, sender, classification))
-        else:
-            to_review.append((key, sender, classification))
+        buckets[classification.action].append((key, sender, classification))
+
+    to_unsub = buckets[Action.UNSUB]
+    to_keep = buckets[Action.KEEP]
+    to_review = buckets[Action.REVIEW]
+    to_block = buckets[Action.BLOCK]
 
     # Summary as tree
     tree = Tree("[success]✓ Classification complete[/success]")
@@ -2367,60 +2668,64 @@ def _run_scan(
             _select_header("Manual Review")
             console.print("[muted]Change any decisions you disagree with:[/muted]\n")
 
-            # Review items marked for unsubscribe
+            # Review items marked for unsubscribe. Each list is rebuilt from
+            # the answers rather than edited with list.remove, which rescans
+            # the whole list for every changed decision.
             review_cancelled = False
-            for key, sender, classification in to_unsub[:]:  # Slice to allow modification
+            reviewed: list[tuple[str, SenderStats, Classification]] = []
+            unsub_choices = _choices(_SCAN_UNSUB_REVIEW_CHOICES)
+            for index, item in enumerate(to_unsub):
+                sender = item[1]
                 action = questionary.select(
                     f"[{sender.total_emails} emails] {sender.domain}",
-                    choices=[
-                        questionary.Choice("Unsubscribe (AI recommendation)", value="unsub"),
-                        questionary.Choice("Keep instead", value="keep"),
-                        questionary.Choice("Skip for now", value="skip"),
-                    ],
+                    choices=unsub_choices,
                     default="unsub",
-                    **Q_COMMON,
+                    **_q_common(),
                 ).ask()
 
                 if action is None:
                     console.print("[muted]Review cancelled[/muted]")
                     review_cancelled = True
+                    reviewed.extend(to_unsub[index:])
                     break
 
                 if action == "keep":
-                    to_unsub.remove((key, sender, classification))
-                    to_keep.append((key, sender, classification))
+                    to_keep.append(item)
                     console.print(f"{_L} [keep]→ Changed to keep[/keep]")
                 elif action == "skip":
-                    to_unsub.remove((key, sender, classification))
-                    to_review.append((key, sender, classification))
+                    to_review.append(item)
                     console.print(f"{_L} [review]→ Moved to review[/review]")
+                else:
+                    reviewed.append(item)
+            to_unsub = reviewed
 
             # Review items marked to keep (only if not cancelled)
             if not review_cancelled:
-                for key, sender, classification in to_keep[:]:  # Slice to allow modification
+                reviewed = []
+                keep_choices = _choices(_SCAN_KEEP_REVIEW_CHOICES)
+                for index, item in enumerate(to_keep):
+                    sender = item[1]
                     action = questionary.select(
                         f"[{sender.total_emails} emails] {sender.domain}",
-                        choices=[
-                            questionary.Choice("Keep (AI recommendation)", value="keep"),
-                            questionary.Choice("Unsubscribe instead", value="unsub"),
-                            questionary.Choice("Skip for now", value="skip"),
-                        ],
+                        choices=keep_choices,
                         default="keep",
-                        **Q_COMMON,
+                        **_q_common(),
                     ).ask()
 
                     if action is None:
                         console.print("[muted]Review cancelled[/muted]")
+                        reviewed.extend(to_keep[index:])
                         break
 
                     if action == "unsub":
-                        to_keep.remove((key, sender, classification))
-                        to_unsub.append((key, sender, classification))
+                        to_unsub.append(item)
                         console.print(f"{_L} [unsubscribe]→ Changed to unsubscribe[/unsubscribe]")
                     elif action == "skip":
-                        to_keep.remove((key, sender, classification))
-                        to_review.append((key, sender, classification))
+                        to_review.append(item)
                         console.print(f"{_L} [review]→ Moved to review[/review]")
+                    else:
+                        reviewed.append(item)
+                to_keep = reviewed
 
             # Updated summary
             # Updated summary as tree
@@ -2485,6 +2790,11 @@ def _run_scan(
                     stats.failed += move_failed
                     progress.advance(task)
 
+                # Claims and other database bookkeeping run here one sender at
+                # a time; only the network requests themselves are handed to
+                # the pool below, each job carrying what is needed to record
+                # its result.
+                pending: list[_UnsubJob] = []
                 for key, sender, classification in to_unsub:
                     headers = scan_result.get_emails_for_subscription(key) if authoritative else []
                     if not headers:
@@ -2509,68 +2819,131 @@ def _run_scan(
                         progress.advance(task)
                         continue
                     account_config = _matching_account(config, headers)
+                    if not authoritative:
+                        # Legacy ScanResult compatibility for callers that
+                        # have not yet adopted subscription grouping. Use
+                        # the same grouped policy gates rather than the
+                        # legacy executor, which permits
+                        # authentication-unknown traffic.
+                        pending.append(
+                            _UnsubJob(sender, headers, classification, {"account": account_config})
+                        )
+                        continue
                     try:
-                        if authoritative:
-                            subscription, messages = _persist_subscription_records(
-                                sender, headers, classification
-                            )
-                            db.set_subscription_policy(subscription["id"], "unsub")
-                            execute, exclusions, retry_generation, escalate = (
-                                _unsubscribe_operation_plan(subscription)
+                        subscription, messages = _persist_subscription_records(
+                            sender, headers, classification
+                        )
+                    except UnsafeUnsubscribeError:
+                        logger.info("Protected subscription needs review: %s", sender.domain)
+                        stats.review_queued += 1
+                        progress.advance(task)
+                        continue
+                    db.set_subscription_policy(subscription["id"], "unsub")
+                    execute, exclusions, retry_generation, escalate = _unsubscribe_operation_plan(
+                        subscription
+                    )
+                    consent_resume = _is_unsubscribe_consent_resume(
+                        subscription,
+                        config,
+                    )
+                    if escalate:
+                        if config.permits_mailbox_mutation:
+                            moved, move_failed = _block_subscription(
+                                config, sender, headers, classification
                             )
-                            consent_resume = _is_unsubscribe_consent_resume(
-                                subscription,
-                                config,
+                            if moved or not move_failed:
+                                db.update_sender_status(sender.domain, SenderStatus.BLOCKED)
+                            stats.failed += move_failed
+                        else:
+                            console.print(
+                                f"[warning]{_subscription_label(sender)} is still "
+                                "mailing after the allowed retry and needs Junk/block "
+                                "consent.[/warning]"
                             )
-                            if escalate:
-                                if config.permits_mailbox_mutation:
-                                    moved, move_failed = _block_subscription(
-                                        config, sender, headers, classification
-                                    )
-                                    if moved or not move_failed:
-                                        db.update_sender_status(sender.domain, SenderStatus.BLOCKED)
-                                    stats.failed += move_failed
-                                else:
-                                    console.print(
-                                        f"[warning]{_subscription_label(sender)} is still "
-                                        "mailing after the allowed retry and needs Junk/block "
-                                        "consent.[/warning]"
-                                    )
-                                    stats.review_queued += 1
-                                progress.advance(task)
-                                continue
-                            if not execute:
-                                logger.info(
-                                    "Not repeating an accepted or in-grace request for %s",
-                                    sender.classification_key,
-                                )
-                                progress.advance(task)
-                                continue
-                            claim_owner = uuid.uuid4().hex
-                            claimed_operation, acquired = db.claim_unsubscribe_operation(
-                                subscription["id"],
-                                _operation_key("unsubscribe", sender, headers),
-                                claim_owner,
-                                allow_consent_resume=consent_resume,
-                                trigger_message_ref_id=(messages[0][1]["id"] if messages else None),
-                                retry_generation=retry_generation,
+                            stats.review_queued += 1
+                        progress.advance(task)
+                        continue
+                    if not execute:
+                        logger.info(
+                            "Not repeating an accepted or in-grace request for %s",
+                            sender.classification_key,
+                        )
+                        progress.advance(task)
+                        continue
+                    claim_owner = uuid.uuid4().hex
+                    claimed_operation, acquired = db.claim_unsubscribe_operation(
+                        subscription["id"],
+                        _operation_key("unsubscribe", sender, headers),
+                        claim_owner,
+                        allow_consent_resume=consent_resume,
+                        trigger_message_ref_id=(messages[0][1]["id"] if messages else None),
+                        retry_generation=retry_generation,
+                    )
+                    if not acquired:
+                        if claimed_operation.get("outcome") == "needs_user":
+                            stats.review_queued += 1
+                        logger.info(
+                            "Unsubscribe source is already claimed or completed for %s",
+                            sender.classification_key,
+                        )
+                        progress.advance(task)
+                        continue
+                    pending.append(
+                        _UnsubJob(
+                            sender,
+                            headers,
+                            classification,
+                            {"account": account_config, "exclude_fingerprints": exclusions},
+                            retry_generation,
+                            claimed_operation,
+                            claim_owner,
+                        )
+                    )
+
+                # Unsubscribe requests go to unrelated senders, so they run
+                # concurrently; the shared HTTP rate limiter in unsubscriber
+                # still bounds the overall request rate.
+                with ThreadPoolExecutor(max_workers=UNSUBSCRIBE_WORKERS) as executor:
+                    futures = {
+                        executor.submit(
+                            unsubscribe_subscription,
+                            job.headers,
+                            config,
+                            automatic=True,
+                            **job.kwargs,
+                        ): job
+                        for job in pending
+                    }
+                    for future in as_completed(futures):
+                        job = futures[future]
+                        sender, headers, classification = (
+                            job.sender,
+                            job.headers,
+                            job.classification,
+                        )
+                        retry_generation = job.retry_generation or 0
+                        try:
+                            result = future.result()
+                        except UnsafeUnsubscribeError:
+                            logger.info("Protected subscription needs review: %s", sender.domain)
+                            stats.review_queued += 1
+                            progress.advance(task)
+                            continue
+                        except Exception:
+                            # The other requests have already gone out; record
+                            # this one as failed (which also settles its claim)
+                            # and keep collecting the rest.
+                            logger.exception(
+                                "Unsubscribe request failed for %s", sender.classification_key
                             )
-                            if not acquired:
-                                if claimed_operation.get("outcome") == "needs_user":
-                                    stats.review_queued += 1
-                                logger.info(
-                                    "Unsubscribe source is already claimed or completed for %s",
-                                    sender.classification_key,
-                                )
-                                progress.advance(task)
-                                continue
-                            result = unsubscribe_subscription(
-                                headers,
-                                config,
-                                account_config,
-                                automatic=True,
-                                exclude_fingerprints=exclusions,
+                            result = UnsubResult(
+                                success=False,
+                                method=None,
+                                error="Unsubscribe request failed unexpectedly",
+                                outcome=UnsubscribeOutcome.FAILED,
+                                attempts=0,
                             )
+                        if job.claimed_operation is not None:
                             exhausted_retry = (
                                 retry_generation >= 1
                                 and result.attempts == 0
@@ -2589,8 +2962,8 @@ def _run_scan(
                                 classification,
                                 result,
                                 retry_generation=retry_generation,
-                                operation_id=claimed_operation["id"],
-                                claim_owner=claim_owner,
+                                operation_id=job.claimed_operation["id"],
+                                claim_owner=job.claim_owner,
                             )
                             if exhausted_retry:
                                 block_classification = Classification(
@@ -2619,30 +2992,13 @@ def _run_scan(
                                     stats.review_queued += 1
                                 progress.advance(task)
                                 continue
+                        if result.success:
+                            stats.auto_unsubbed += 1
+                        elif result.needs_confirmation:
+                            stats.review_queued += 1
                         else:
-                            # Legacy ScanResult compatibility for callers that
-                            # have not yet adopted subscription grouping. Use
-                            # the same grouped policy gates rather than the
-                            # legacy executor, which permits
-                            # authentication-unknown traffic.
-                            result = unsubscribe_subscription(
-                                headers,
-                                config,
-                                account_config,
-                                automatic=True,
-                            )
-                    except UnsafeUnsubscribeError:
-                        logger.info("Protected subscription needs review: %s", sender.domain)
-                        stats.review_queued += 1
+                            stats.failed += 1
                         progress.advance(task)
-                        continue
-                    if result.success:
-                        stats.auto_unsubbed += 1
-                    elif result.needs_confirmation:
-                        stats.review_queued += 1
-                    else:
-                        stats.failed += 1
-                    progress.advance(task)
 
             console.print(
                 f"\n[success]✓ {stats.auto_unsubbed} unsubscribe request(s) accepted[/success]"
@@ -2679,9 +3035,11 @@ def _run_scan(
 
     # Mark keep senders (dry-run must not mutate the database)
     if not dry_run:
-        for key, sender, classification in to_keep:
-            db.update_sender_status(sender.domain, SenderStatus.KEEP)
-            if authoritative:
+        db.update_sender_status_bulk(
+            (sender.domain, SenderStatus.KEEP) for _key, sender, _classification in to_keep
+        )
+        if authoritative:
+            for key, sender, classification in to_keep:
                 headers = scan_result.get_emails_for_subscription(key)
                 if headers:
                     _persist_subscription_records(
@@ -2694,6 +3052,7 @@ def _run_scan(
     # Log run
     if not dry_run:
         db.log_run(stats)
+        _refresh_stats_cache_quietly(db.get_db_path())
 
     # Prompt about review queue
     if to_review and not auto:
@@ -2701,43 +3060,48 @@ def _run_scan(
         console.print("Run [bold]nothx review[/bold] to process them.")
 
 
+def _detail_rows(items: list) -> list[tuple[Text, ...]]:
+    """Cells for the first ten unsubscribe/keep detail rows.
+
+    Cells are plain ``Text`` so Rich neither parses sender-controlled strings
+    as markup nor runs its highlighter over them on every render.
+    """
+    return [
+        (
+            Text(_subscription_label(sender)),
+            Text(sender.domain),
+            Text(str(sender.total_emails)),
+            Text(f"{sender.open_rate:.0f}%"),
+            Text(classification.reasoning[:50]),
+        )
+        for _key, sender, classification in items[:10]
+    ]
+
+
+# Column headers shared by the unsubscribe and keep detail tables
+_DETAIL_COLUMNS = ("Account / List identity", "Domain", "Emails", "Open Rate", "Reason")
+
+
+def _print_detail_table(title: str, items: list) -> None:
+    """Print a titled unsubscribe/keep detail table for the first ten items."""
+    from rich.table import Table
+
+    console.print(title)
+    table = Table(*_DETAIL_COLUMNS, show_header=True)
+    for row in _detail_rows(items):
+        table.add_row(*row)
+    console.print(table)
+
+
 def _show_details(to_unsub, to_keep, to_review, to_block):
     """Show detailed classification results."""
+    from rich.table import Table
+
     if to_unsub:
-        console.print("\n[bold red]To Unsubscribe:[/bold red]")
-        table = Table(show_header=True)
-        table.add_column("Account / List identity")
-        table.add_column("Domain")
-        table.add_column("Emails")
-        table.add_column("Open Rate")
-        table.add_column("Reason")
-        for _key, sender, classification in to_unsub[:10]:
-            table.add_row(
-                _subscription_label(sender),
-                sender.domain,
-                str(sender.total_emails),
-                f"{sender.open_rate:.0f}%",
-                classification.reasoning[:50],
-            )
-        console.print(table)
+        _print_detail_table("\n[bold red]To Unsubscribe:[/bold red]", to_unsub)
 
     if to_keep:
-        console.print("\n[bold green]To Keep:[/bold green]")
-        table = Table(show_header=True)
-        table.add_column("Account / List identity")
-        table.add_column("Domain")
-        table.add_column("Emails")
-        table.add_column("Open Rate")
-        table.add_column("Reason")
-        for _key, sender, classification in to_keep[:10]:
-            table.add_row(
-                _subscription_label(sender),
-                sender.domain,
-                str(sender.total_emails),
-                f"{sender.open_rate:.0f}%",
-                classification.reasoning[:50],
-            )
-        console.print(table)
+        _print_detail_table("\n[bold green]To Keep:[/bold green]", to_keep)
 
     if to_block:
         console.print("\n[bold red]To Block / Move to Junk:[/bold red]")
@@ -2748,10 +3112,15 @@ def _show_details(to_unsub, to_keep, to_review, to_block):
         table.add_column("Reason")
         for _key, sender, classification in to_block[:10]:
             table.add_row(
-                _subscription_label(sender),
-                sender.domain,
-                str(sender.inbox_emails),
-                classification.reasoning[:50],
+                *map(
+                    Text,
+                    (
+                        _subscription_label(sender),
+                        sender.domain,
+                        str(sender.inbox_emails),
+                        classification.reasoning[:50],
+                    ),
+                )
             )
         console.print(table)
 
@@ -2760,6 +3129,10 @@ def _show_details(to_unsub, to_keep, to_review, to_block):
 @click.option("--learning", is_flag=True, help="Show learning insights and preferences")
 def status(learning: bool):
     """Show current nothx status."""
+    from rich.columns import Columns
+    from rich.rule import Rule
+    from rich.table import Table
+
     config = Config.load()
 
     if not config.is_configured():
@@ -2887,7 +3260,7 @@ def status(learning: bool):
     if stats["last_run"]:
         try:
             last_run_dt = datetime.fromisoformat(stats["last_run"])
-            relative_time = humanize.naturaltime(last_run_dt)
+            relative_time = _naturaltime(last_run_dt)
             console.print(f"{_L} Last run: {relative_time}")
         except (ValueError, TypeError):
             console.print(f"{_L} Last run: {stats['last_run']}")
@@ -2921,6 +3294,8 @@ def review(show_all: bool, show_keep: bool, show_unsub: bool):
     By default, shows only senders that need review (uncertain classification).
     Use --all to see all pending senders, or --keep/--unsub to filter by classification.
     """
+    from rich.table import Table
+
     config = Config.load()
 
     if not config.is_configured():
@@ -2970,17 +3345,11 @@ def review(show_all: bool, show_keep: bool, show_unsub: bool):
                 choices.append(
                     questionary.Choice("Rescan and open an unsubscribe page", value="open")
                 )
-            choices.extend(
-                [
-                    questionary.Choice("Keep future mail", value="keep"),
-                    questionary.Choice("Block future mail / move to Junk", value="block"),
-                    questionary.Choice("Skip", value="skip"),
-                ]
-            )
+            choices.extend(_choices(_MANUAL_SUBSCRIPTION_CHOICES))
             choice = questionary.select(
                 f"{subscription['account']} · {identity}",
                 choices=choices,
-                **Q_COMMON,
+                **_q_common(),
             ).ask()
             if choice is None:
                 break
@@ -3008,17 +3377,17 @@ def review(show_all: bool, show_keep: bool, show_unsub: bool):
 
     # Determine which senders to show
     if show_keep:
-        senders = db.get_senders_by_status(SenderStatus.KEEP)
+        senders = db.get_senders_by_status(SenderStatus.KEEP, db.REVIEW_COLUMNS)
         filter_label = "marked to keep"
     elif show_unsub:
-        senders = db.get_senders_by_status(SenderStatus.UNSUBSCRIBED)
+        senders = db.get_senders_by_status(SenderStatus.UNSUBSCRIBED, db.REVIEW_COLUMNS)
         filter_label = "marked to unsubscribe"
     elif show_all:
-        senders = db.get_senders_by_status(SenderStatus.UNKNOWN)
+        senders = db.get_senders_by_status(SenderStatus.UNKNOWN, db.REVIEW_COLUMNS)
         filter_label = "pending"
     else:
         # Default: only senders that need review (uncertain)
-        senders = db.get_senders_for_review()
+        senders = db.get_senders_for_review(db.REVIEW_COLUMNS)
         filter_label = "needing review"
 
     # A manual account/list decision may create/update its compatibility
@@ -3036,10 +3405,11 @@ def review(show_all: bool, show_keep: bool, show_unsub: bool):
 
     _select_header(f"{len(senders)} senders {filter_label}")
 
+    review_choices = _choices(_REVIEW_CHOICES)
     for sender in senders:
         domain = sender["domain"]
         total = sender["total_emails"]
-        subjects = sender.get("sample_subjects", "").split("|")[:3]
+        subjects = (sender.get("sample_subjects") or "").split("|", 3)[:3]
 
         console.print(f"[bold][{total} emails] [domain]{domain}[/domain][/bold]")
         if sender.get("ai_classification"):
@@ -3053,13 +3423,8 @@ def review(show_all: bool, show_keep: bool, show_unsub: bool):
         # Interactive selector with clear labels
         choice = questionary.select(
             f"What would you like to do with {domain}?",
-            choices=[
-                questionary.Choice("Unsubscribe - Stop receiving emails", value="unsub"),
-                questionary.Choice("Keep - Continue receiving", value="keep"),
-                questionary.Choice("Block - Block sender entirely", value="block"),
-                questionary.Choice("Skip - Decide later", value="skip"),
-            ],
-            **Q_COMMON,
+            choices=review_choices,
+            **_q_common(),
         ).ask()
 
         if choice is None:
@@ -3212,9 +3577,9 @@ def undo(domain: str | None):
 
     if domain:
         # Undo specific domain - this is a correction (user changed their mind)
-        db.set_user_override(domain, "keep")
-        db.update_sender_status(domain, SenderStatus.KEEP)
+        db.set_user_decision(domain, "keep", SenderStatus.KEEP)
         db.log_correction(domain, "unsub", "keep")
+        _invalidate_stats_cache()
         authoritative_updates = 0
         for subscription in db.list_subscriptions(limit=10_000):
             if (subscription.get("sender_domain") or "").casefold() == domain.casefold():
@@ -3333,17 +3698,20 @@ def config_cmd(show: bool, ai: str | None, footer_scan: str | None, mode: str |
 
     if ai:
         config.ai.enabled = ai == "on"
-        config.save()
-        console.print(f"AI: {'enabled' if config.ai.enabled else 'disabled'}")
-
     if mode:
         config.operation_mode = mode
-        config.save()
-        console.print(f"Mode: {mode}")
-
     if footer_scan:
         config.footer_scan_enabled = footer_scan == "on"
+
+    # Write the file once, however many settings changed
+    if ai or mode or footer_scan:
         config.save()
+
+    if ai:
+        console.print(f"AI: {'enabled' if config.ai.enabled else 'disabled'}")
+    if mode:
+        console.print(f"Mode: {mode}")
+    if footer_scan:
         state = "enabled" if config.footer_scan_enabled else "disabled"
         console.print(f"Footer scan: {state} (local-only, bounded, and never sent to AI)")
 
@@ -3461,6 +3829,8 @@ def rule(pattern: str, action: str):
 @main.command()
 def rules():
     """List all classification rules."""
+    from rich.table import Table
+
     db.init_db()
     rules_list = db.get_rules()
 
@@ -3495,6 +3865,8 @@ def rules():
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def senders(status: str | None, sort: str, as_json: bool):
     """List all tracked senders."""
+    from rich.table import Table
+
     db.init_db()
 
     # Map CLI options to db function params
@@ -3502,18 +3874,30 @@ def senders(status: str | None, sort: str, as_json: bool):
     sort_map = {"emails": "emails", "domain": "domain", "date": "last_seen"}
 
     status_filter = status_map.get(status) if status else None
-    all_senders = db.get_all_senders(status_filter=status_filter, sort_by=sort_map[sort])
+    # JSON output and the bulk-action menu work on every matching sender;
+    # the plain table only needs one row past the display limit.
+    needs_all = as_json or bool(status and console.is_terminal)
+    all_senders = db.get_all_senders(
+        status_filter=status_filter,
+        sort_by=sort_map[sort],
+        limit=None if needs_all else SENDERS_DISPLAY_LIMIT + 1,
+        columns=None if as_json else db.LISTING_COLUMNS,
+    )
 
     if not all_senders:
         console.print("[muted]No senders tracked yet. Run 'nothx run' to scan your inbox.[/muted]")
         return
 
     if as_json:
-        click.echo(json.dumps(all_senders, indent=2, default=str))
+        click.echo(_dump_json(all_senders))
         return
 
+    total = len(all_senders)
+    if total > SENDERS_DISPLAY_LIMIT and not needs_all:
+        total = db.count_senders(status_filter)
+
     status_label = f" ({status})" if status else ""
-    console.print(f"\n[header]Tracked Senders{status_label} ({len(all_senders)} total)[/header]\n")
+    console.print(f"\n[header]Tracked Senders{status_label} ({total} total)[/header]\n")
 
     table = Table(show_header=True)
     table.add_column("Domain", style="domain")
@@ -3521,27 +3905,17 @@ def senders(status: str | None, sort: str, as_json: bool):
     table.add_column("Status")
     table.add_column("Last Seen")
 
-    status_styles = {
-        "unsubscribed": "unsubscribe",
-        "keep": "keep",
-        "blocked": "block",
-        "unknown": "review",
+    # One pre-styled cell per status, shared by every row
+    status_cells = {
+        status: Text(status.title(), style=style) for status, style in SENDER_STATUS_STYLES.items()
     }
 
-    for sender in all_senders[:50]:  # Limit display to 50
+    format_last_seen = _last_seen_formatter()
+    for sender in all_senders[:SENDERS_DISPLAY_LIMIT]:
         sender_status = sender.get("status", "unknown")
-        style = status_styles.get(sender_status)
-        status_display = (
-            f"[{style}]{sender_status.title()}[/{style}]" if style else sender_status.title()
-        )
+        status_display = status_cells.get(sender_status) or Text(sender_status.title())
 
-        last_seen = sender.get("last_seen", "")
-        if last_seen:
-            try:
-                last_dt = datetime.fromisoformat(last_seen)
-                last_seen = humanize.naturaltime(last_dt)
-            except (ValueError, TypeError):
-                last_seen = last_seen[:10] if last_seen else "-"
+        last_seen = format_last_seen(sender.get("last_seen") or "")
 
         table.add_row(
             sender["domain"],
@@ -3552,8 +3926,8 @@ def senders(status: str | None, sort: str, as_json: bool):
 
     console.print(table)
 
-    if len(all_senders) > 50:
-        console.print(f"\n[muted]Showing first 50 of {len(all_senders)} senders[/muted]")
+    if total > SENDERS_DISPLAY_LIMIT:
+        console.print(f"\n[muted]Showing first {SENDERS_DISPLAY_LIMIT} of {total} senders[/muted]")
 
     # Bulk action mode when filtering by status (skip for JSON output or non-TTY)
     if not as_json and all_senders and status and console.is_terminal:
@@ -3583,7 +3957,7 @@ def _senders_bulk_action(all_senders: list[dict], status_filter: str) -> None:
         return
 
     if bulk_action == "pick":
-        _senders_pick_individual(all_senders[:50])
+        _senders_pick_individual(all_senders[:SENDERS_DISPLAY_LIMIT])
         return
 
     # Confirm bulk action
@@ -3667,13 +4041,7 @@ def change(domain: str):
 
     # Display current info
     current_status = sender.get("status", "unknown")
-    status_styles = {
-        "unsubscribed": "unsubscribe",
-        "keep": "keep",
-        "blocked": "block",
-        "unknown": "review",
-    }
-    style = status_styles.get(current_status)
+    style = SENDER_STATUS_STYLES.get(current_status)
     status_display = (
         f"[{style}]{current_status.title()}[/{style}]" if style else current_status.title()
     )
@@ -3682,7 +4050,7 @@ def change(domain: str):
     if last_seen:
         try:
             last_dt = datetime.fromisoformat(last_seen)
-            last_seen = humanize.naturaltime(last_dt)
+            last_seen = _naturaltime(last_dt)
         except (ValueError, TypeError):
             last_seen = last_seen[:10] if last_seen else "-"
 
@@ -3721,42 +4089,42 @@ def change(domain: str):
 @click.argument("pattern")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def search(pattern: str, as_json: bool):
-    """Search for a sender by domain pattern."""
+    """Search for a sender by domain pattern.
+
+    Matches are listed busiest sender first. End the pattern with * to list
+    domains that start with it instead, alphabetically and at most 200.
+    """
     db.init_db()
 
-    results = db.search_senders(pattern)
+    truncated = False
+    prefix_match = _PREFIX_PATTERN.fullmatch(pattern)
+    if prefix_match:
+        results = db.search_senders_prefix(prefix_match.group(1), limit=SEARCH_PREFIX_LIMIT + 1)
+        truncated = len(results) > SEARCH_PREFIX_LIMIT
+        results = results[:SEARCH_PREFIX_LIMIT]
+    else:
+        results = db.search_senders(pattern)
 
     if not results:
         console.print(f"[muted]No senders found matching '{pattern}'[/muted]")
         return
 
     if as_json:
-        click.echo(json.dumps(results, indent=2, default=str))
+        click.echo(_dump_json(results))
         return
 
-    console.print(f"\n[header]Found {len(results)} sender(s) matching '{pattern}':[/header]\n")
+    found = f"{len(results)}+" if truncated else str(len(results))
+    console.print(f"\n[header]Found {found} sender(s) matching '{pattern}':[/header]\n")
 
+    format_last_seen = _last_seen_formatter()
     for sender in results:
         domain = sender["domain"]
         status = sender.get("status", "unknown")
         total = sender.get("total_emails", 0)
         subjects = sender.get("sample_subjects", "").split("|")[:3]
+        style = SENDER_STATUS_STYLES.get(status, "")
 
-        status_styles = {
-            "unsubscribed": "unsubscribe",
-            "keep": "keep",
-            "blocked": "block",
-            "unknown": "review",
-        }
-        style = status_styles.get(status, "")
-
-        last_seen = sender.get("last_seen", "")
-        if last_seen:
-            try:
-                last_dt = datetime.fromisoformat(last_seen)
-                last_seen = humanize.naturaltime(last_dt)
-            except (ValueError, TypeError):
-                last_seen = last_seen[:10] if last_seen else ""
+        last_seen = format_last_seen(sender.get("last_seen") or "")
 
         console.print(f"{_L} [domain]{domain}[/domain]")
         console.print(
@@ -3768,6 +4136,12 @@ def search(pattern: str, as_json: bool):
             console.print(f"{_L}   Subjects: {', '.join(s for s in subjects[:3] if s)}")
         console.print()
 
+    if truncated:
+        console.print(
+            f"[muted]Showing first {SEARCH_PREFIX_LIMIT} matches; "
+            "use a longer prefix to narrow the list[/muted]"
+        )
+
 
 @main.command()
 @click.option("--limit", default=20, help="Number of entries to show")
@@ -3799,18 +4173,17 @@ def history(limit: int, failures: bool, as_json: bool):
         operation_rows = [
             {"type": "subscription_operation", **operation} for operation in operations
         ]
-        click.echo(json.dumps([*operation_rows, *activity], indent=2, default=str))
+        click.echo(_dump_json([*operation_rows, *activity]))
         return
 
     label = " (failures only)" if failures else ""
     console.print(f"\n[header]Recent Activity{label}[/header]\n")
 
+    # Rendered as one block so Rich parses and writes the log once
+    lines = []
     for operation in operations:
         timestamp = operation.get("completed_at") or operation.get("created_at") or ""
-        try:
-            date_str = datetime.fromisoformat(timestamp).strftime("%b %d, %I:%M %p")
-        except (ValueError, TypeError):
-            date_str = timestamp
+        date_str = _history_time(timestamp)
         identity = f"{operation['identity_kind']}:{operation['identity_value']}"
         outcome = operation.get("outcome") or "in progress"
         detail = _redact_failure_detail(operation.get("detail_redacted"))
@@ -3820,22 +4193,17 @@ def history(limit: int, failures: bool, as_json: bool):
         )
         if detail:
             line += f" [muted]({detail})[/muted]"
-        console.print(line)
+        lines.append(line)
 
     for entry in activity:
-        timestamp = entry.get("timestamp", "")
-        try:
-            ts_dt = datetime.fromisoformat(timestamp)
-            date_str = ts_dt.strftime("%b %d, %I:%M %p")
-        except (ValueError, TypeError):
-            date_str = timestamp
+        date_str = _history_time(entry.get("timestamp", ""))
 
         if entry["type"] == "run":
             scanned = entry.get("emails_scanned", 0)
             senders = entry.get("unique_senders", 0)
             unsubbed = entry.get("auto_unsubbed", 0)
             failed = entry.get("failed", 0)
-            console.print(
+            lines.append(
                 f"[muted]{date_str}[/muted]  ◉ Scan completed: {scanned} emails, {senders} senders, {unsubbed} unsubscribed"
                 + (f", {failed} failed" if failed else "")
             )
@@ -3843,15 +4211,25 @@ def history(limit: int, failures: bool, as_json: bool):
             domain = entry.get("domain", "unknown")
             success = entry.get("success", False)
             if success:
-                console.print(
+                lines.append(
                     f"[muted]{date_str}[/muted]  [success]✓[/success] Unsubscribed from [domain]{domain}[/domain]"
                 )
             else:
                 error = entry.get("error") or "unknown error"
-                console.print(
+                lines.append(
                     f"[muted]{date_str}[/muted]  [error]✗[/error] Failed to unsubscribe from [domain]{domain}[/domain] ({error[:30]})"
                 )
 
+    console.print("\n".join(lines))
+
+
+def _history_time(timestamp: str) -> str:
+    """Format an activity timestamp like "Jan 15, 10:30 AM", or return it as is."""
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%b %d, %I:%M %p")
+    except (ValueError, TypeError):
+        return timestamp
+
 
 @main.command()
 @click.argument("type_", metavar="TYPE", type=click.Choice(["senders", "history"]))
@@ -3863,11 +4241,15 @@ def export(type_: str, output: str):
     """
     db.init_db()
 
+    rows: Generator[dict, None, None] | None = None
     if type_ == "senders":
-        data = db.get_all_senders()
-        if not data:
+        # Stream senders straight from the cursor into the CSV writer
+        rows = db.iter_all_senders()
+        first = next(rows, None)
+        if first is None:
             console.print("[warning]No senders to export.[/warning]")
             return
+        data: Iterable[dict] = itertools.chain((first,), rows)
         fieldnames = [
             "domain",
             "total_emails",
@@ -3919,15 +4301,63 @@ def export(type_: str, output: str):
             "failed",
             "mode",
         ]
+        # History rows come in several shapes; give each every column
+        blank = dict.fromkeys(fieldnames)
+        data = [{**blank, **record} for record in data]
 
+    # Every row now has every field, so values come out by plain item lookup
+    row_values = operator.itemgetter(*fieldnames)
     try:
-        with open(output, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-            writer.writeheader()
-            writer.writerows(data)
-        console.print(f"[success]✓ Exported {len(data)} records to {output}[/success]")
+        with open(output, "w", newline="", buffering=EXPORT_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            count = 0
+            for record in data:
+                writer.writerow(row_values(record))
+                count += 1
+        console.print(f"[success]✓ Exported {count} records to {output}[/success]")
     except OSError as e:
         console.print(f"[error]Failed to write {output}: {e}[/error]")
+    finally:
+        if rows is not None:
+            rows.close()
+
+
+def _report_account_test(account: AccountConfig, probe: Future[tuple[bool, str]]) -> None:
+    """Print one account's section of `nothx test` once its probe finishes."""
+    console.print(f"\n[header]Testing connection to {account.email}...[/header]")
+
+    if account.provider == "outlook" and not account.uses_oauth:
+        console.print(
+            "[warning]This Outlook account uses legacy password authentication. "
+            "Microsoft OAuth is recommended; remove and re-add the account to authorize "
+            "IMAP and SMTP safely.[/warning]"
+        )
+    elif account.uses_oauth and account.client_id:
+        consent_status = msauth.get_consent_status(account.email, account.client_id)
+        if not consent_status.ready:
+            missing = ", ".join(consent_status.missing_scopes)
+            detail = f" Missing scopes: {missing}." if missing else ""
+            console.print(
+                f"[warning]Microsoft re-consent is required ({consent_status.reason})."
+                f"{detail} Remove and re-add this account to authorize IMAP, SMTP, "
+                "and offline access.[/warning]"
+            )
+
+    with console.status("Connecting...", spinner_style="#ffaf00"):
+        success, msg = probe.result()
+
+    if success:
+        console.print("[success]✓ IMAP connection successful[/success]")
+        console.print("[success]✓ Authentication successful[/success]")
+        console.print("[success]✓ Inbox accessible[/success]")
+    else:
+        console.print(f"[error]✗ Connection failed: {msg}[/error]")
+        console.print("\n[muted]Suggestions:[/muted]")
+        console.print(f"{_L} • Check your internet connection")
+        if tips := TROUBLESHOOTING_TIPS.get(account.provider):
+            console.print(tips)
+        console.print(f"{_L} • Make sure IMAP is enabled in your email settings")
 
 
 @main.command("test")
@@ -3939,41 +4369,14 @@ def test_connection():
         console.print("[error]No accounts configured. Run 'nothx init' first.[/error]")
         return
 
-    for _name, account in config.accounts.items():
-        console.print(f"\n[header]Testing connection to {account.email}...[/header]")
-
-        if account.provider == "outlook" and not account.uses_oauth:
-            console.print(
-                "[warning]This Outlook account uses legacy password authentication. "
-                "Microsoft OAuth is recommended; remove and re-add the account to authorize "
-                "IMAP and SMTP safely.[/warning]"
-            )
-        elif account.uses_oauth and account.client_id:
-            consent_status = msauth.get_consent_status(account.email, account.client_id)
-            if not consent_status.ready:
-                missing = ", ".join(consent_status.missing_scopes)
-                detail = f" Missing scopes: {missing}." if missing else ""
-                console.print(
-                    f"[warning]Microsoft re-consent is required ({consent_status.reason})."
-                    f"{detail} Remove and re-add this account to authorize IMAP, SMTP, "
-                    "and offline access.[/warning]"
-                )
-
-        with console.status("Connecting...", spinner_style="#ffaf00"):
-            success, msg = test_account(account)
-
-        if success:
-            console.print("[success]✓ IMAP connection successful[/success]")
-            console.print("[success]✓ Authentication successful[/success]")
-            console.print("[success]✓ Inbox accessible[/success]")
-        else:
-            console.print(f"[error]✗ Connection failed: {msg}[/error]")
-            console.print("\n[muted]Suggestions:[/muted]")
-            console.print(f"{_L} • Check your internet connection")
-            if tips := TROUBLESHOOTING_TIPS.get(account.provider):
-                for tip in tips:
-                    console.print(f"{_L}{tip[1:]}" if tip.startswith("  ") else tip)
-            console.print(f"{_L} • Make sure IMAP is enabled in your email settings")
+    # Probe every account at once; results are still reported in config order
+    with ThreadPoolExecutor(max_workers=ACCOUNT_TEST_WORKERS) as executor:
+        probes = [
+            (account, executor.submit(test_account, account))
+            for account in config.accounts.values()
+        ]
+        for account, probe in probes:
+            _report_account_test(account, probe)
 
 
 # This exported Click command is imported by CLI tests; prevent pytest from
@@ -3983,10 +4386,14 @@ test_connection.__dict__["__test__"] = False
 
 @main.command()
 @click.option("--keep-config", is_flag=True, help="Keep accounts and API key, only clear data")
-def reset(keep_config: bool):
+@click.option("--yes", "-y", is_flag=True, help="Skip the confirmation prompt")
+def reset(keep_config: bool, yes: bool):
     """Clear all data and start fresh."""
     from .config import get_config_path
 
+    if not yes and not _is_interactive():
+        raise click.UsageError("No terminal to confirm the reset; pass --yes to confirm it")
+
     db.init_db()
     stats = db.get_stats()
 
@@ -4001,15 +4408,19 @@ def reset(keep_config: bool):
 
     console.print()
 
-    # Require typing "reset" to confirm
-    confirm = questionary.text("", qmark='Type "reset" to confirm:', style=Q_INPUT_STYLE).ask()
+    if not yes:
+        # Require typing "reset" to confirm
+        confirm = questionary.text(
+            "", qmark='Type "reset" to confirm:', style=_q_input_style()
+        ).ask()
 
-    if confirm != "reset":
-        console.print("Cancelled.")
-        return
+        if confirm != "reset":
+            console.print("Cancelled.")
+            return
 
     # Reset database
     senders_deleted, unsubs_deleted = db.reset_database(keep_config=keep_config)
+    _invalidate_stats_cache()
 
     # Delete config file if not keeping
     if not keep_config:
@@ -4026,7 +4437,7 @@ def reset(keep_config: bool):
 
 
 @main.command()
-@click.argument("shell", type=click.Choice(["bash", "zsh", "fish"]))
+@click.argument("shell", type=click.Choice(SHELLS))
 def completion(shell: str):
     """Generate shell completion script.
 
@@ -4037,84 +4448,13 @@ def completion(shell: str):
     Zsh:  eval "$(nothx completion zsh)"
     Fish: nothx completion fish | source
     """
-
-    # Click provides built-in completion support
-    prog_name = "nothx"
-
-    if shell == "bash":
-        # Bash completion script
-        script = f"""
-_nothx_completion() {{
-    local IFS=$'\\n'
-    COMPREPLY=( $(env COMP_WORDS="${{COMP_WORDS[*]}}" \\
-                     COMP_CWORD=$COMP_CWORD \\
-                     _{prog_name.upper()}_COMPLETE=bash_complete $1) )
-    return 0
-}}
-complete -o default -F _nothx_completion {prog_name}
-"""
-    elif shell == "zsh":
-        # Zsh completion script
-        script = f"""
-#compdef {prog_name}
-
-_nothx_completion() {{
-    local -a completions
-    local -a completions_with_descriptions
-    local -a response
-    (( ! $+commands[{prog_name}] )) && return 1
-
-    response=("${{(@f)$(env COMP_WORDS="${{words[*]}}" \\
-                            COMP_CWORD=$((CURRENT-1)) \\
-                            _{prog_name.upper()}_COMPLETE=zsh_complete {prog_name})}}")
-
-    for key descr in ${{(kv)response}}; do
-      if [[ "$descr" == "_" ]]; then
-          completions+=("$key")
-      else
-          completions_with_descriptions+=("$key":"$descr")
-      fi
-    done
-
-    if [ -n "$completions_with_descriptions" ]; then
-        _describe -V unsorted completions_with_descriptions -U
-    fi
-
-    if [ -n "$completions" ]; then
-        compadd -U -V unsorted -a completions
-    fi
-}}
-
-compdef _nothx_completion {prog_name}
-"""
-    else:  # fish
-        # Fish completion script
-        script = f"""
-function _nothx_completion;
-    set -l response (env _{prog_name.upper()}_COMPLETE=fish_complete COMP_WORDS=(commandline -cp) COMP_CWORD=(commandline -t) {prog_name});
-
-    for completion in $response;
-        set -l metadata (string split "," -- $completion);
-
-        if [ $metadata[1] = "dir" ];
-            __fish_complete_directories $metadata[2];
-        else if [ $metadata[1] = "file" ];
-            __fish_complete_path $metadata[2];
-        else if [ $metadata[1] = "plain" ];
-            echo $metadata[2];
-        end;
-    end;
-end;
-
-complete --no-files --command {prog_name} --arguments "(_nothx_completion)";
-"""
-
-    click.echo(script.strip())
+    click.echo(completion_script(shell))
 
 
 @main.command()
 @click.option("--check", is_flag=True, help="Only check for updates, don't install")
-def update(check: bool):
+@click.option("--yes", "-y", is_flag=True, help="Install without asking for confirmation")
+def update(check: bool, yes: bool):
     """Check for and install updates.
 
     Updates nothx to the latest version using pip.
@@ -4147,8 +4487,12 @@ def update(check: bool):
             console.print(f"\n[info]Run 'nothx update' to upgrade to {latest}[/info]")
             return
 
+        if not yes and not _is_interactive():
+            console.print(f"\n[info]Run 'nothx update --yes' to upgrade to {latest}[/info]")
+            return
+
         # Perform update
-        if not _styled_confirm(f"Update to version {latest}?", default=True):
+        if not yes and not _styled_confirm(f"Update to version {latest}?", default=True):
             console.print("Cancelled.")
             return
 
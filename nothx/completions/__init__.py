@@ -0,0 +1,15 @@
+"""Shell completion scripts shipped with the package.
+
+The scripts only hook the shell up to Click's ``_NOTHX_COMPLETE`` protocol,
+so they are static files rather than generated per invocation.
+"""
+
+SHELLS = ("bash", "zsh", "fish")
+
+
+def completion_script(shell: str) -> str:
+    """Return the completion script for ``shell`` (one of ``SHELLS``)."""
+    # Imported here so `nothx --version` does not pay for importlib.resources
+    from importlib import resources
+
+    return resources.files(__name__).joinpath(f"{shell}.sh").read_text().strip()
@@ -0,0 +1,8 @@
+_nothx_completion() {
+    local IFS=$'\n'
+    COMPREPLY=( $(env COMP_WORDS="${COMP_WORDS[*]}" \
+                     COMP_CWORD=$COMP_CWORD \
+                     _NOTHX_COMPLETE=bash_complete $1) )
+    return 0
+}
+complete -o default -F _nothx_completion nothx
@@ -0,0 +1,17 @@
+function _nothx_completion;
+    set -l response (env _NOTHX_COMPLETE=fish_complete COMP_WORDS=(commandline -cp) COMP_CWORD=(commandline -t) nothx);
+
+    for completion in $response;
+        set -l metadata (string split "," -- $completion);
+
+        if [ $metadata[1] = "dir" ];
+            __fish_complete_directories $metadata[2];
+        else if [ $metadata[1] = "file" ];
+            __fish_complete_path $metadata[2];
+        else if [ $metadata[1] = "plain" ];
+            echo $metadata[2];
+        end;
+    end;
+end;
+
+complete --no-files --command nothx --arguments "(_nothx_completion)";
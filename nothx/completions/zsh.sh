@@ -0,0 +1,30 @@
+#compdef nothx
+
+_nothx_completion() {
+    local -a completions
+    local -a completions_with_descriptions
+    local -a response
+    (( ! $+commands[nothx] )) && return 1
+
+    response=("${(@f)$(env COMP_WORDS="${words[*]}" \
+                            COMP_CWORD=$((CURRENT-1)) \
+                            _NOTHX_COMPLETE=zsh_complete nothx)}")
+
+    for key descr in ${(kv)response}; do
+      if [[ "$descr" == "_" ]]; then
+          completions+=("$key")
+      else
+          completions_with_descriptions+=("$key":"$descr")
+      fi
+    done
+
+    if [ -n "$completions_with_descriptions" ]; then
+        _describe -V unsorted completions_with_descriptions -U
+    fi
+
+    if [ -n "$completions" ]; then
+        compadd -U -V unsorted -a completions
+    fi
+}
+
+compdef _nothx_completion nothx
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import os
 import stat
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -126,6 +128,7 @@ class AIConfig:
     model: str = "claude-haiku-4-5"
     confidence_threshold: float = 0.80
     api_base: str | None = None  # Custom API endpoint (for Ollama or proxies)
+    cache_responses: bool = False  # Reuse responses for identical prompts, also across runs
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -224,6 +227,18 @@ class SafetyConfig:
     dry_run: bool = False
 
 
+@lru_cache(maxsize=1)
+def _read_config_data(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse the config file, memoized on its path and stat signature.
+
+    A single CLI invocation loads the config several times (welcome screen,
+    subcommand, helpers); the stat arguments make a rewritten file miss the
+    cache so callers never see stale data.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
 @dataclass
 class Config:
     """Main configuration for nothx."""
@@ -261,6 +276,7 @@ class Config:
         )
         with os.fdopen(fd, "w") as f:
             json.dump(data, f, indent=2)
+        _read_config_data.cache_clear()
         # Re-assert 0600 in case the file pre-existed with looser permissions.
         config_path.chmod(stat.S_IRUSR | stat.S_IWUSR)
 
@@ -287,11 +303,13 @@ class Config:
     def load(cls) -> Config:
         """Load configuration from disk."""
         config_path = get_config_path()
-        if not config_path.exists():
+        try:
+            st = config_path.stat()
+        except FileNotFoundError:
             return cls()
 
-        with open(config_path) as f:
-            data = json.load(f)
+        # Copy so the Config built below never shares lists with the cache
+        data = copy.deepcopy(_read_config_data(str(config_path), st.st_mtime_ns, st.st_size))
 
         config = cls()
 
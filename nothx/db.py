@@ -11,7 +11,8 @@ import json
 import os
 import re
 import sqlite3
-from collections.abc import Iterator
+import threading
+from collections.abc import Generator, Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -23,6 +24,10 @@ from .models import Action, RunStats, SenderStatus, UnsubMethod, UserAction, Use
 BUSY_TIMEOUT_MS = 5_000
 DEFAULT_OPERATION_LEASE_SECONDS = 30 * 60
 _LIST_ID_VALUE_RE = re.compile(r"^[A-Za-z0-9!#$%&'*+\-/=?^_`{|}~.]{1,255}$")
+# Database files this process has already brought to the current schema
+_initialized_paths: set[str] = set()
+# Per-thread reusable connection state, see _thread_connection()
+_local = threading.local()
 
 
 def get_connection() -> sqlite3.Connection:
@@ -30,7 +35,9 @@ def get_connection() -> sqlite3.Connection:
 
     Foreign keys are connection-local in SQLite, so they must be enabled for
     every caller.  WAL and a finite busy timeout let independently scheduled
-    account scans coexist without silently losing writes.
+    account scans coexist without silently losing writes.  In WAL mode,
+    synchronous=NORMAL syncs at checkpoints rather than on every commit and
+    still never corrupts the database.
     """
     db_path = get_db_path()
     conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1_000)
@@ -38,13 +45,65 @@ def get_connection() -> sqlite3.Connection:
     conn.execute("PRAGMA foreign_keys = ON")
     conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
     conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+
+def _file_key(db_path: str) -> tuple[int, str, int, int] | None:
+    """Identify the database file on disk, or None if it does not exist."""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return (os.getpid(), db_path, stat.st_dev, stat.st_ino)
+
+
+def _thread_connection() -> sqlite3.Connection:
+    """Return this thread's reusable connection, opening it on first use.
+
+    Opening a connection costs far more than a typical query (the schema is
+    parsed and the WAL index mapped each time), so each thread keeps one per
+    database file.  It is replaced when the process forks or the database
+    path or file changes underneath it.
+    """
+    db_path = str(get_db_path())
+    key = _file_key(db_path)
+    conn = getattr(_local, "conn", None)
+    # None when the file could not be identified as the connection was opened
+    cached_key = getattr(_local, "key", None)
+    if conn is not None and key is not None and cached_key == key:
+        return conn
+    if conn is not None and cached_key is not None and cached_key[0] == os.getpid():
+        conn.close()
+    conn = get_connection()
+    _local.conn = conn
+    _local.key = _file_key(db_path)
     return conn
 
 
 @contextmanager
 def get_db() -> Iterator[sqlite3.Connection]:
-    """Context manager for database connections."""
-    conn = get_connection()
+    """Context manager for database connections.
+
+    The outermost block on a thread reuses that thread's connection and
+    always leaves it outside a transaction.  A block opened while another is
+    active gets a private connection, so its commit or rollback never
+    touches the enclosing block's work.
+    """
+    if getattr(_local, "in_use", False):
+        conn = get_connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return
+
+    conn = _thread_connection()
+    _local.in_use = True
     try:
         yield conn
         conn.commit()
@@ -52,7 +111,10 @@ def get_db() -> Iterator[sqlite3.Connection]:
         conn.rollback()
         raise
     finally:
-        conn.close()
+        _local.in_use = False
+        if conn.in_transaction:
+            # Left early (e.g. a generator closed mid-iteration)
+            conn.rollback()
 
 
 def init_db() -> None:
@@ -61,8 +123,14 @@ def init_db() -> None:
     Existing databases are backed up using SQLite's online-backup API before
     any schema DDL is applied.  A brand-new, empty database does not need a
     backup.
+
+    Repeat calls for a database this process already initialized return
+    immediately, so commands can call it unconditionally.
     """
     db_path = Path(get_db_path())
+    path_key = str(db_path)
+    if path_key in _initialized_paths and db_path.exists():
+        return
     conn = get_connection()
     try:
         old_version = int(conn.execute("PRAGMA user_version").fetchone()[0])
@@ -93,6 +161,7 @@ def init_db() -> None:
         raise
     finally:
         conn.close()
+    _initialized_paths.add(path_key)
 
 
 def _create_legacy_tables(conn: sqlite3.Connection) -> None:
@@ -189,6 +258,15 @@ def _create_legacy_tables(conn: sqlite3.Connection) -> None:
                 last_updated TEXT
             )
         """,
+        # The senders listing filters by status and sorts by recency; domain
+        # lookups are already served by the primary key.
+        "CREATE INDEX IF NOT EXISTS idx_senders_status_seen ON senders(status, last_seen DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_senders_last_seen ON senders(last_seen DESC)",
+        # The activity log reads the newest runs and unsubscribe attempts,
+        # optionally only failed attempts.
+        "CREATE INDEX IF NOT EXISTS idx_runs_ran_at ON runs(ran_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_unsub_log_attempted ON unsub_log(attempted_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_unsub_log_success ON unsub_log(success, attempted_at DESC)",
     )
     for statement in statements:
         conn.execute(statement)
@@ -498,6 +576,17 @@ def _create_authoritative_tables(conn: sqlite3.Connection) -> None:
             UNIQUE (message_ref_id, action_key)
         )
         """,
+        # Opt-in AI response cache, keyed by a hash so prompts (which carry
+        # sender subjects) are never stored.
+        """
+        CREATE TABLE IF NOT EXISTS llm_cache (
+            key TEXT PRIMARY KEY,
+            provider TEXT NOT NULL,
+            model TEXT NOT NULL,
+            response TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+        """,
     )
     for statement in statements:
         conn.execute(statement)
@@ -2291,6 +2380,19 @@ def update_sender_status(domain: str, status: SenderStatus) -> None:
         conn.execute("UPDATE senders SET status = ? WHERE domain = ?", (status.value, domain))
 
 
+def update_sender_status_bulk(updates: Iterable[tuple[str, SenderStatus]]) -> None:
+    """Update the status of many senders in a single transaction.
+
+    Args:
+        updates: ``(domain, status)`` pairs
+    """
+    rows = [(status.value, domain) for domain, status in updates]
+    if not rows:
+        return
+    with get_db() as conn:
+        conn.executemany("UPDATE senders SET status = ? WHERE domain = ?", rows)
+
+
 def update_sender_classification(domain: str, classification: str, confidence: float) -> None:
     """Update the AI classification of a sender."""
     with get_db() as conn:
@@ -2306,6 +2408,15 @@ def set_user_override(domain: str, action: str) -> None:
         conn.execute("UPDATE senders SET user_override = ? WHERE domain = ?", (action, domain))
 
 
+def set_user_decision(domain: str, action: str, status: SenderStatus) -> None:
+    """Record a user override and the resulting status in one statement."""
+    with get_db() as conn:
+        conn.execute(
+            "UPDATE senders SET user_override = ?, status = ? WHERE domain = ?",
+            (action, status.value, domain),
+        )
+
+
 def get_sender(domain: str) -> dict | None:
     """Get a sender by domain."""
     with get_db() as conn:
@@ -2313,11 +2424,114 @@ def get_sender(domain: str) -> dict | None:
         return dict(row) if row else None
 
 
-def get_senders_by_status(status: SenderStatus) -> list[dict]:
-    """Get all senders with a specific status."""
+def get_user_overrides() -> dict[str, str]:
+    """Get every sender's user override, keyed by domain."""
     with get_db() as conn:
         rows = conn.execute(
-            "SELECT * FROM senders WHERE status = ? ORDER BY total_emails DESC", (status.value,)
+            "SELECT domain, user_override FROM senders WHERE user_override IS NOT NULL"
+        ).fetchall()
+        return {row["domain"]: row["user_override"] for row in rows if row["user_override"]}
+
+
+def get_cached_llm(key: str, max_age: timedelta) -> dict | None:
+    """Get a cached AI response by key if it is younger than ``max_age``."""
+    cutoff = _iso_timestamp(datetime.now(UTC) - max_age)
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT response, model FROM llm_cache WHERE key = ? AND created_at >= ?",
+            (key, cutoff),
+        ).fetchone()
+        return dict(row) if row else None
+
+
+def put_cached_llm(key: str, provider: str, model: str, response: str, max_age: timedelta) -> None:
+    """Store an AI response under a content-addressed key.
+
+    Entries older than ``max_age`` can never be read again, so they are
+    pruned on the same write to keep the table from growing without bound.
+    """
+    now = datetime.now(UTC)
+    with get_db() as conn:
+        conn.execute(
+            "DELETE FROM llm_cache WHERE created_at < ?",
+            (_iso_timestamp(now - max_age),),
+        )
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO llm_cache (key, provider, model, response, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (key, provider, model, response, _iso_timestamp(now)),
+        )
+
+
+def delete_cached_llm(key: str) -> None:
+    """Remove a cached AI response, e.g. one that turned out to be unusable."""
+    with get_db() as conn:
+        conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+
+
+# Sender columns the interactive review reads: what it displays plus what
+# recording a decision needs. Omits timestamps and other bookkeeping.
+REVIEW_COLUMNS = (
+    "domain",
+    "total_emails",
+    "seen_emails",
+    "ai_classification",
+    "ai_confidence",
+    "sample_subjects",
+)
+
+# What `nothx senders` renders and its bulk actions read; sample_subjects is
+# the bulky column left out.
+LISTING_COLUMNS = (
+    "domain",
+    "total_emails",
+    "seen_emails",
+    "status",
+    "last_seen",
+    "ai_classification",
+)
+
+_SENDER_COLUMNS = frozenset(
+    {
+        "domain",
+        "first_seen",
+        "last_seen",
+        "total_emails",
+        "seen_emails",
+        "status",
+        "ai_classification",
+        "ai_confidence",
+        "user_override",
+        "sample_subjects",
+        "has_unsubscribe",
+    }
+)
+
+
+def _sender_select_list(columns: Sequence[str] | None) -> str:
+    """SQL select list for ``senders``: ``*`` or the validated ``columns``."""
+    if columns is None:
+        return "*"
+    unknown = set(columns) - _SENDER_COLUMNS
+    if unknown:
+        raise ValueError(f"Unknown sender columns: {sorted(unknown)}")
+    return ", ".join(columns)
+
+
+def get_senders_by_status(status: SenderStatus, columns: Sequence[str] | None = None) -> list[dict]:
+    """Get all senders with a specific status.
+
+    Args:
+        status: Status to filter on
+        columns: Columns to fetch (e.g. ``REVIEW_COLUMNS``); all when None
+    """
+    with get_db() as conn:
+        rows = conn.execute(
+            f"SELECT {_sender_select_list(columns)} FROM senders "
+            "WHERE status = ? ORDER BY total_emails DESC",
+            (status.value,),
         ).fetchall()
         return [dict(row) for row in rows]
 
@@ -2328,11 +2542,15 @@ def get_senders_by_status(status: SenderStatus) -> list[dict]:
 _REVIEW_PREDICATE = "(status = 'unknown' AND user_override IS NULL) OR status = 'failed'"
 
 
-def get_senders_for_review() -> list[dict]:
-    """Get senders that need manual review, including failed unsubscribes."""
+def get_senders_for_review(columns: Sequence[str] | None = None) -> list[dict]:
+    """Get senders that need manual review, including failed unsubscribes.
+
+    Args:
+        columns: Columns to fetch (e.g. ``REVIEW_COLUMNS``); all when None
+    """
     with get_db() as conn:
         rows = conn.execute(f"""
-            SELECT * FROM senders
+            SELECT {_sender_select_list(columns)} FROM senders
             WHERE {_REVIEW_PREDICATE}
             ORDER BY total_emails DESC
         """).fetchall()
@@ -2535,38 +2753,45 @@ def delete_rule(pattern: str) -> bool:
 def get_stats() -> dict:
     """Get overall statistics."""
     with get_db() as conn:
-        senders = conn.execute("SELECT COUNT(*) as count FROM senders").fetchone()
-        unsubbed = conn.execute(
-            "SELECT COUNT(*) as count FROM senders WHERE status = 'unsubscribed'"
-        ).fetchone()
-        kept = conn.execute(
-            "SELECT COUNT(*) as count FROM senders WHERE status = 'keep'"
-        ).fetchone()
-        review = conn.execute(
-            f"SELECT COUNT(*) as count FROM senders WHERE {_REVIEW_PREDICATE}"
+        # One pass over each table rather than one query per figure
+        senders = conn.execute(
+            f"""
+            SELECT
+                COUNT(*) AS total,
+                COALESCE(SUM(status = 'unsubscribed'), 0) AS unsubscribed,
+                COALESCE(SUM(status = 'keep'), 0) AS kept,
+                COALESCE(SUM({_REVIEW_PREDICATE}), 0) AS review
+            FROM senders
+            """
         ).fetchone()
-        runs = conn.execute("SELECT COUNT(*) as count FROM runs").fetchone()
-        last_run = conn.execute("SELECT ran_at FROM runs ORDER BY ran_at DESC LIMIT 1").fetchone()
+        runs = conn.execute("SELECT COUNT(*) AS count, MAX(ran_at) AS last FROM runs").fetchone()
 
         return {
-            "total_senders": senders["count"],
-            "unsubscribed": unsubbed["count"],
-            "kept": kept["count"],
-            "pending_review": review["count"],
+            "total_senders": senders["total"],
+            "unsubscribed": senders["unsubscribed"],
+            "kept": senders["kept"],
+            "pending_review": senders["review"],
             "total_runs": runs["count"],
-            "last_run": last_run["ran_at"] if last_run else None,
+            "last_run": runs["last"],
         }
 
 
-def get_all_senders(status_filter: str | None = None, sort_by: str = "last_seen") -> list[dict]:
+def get_all_senders(
+    status_filter: str | None = None,
+    sort_by: str = "last_seen",
+    limit: int | None = None,
+    columns: Sequence[str] | None = None,
+) -> list[dict]:
     """Get all senders with optional filtering and sorting.
 
     Args:
         status_filter: Filter by status (keep, unsubscribed, blocked, unknown)
         sort_by: Sort by 'emails', 'domain', or 'last_seen' (default)
+        limit: Maximum number of rows to return (all when None)
+        columns: Columns to fetch (e.g. ``LISTING_COLUMNS``); all when None
     """
     with get_db() as conn:
-        query = "SELECT * FROM senders"
+        query = f"SELECT {_sender_select_list(columns)} FROM senders"
         params: list = []
 
         if status_filter:
@@ -2581,24 +2806,87 @@ def get_all_senders(status_filter: str | None = None, sort_by: str = "last_seen"
         order = sort_map.get(sort_by, "last_seen DESC")
         query += f" ORDER BY {order}"
 
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
         rows = conn.execute(query, params).fetchall()
         return [dict(row) for row in rows]
 
 
+def iter_all_senders() -> Generator[dict, None, None]:
+    """Yield every sender, most recently seen first, one row at a time.
+
+    The connection stays open until the generator is exhausted or closed.
+    """
+    with get_db() as conn:
+        for row in conn.execute("SELECT * FROM senders ORDER BY last_seen DESC"):
+            yield dict(row)
+
+
+def count_senders(status_filter: str | None = None) -> int:
+    """Count tracked senders, optionally only those with the given status."""
+    with get_db() as conn:
+        if status_filter:
+            row = conn.execute(
+                "SELECT COUNT(*) as count FROM senders WHERE status = ?", (status_filter,)
+            ).fetchone()
+        else:
+            row = conn.execute("SELECT COUNT(*) as count FROM senders").fetchone()
+        return row["count"]
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so user input only matches literally."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 def search_senders(pattern: str) -> list[dict]:
-    """Search senders by domain pattern."""
+    """Search senders whose domain contains ``pattern``.
+
+    ``*`` in the pattern matches any run of characters; ``%`` and ``_`` are
+    matched literally.
+    """
+    like = "%" + "%".join(_escape_like(part) for part in pattern.split("*")) + "%"
     with get_db() as conn:
         rows = conn.execute(
             """
             SELECT * FROM senders
-            WHERE domain LIKE ?
+            WHERE domain LIKE ? ESCAPE '\\'
             ORDER BY total_emails DESC
         """,
-            (f"%{pattern}%",),
+            (like,),
         ).fetchall()
         return [dict(row) for row in rows]
 
 
+def search_senders_prefix(prefix: str, limit: int = 200) -> list[dict]:
+    """Find senders whose domain starts with ``prefix``.
+
+    Runs as a range scan on the domain primary key instead of a LIKE, so
+    SQLite seeks straight to the matching rows.  Domains are stored
+    lowercase, so the prefix is lowercased to match.
+    """
+    prefix = prefix.lower()
+    with get_db() as conn:
+        if not prefix:
+            rows = conn.execute(
+                "SELECT * FROM senders ORDER BY domain LIMIT ?", (limit,)
+            ).fetchall()
+        else:
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            rows = conn.execute(
+                """
+                SELECT * FROM senders
+                WHERE domain >= ? AND domain < ?
+                ORDER BY domain
+                LIMIT ?
+            """,
+                (prefix, upper, limit),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+
 def get_activity_log(limit: int = 50, failures_only: bool = False) -> list[dict]:
     """Get recent activity log combining runs and unsubscribe attempts.
 
@@ -2681,6 +2969,7 @@ def reset_database(keep_config: bool = False) -> tuple[int, int]:
         conn.execute("DELETE FROM senders")
         conn.execute("DELETE FROM runs")
         conn.execute("DELETE FROM user_preferences")
+        conn.execute("DELETE FROM llm_cache")
 
         if not keep_config:
             conn.execute("DELETE FROM rules")
@@ -0,0 +1,30 @@
+"""Console-script entry point with a fast path for trivial invocations.
+
+Importing ``nothx.cli`` pulls in Click, Rich and every command's
+dependencies. Invocations that only print static information (``--version``
+and ``completion <shell>``) are answered here before any of that is
+imported; everything else is handed to the full Click application.
+"""
+
+import sys
+
+from . import __version__
+from .completions import SHELLS, completion_script
+
+
+def main() -> None:
+    """Run the ``nothx`` command."""
+    if sys.argv[1:] == ["--version"]:
+        # Same text Click's version_option prints for the console script
+        print(f"nothx, version {__version__}")
+        return
+
+    args = sys.argv[1:]
+    if len(args) == 2 and args[0] == "completion" and args[1] in SHELLS:
+        # Runs on every new shell when sourced from a shell rc file
+        print(completion_script(args[1]))
+        return
+
+    from .cli import main as cli_main
+
+    cli_main()
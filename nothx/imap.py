@@ -129,12 +129,18 @@ IMAP_SERVERS = {
 }
 OUTLOOK_OAUTH_IMAP_SERVER = "outlook.office365.com"
 
+# Socket timeout (seconds) for interactive connection tests, so a dead or
+# firewalled server fails in seconds rather than hanging the prompt
+TEST_CONNECTION_TIMEOUT = 15.0
+
 
 class IMAPConnection:
     """Manages IMAP connection to email provider."""
 
-    def __init__(self, account: AccountConfig):
+    def __init__(self, account: AccountConfig, timeout: float | None = None):
         self.account = account
+        # Socket timeout for connect and every command; None blocks as before
+        self.timeout = timeout
         self.server = (
             OUTLOOK_OAUTH_IMAP_SERVER
             if account.provider == "outlook" and account.uses_oauth
@@ -161,7 +167,7 @@ class IMAPConnection:
             ),
         )
         def _connect():
-            self.conn = imaplib.IMAP4_SSL(self.server)
+            self.conn = imaplib.IMAP4_SSL(self.server, timeout=self.timeout)
             if self.account.uses_oauth:
                 if self.account.provider != "outlook" or not self.account.client_id:
                     raise OAuthError(
@@ -184,7 +190,7 @@ class IMAPConnection:
                     token = msauth.get_access_token(
                         self.account.email, self.account.client_id, force_refresh=True
                     )
-                    self.conn = imaplib.IMAP4_SSL(self.server)
+                    self.conn = imaplib.IMAP4_SSL(self.server, timeout=self.timeout)
                     self.conn.authenticate(
                         "XOAUTH2",
                         lambda _challenge: msauth.build_xoauth2_bytes(self.account.email, token),
@@ -904,7 +910,7 @@ class IMAPConnection:
 def test_account(account: AccountConfig) -> tuple[bool, str]:
     """Test an account configuration."""
     try:
-        conn = IMAPConnection(account)
+        conn = IMAPConnection(account, timeout=TEST_CONNECTION_TIMEOUT)
         if conn.test_connection():
             return True, "Connection successful"
         return False, "Connection failed"
@@ -94,6 +94,12 @@ def apply_gradient(
     """
     max_len = max(len(line) for line in lines)
     result = Text()
+    # One Style per column (and for the check mark) rather than one per cell:
+    # each frame of the animation re-renders every cell of the banner.
+    styles = [Style(color=color) for color in colors]
+    dim_styles = [Style(color=color, dim=True) for color in colors] if cell_states else []
+    check = Style(color=check_style, bold=True)
+    last = len(colors) - 1
 
     for row_idx, line in enumerate(lines):
         if row_idx > 0:
@@ -111,18 +117,16 @@ def apply_gradient(
                 if age <= _SCRAMBLE_FRAMES:
                     # Cycling through random characters
                     scramble_char = random.choice(_SCRAMBLE_CHARS)
-                    color = colors[min(col_idx, len(colors) - 1)]
-                    result.append(scramble_char, Style(color=color, dim=True))
+                    result.append(scramble_char, dim_styles[min(col_idx, last)])
                     continue
 
             # Locked / static render
             if final_char == "✓":
-                result.append(final_char, Style(color=check_style, bold=True))
+                result.append(final_char, check)
             elif final_char == " ":
                 result.append(" ")
             else:
-                color = colors[min(col_idx, len(colors) - 1)]
-                result.append(final_char, Style(color=color))
+                result.append(final_char, styles[min(col_idx, last)])
 
     return result
 
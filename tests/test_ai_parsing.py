@@ -1,6 +1,12 @@
 """Tests for AI response JSON extraction robustness."""
 
-from nothx.classifier.ai import _extract_json_value
+import json
+from unittest.mock import MagicMock, patch
+
+from nothx.classifier.ai import AIClassifier, _extract_json_value
+from nothx.classifier.providers.base import ProviderResponse
+from nothx.config import Config
+from nothx.models import SenderStats
 
 
 class TestExtractJsonValue:
@@ -34,3 +40,52 @@ class TestExtractJsonValue:
 
     def test_truncated_json_returns_none(self):
         assert _extract_json_value('[{"domain": "x.com"', "[") is None
+
+
+class TestChunkFallback:
+    def _classifier(self, provider: MagicMock) -> AIClassifier:
+        classifier = AIClassifier(Config())
+        classifier._provider = provider
+        classifier._provider_initialized = True
+        return classifier
+
+    def test_unparseable_response_is_retried_in_halves(self):
+        def complete(prompt: str, max_tokens: int = 4096) -> ProviderResponse:
+            if "a.com" in prompt and "b.com" in prompt:
+                return ProviderResponse(text='[{"domain": "a.com", "type"', model="m")
+            domain = "a.com" if "a.com" in prompt else "b.com"
+            text = json.dumps([{"domain": domain, "type": "marketing", "action": "unsub"}])
+            return ProviderResponse(text=text, model="m")
+
+        provider = MagicMock()
+        provider.complete.side_effect = complete
+        classifier = self._classifier(provider)
+        senders = [SenderStats(domain="a.com"), SenderStats(domain="b.com")]
+
+        with patch("nothx.classifier.ai.db.get_recent_corrections", return_value=[]):
+            results = classifier._classify_chunk(senders, persist=False)
+
+        assert set(results) == {s.classification_key for s in senders}
+        assert provider.complete.call_count == 3
+
+    def test_single_sender_is_not_retried(self):
+        provider = MagicMock()
+        provider.complete.return_value = ProviderResponse(text="no json", model="m")
+        classifier = self._classifier(provider)
+
+        with patch("nothx.classifier.ai.db.get_recent_corrections", return_value=[]):
+            results = classifier._classify_chunk([SenderStats(domain="a.com")], persist=False)
+
+        assert results == {}
+        assert provider.complete.call_count == 1
+
+    def test_unparseable_response_is_invalidated_in_the_cache(self):
+        provider = MagicMock()
+        provider.complete.return_value = ProviderResponse(text="no json", model="m")
+        classifier = self._classifier(provider)
+
+        with patch("nothx.classifier.ai.db.get_recent_corrections", return_value=[]):
+            classifier._classify_chunk([SenderStats(domain="a.com")], persist=False)
+
+        prompt = provider.complete.call_args.args[0]
+        provider.invalidate.assert_called_once_with(prompt)
@@ -77,6 +77,18 @@ class TestPatternMatcher:
         result = self.matcher.match(sender)
         assert result is None
 
+    def test_user_patterns_file_is_case_insensitive(self, tmp_path):
+        """Mixed-case patterns from a user file are normalized at load."""
+        patterns_file = tmp_path / "patterns.json"
+        patterns_file.write_text('{"block_patterns": ["*.Spammy.COM"]}')
+        matcher = PatternMatcher(patterns_file)
+
+        result = matcher.match(SenderStats(domain="Mail.SPAMMY.com", total_emails=1))
+
+        assert result is not None
+        assert result.action == Action.BLOCK
+        assert result.reasoning == "Matched block pattern: *.Spammy.COM"
+
 
 class TestHeuristicScorer:
     """Tests for heuristic scoring."""
@@ -1,6 +1,9 @@
 """Tests for the CLI interface."""
 
+import csv
 import json
+import subprocess
+import sys
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -88,6 +91,46 @@ class TestMainCommand:
         assert result.exit_code == 0
         assert "nothx" in result.output or "version" in result.output.lower()
 
+    def test_fast_version_output(self, capsys):
+        """The console-script fast path prints Click's version message."""
+        from nothx import __version__, fastcli
+
+        with patch("sys.argv", ["nothx", "--version"]):
+            fastcli.main()
+
+        assert capsys.readouterr().out == f"nothx, version {__version__}\n"
+
+    def test_fast_version_skips_full_cli_import(self):
+        """--version is answered without importing Click or the commands."""
+        code = (
+            "import sys; sys.argv = ['nothx', '--version']; "
+            "from nothx.fastcli import main; main(); "
+            "assert 'nothx.cli' not in sys.modules and 'click' not in sys.modules"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+    def test_fast_completion_skips_full_cli_import(self):
+        """completion <shell> prints the packaged script without loading Click."""
+        code = (
+            "import sys; sys.argv = ['nothx', 'completion', 'bash']; "
+            "from nothx.fastcli import main; main(); "
+            "assert 'nothx.cli' not in sys.modules and 'click' not in sys.modules"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert "complete -o default -F _nothx_completion nothx" in result.stdout
+
+    def test_cli_import_skips_prompt_and_async_stacks(self):
+        """Loading the CLI defers questionary and asyncio until they are used."""
+        code = (
+            "import sys, nothx.cli; "
+            "assert 'asyncio' not in sys.modules, 'asyncio'; "
+            "assert 'prompt_toolkit' not in sys.modules, 'prompt_toolkit'"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
     def test_help_option(self, runner):
         """Test --help flag."""
         result = runner.invoke(main, ["--help"])
@@ -96,10 +139,11 @@ class TestMainCommand:
         assert "run" in result.output
         assert "status" in result.output
 
+    @patch("nothx.cli._is_interactive", return_value=True)
     @patch("nothx.cli.questionary.select")
     @patch("nothx.cli.print_animated_welcome")
     def test_main_no_subcommand_shows_welcome(
-        self, mock_welcome, mock_select, runner, temp_config_dir
+        self, mock_welcome, mock_select, _interactive, runner, temp_config_dir
     ):
         """Test that running without subcommand shows welcome screen."""
         mock_select.return_value.ask.return_value = None  # User pressed ESC
@@ -107,6 +151,33 @@ class TestMainCommand:
         result = runner.invoke(main, [])
         # Should attempt to show welcome screen
         assert result.exit_code == 0
+        mock_welcome.assert_called_once()
+
+    @patch("nothx.cli._show_welcome_screen")
+    def test_main_no_subcommand_without_terminal_prints_help(self, mock_welcome, runner):
+        """Non-interactive runs get the command list instead of the menu."""
+        result = runner.invoke(main, [])
+
+        assert result.exit_code == 0
+        assert "Usage:" in result.output
+        mock_welcome.assert_not_called()
+
+    def test_welcome_stats_are_served_stale_and_refreshed(self, temp_config_dir):
+        """The welcome line reads the last snapshot and refreshes it in the background."""
+        from nothx.cli import STATS_CACHE_FILENAME, _cached_stats
+
+        cache_path = temp_config_dir / STATS_CACHE_FILENAME
+        assert _cached_stats()["total_senders"] == 0
+        assert json.loads(cache_path.read_text())["total_senders"] == 0
+
+        db.upsert_sender("new.example", 1, 0, ["Hi"], True)
+        with patch("nothx.cli.threading.Thread") as thread:
+            assert _cached_stats()["total_senders"] == 0
+
+        target = thread.call_args.kwargs["target"]
+        target(*thread.call_args.kwargs["args"])
+        assert json.loads(cache_path.read_text())["total_senders"] == 1
+        assert not list(temp_config_dir.glob(".stats-*.tmp"))
 
 
 class TestInitCommand:
@@ -149,6 +220,38 @@ class TestInitCommand:
         assert result.exit_code == 0
         assert "Setup complete" in result.output
 
+    @patch("nothx.cli.questionary.select")
+    @patch("nothx.cli.questionary.text")
+    @patch("nothx.cli.questionary.password")
+    @patch("nothx.cli.test_account")
+    def test_init_tests_accounts_in_background_and_drops_failures(
+        self, mock_account_test, mock_password, mock_text, mock_select, runner, temp_config_dir
+    ):
+        """Accounts are tested after entry; failed ones are reported and not saved."""
+        mock_select.return_value.ask.side_effect = [
+            "gmail",  # Provider selection
+            "yes",  # Add another account?
+            "gmail",  # Provider selection
+            "no",  # Add another account?
+            "none",  # AI provider selection
+            "no",  # Run first scan?
+            "no",  # Schedule runs?
+        ]
+        mock_text.return_value.ask.side_effect = ["bad@gmail.com", "good@gmail.com"]
+        mock_password.return_value.ask.return_value = "app-password"
+        mock_account_test.side_effect = lambda account: (
+            (False, "auth failed") if account.email == "bad@gmail.com" else (True, "Connected")
+        )
+
+        result = runner.invoke(init, [])
+
+        assert result.exit_code == 0
+        assert "Connection failed for bad@gmail.com: auth failed" in result.output
+        assert "Added account: good@gmail.com" in result.output
+        config = Config.load()
+        assert [a.email for a in config.accounts.values()] == ["good@gmail.com"]
+        assert config.accounts[config.default_account].email == "good@gmail.com"
+
     @patch("nothx.cli.questionary.select")
     def test_init_cancelled_at_provider(self, mock_select, runner, temp_config_dir):
         """Test init cancelled at provider selection."""
@@ -317,6 +420,45 @@ class TestRunCommand:
         # Not deferred to review — the unsubscribe actually ran.
         assert mock_unsub.called
 
+    @patch("nothx.cli.unsubscribe_subscription")
+    @patch("nothx.cli.scan_inbox")
+    @patch("nothx.cli.ClassificationEngine")
+    def test_run_sends_unsubscribes_concurrently(
+        self, mock_engine_class, mock_scan, mock_unsub, runner, configured_env, temp_config_dir
+    ):
+        """Unsubscribes to different senders are in flight at the same time."""
+        import threading
+
+        from nothx.models import Action, Classification, EmailType, SenderStats, UnsubResult
+
+        domains = ("a.com", "b.com")
+        stats = {d: SenderStats(domain=d, total_emails=50) for d in domains}
+        cls = {
+            d: Classification(
+                email_type=EmailType.MARKETING,
+                action=Action.UNSUB,
+                confidence=1.0,
+                reasoning="Matched user rule",
+                source="user_rule",
+            )
+            for d in domains
+        }
+        self._mock_scan_and_engine(mock_scan, mock_engine_class, stats, cls)
+        # Sequential execution would leave the first call waiting here alone
+        both_started = threading.Barrier(len(domains), timeout=5)
+
+        def unsubscribe(*args, **kwargs):
+            both_started.wait()
+            return UnsubResult(success=True, method=UnsubMethod.ONE_CLICK)
+
+        mock_unsub.side_effect = unsubscribe
+
+        result = runner.invoke(run, ["--auto"])
+
+        assert result.exit_code == 0, result.output
+        assert mock_unsub.call_count == 2
+        assert "2 unsubscribe request(s) accepted" in result.output
+
     @patch("nothx.cli.scan_inbox")
     @patch("nothx.cli.ClassificationEngine")
     def test_legacy_scan_result_never_contacts_authentication_unknown_target(
@@ -375,6 +517,62 @@ class TestRunCommand:
         # No prompt, and nothing was executed.
         assert not mock_unsub.called
 
+    @patch("nothx.cli.unsubscribe_subscription")
+    @patch("nothx.cli.scan_inbox")
+    @patch("nothx.cli.ClassificationEngine")
+    def test_manual_review_moves_and_keeps_unreviewed_decisions(
+        self, mock_engine_class, mock_scan, mock_unsub, runner, configured_env, temp_config_dir
+    ):
+        """Changed answers move senders; cancelling leaves the rest as classified."""
+        from nothx.models import Action, Classification, EmailType, SenderStats
+
+        domains = ("a.com", "b.com", "c.com")
+        stats = {d: SenderStats(domain=d, total_emails=50) for d in domains}
+        cls = {
+            d: Classification(
+                email_type=EmailType.MARKETING,
+                action=Action.UNSUB,
+                confidence=0.9,
+                reasoning="Heuristic score",
+                source="heuristics",
+            )
+            for d in domains
+        }
+        self._mock_scan_and_engine(mock_scan, mock_engine_class, stats, cls)
+
+        with (
+            patch("nothx.cli._styled_confirm", side_effect=[True, False]),
+            patch("nothx.cli.questionary.select") as select,
+        ):
+            select.return_value.ask.side_effect = ["keep", "skip", None]
+            result = runner.invoke(run, [])
+
+        assert result.exit_code == 0, result.output
+        assert "1 to unsubscribe" in result.output
+        assert "1 to keep" in result.output
+        assert "1 need review" in result.output
+        assert not mock_unsub.called
+
+    def test_detail_tables_show_sender_text_literally(self):
+        """Markup-like sender strings are printed as-is, not interpreted."""
+        from nothx.cli import _show_details
+        from nothx.models import Action, Classification, EmailType, SenderStats
+        from nothx.theme import console
+
+        sender = SenderStats(domain="shop.com", total_emails=4)
+        classification = Classification(
+            email_type=EmailType.MARKETING,
+            action=Action.UNSUB,
+            confidence=0.9,
+            reasoning="Subject said [bold]SALE[/bold]",
+            source="heuristics",
+        )
+
+        with console.capture() as capture:
+            _show_details([("shop.com", sender, classification)], [], [], [])
+
+        assert "[bold]SALE[/bold]" in capture.get()
+
 
 class TestStatusCommand:
     """Tests for the status command."""
@@ -554,6 +752,22 @@ class TestConfigCommand:
         assert result.exit_code == 0
         assert "confirm" in result.output
 
+    def test_config_several_settings_save_once(self, runner, configured_env, temp_config_dir):
+        """Changing several settings writes the config file a single time."""
+        with patch.object(Config, "save", autospec=True, side_effect=Config.save) as save:
+            result = runner.invoke(
+                config_cmd, ["--ai", "off", "--mode", "confirm", "--footer-scan", "on"]
+            )
+
+        assert result.exit_code == 0
+        assert save.call_count == 1
+        config = Config.load()
+        assert (config.ai.enabled, config.operation_mode, config.footer_scan_enabled) == (
+            False,
+            "confirm",
+            True,
+        )
+
 
 class TestRuleCommands:
     """Tests for rule management commands."""
@@ -629,6 +843,46 @@ class TestSendersCommand:
         assert isinstance(data, list)
         assert data[0]["domain"] == "test.com"
 
+    def test_senders_json_matches_with_and_without_orjson(self, runner, temp_config_dir):
+        """orjson is optional; both serializers produce the same document."""
+        db.upsert_sender("café.example", 5, 2, ["Déjà vu"], True)
+
+        with patch.dict(sys.modules, {"orjson": None}):
+            fallback = runner.invoke(senders, ["--json"])
+        default = runner.invoke(senders, ["--json"])
+
+        assert fallback.exit_code == default.exit_code == 0
+        assert json.loads(fallback.output) == json.loads(default.output)
+
+    def test_senders_humanizes_each_distinct_last_seen_once(self, runner, temp_config_dir):
+        """Senders from the same scan share one parse-and-humanize call."""
+        seen = datetime(2024, 1, 15, 12, 0)
+        for i in range(3):
+            db.upsert_sender(f"sender{i}.com", 5, 2, [], True, last_seen=seen)
+
+        with patch("nothx.cli._naturaltime", return_value="a while ago") as naturaltime:
+            result = runner.invoke(senders, [])
+
+        assert result.exit_code == 0
+        assert naturaltime.call_count == 1
+        assert result.output.count("a while ago") == 3
+
+    def test_senders_table_fetches_one_row_past_the_limit(self, runner, temp_config_dir):
+        """The table asks SQL for a bounded page and counts the rest."""
+        for i in range(3):
+            db.upsert_sender(f"sender{i}.com", 5, 2, [], True)
+
+        with (
+            patch("nothx.cli.SENDERS_DISPLAY_LIMIT", 2),
+            patch("nothx.cli.db.get_all_senders", wraps=db.get_all_senders) as get_all,
+        ):
+            result = runner.invoke(senders, [])
+
+        assert result.exit_code == 0
+        assert get_all.call_args.kwargs["limit"] == 3
+        assert "(3 total)" in result.output
+        assert "Showing first 2 of 3 senders" in result.output
+
 
 class TestSearchCommand:
     """Tests for the search command."""
@@ -663,6 +917,33 @@ class TestSearchCommand:
         data = json.loads(result.output)
         assert isinstance(data, list)
 
+    def test_search_trailing_star_is_a_prefix_search(self, runner, temp_config_dir):
+        """A trailing * lists domains starting with the prefix only."""
+        db.upsert_sender("news.example.com", 5, 2, [], True)
+        db.upsert_sender("newsletter.com", 3, 1, [], True)
+        db.upsert_sender("daily-news.com", 4, 1, [], True)
+
+        result = runner.invoke(search, ["News*", "--json"])
+
+        assert result.exit_code == 0
+        assert [s["domain"] for s in json.loads(result.output)] == [
+            "news.example.com",
+            "newsletter.com",
+        ]
+
+    def test_prefix_search_notes_when_capped(self, runner, temp_config_dir):
+        """A prefix search that hits its cap says more senders exist."""
+        for domain in ("a.com", "b.com", "c.com"):
+            db.upsert_sender(domain, 1, 0, [], True)
+
+        with patch("nothx.cli.SEARCH_PREFIX_LIMIT", 2):
+            result = runner.invoke(search, ["*"])
+
+        assert result.exit_code == 0
+        assert "Found 2+ sender(s)" in result.output
+        assert "c.com" not in result.output
+        assert "Showing first 2 matches" in result.output
+
 
 class TestHistoryCommand:
     """Tests for the history command."""
@@ -745,6 +1026,21 @@ class TestExportCommand:
         finally:
             Path(output_path).unlink(missing_ok=True)
 
+    def test_export_senders_streams_every_row(self, runner, temp_config_dir, tmp_path):
+        """Senders are written from the cursor and all of them are counted."""
+        for i in range(3):
+            db.upsert_sender(f"sender{i}.com", 5, 2, [], True)
+        output_path = tmp_path / "senders.csv"
+
+        with patch("nothx.cli.db.get_all_senders") as get_all:
+            result = runner.invoke(export, ["senders", "--output", str(output_path)])
+
+        assert result.exit_code == 0
+        get_all.assert_not_called()
+        assert "Exported 3 records" in result.output
+        with open(output_path, newline="") as f:
+            assert len(list(csv.DictReader(f))) == 3
+
     def test_export_history(self, runner, temp_config_dir):
         """Test exporting history to CSV."""
         db.log_unsub_attempt("test.com", True, UnsubMethod.ONE_CLICK)
@@ -804,10 +1100,37 @@ class TestTestConnectionCommand:
         assert result.exit_code == 0
         assert "failed" in result.output
 
+    @patch("nothx.cli.test_account")
+    def test_test_probes_accounts_concurrently(
+        self, mock_test, runner, configured_env, temp_config_dir
+    ):
+        """All accounts connect at once and are reported in config order."""
+        import threading
+
+        configured_env.accounts["work"] = AccountConfig(
+            provider="gmail", email="work@example.com", password="secret"
+        )
+        configured_env.save()
+        # Sequential probes would leave the first one waiting here alone
+        both_started = threading.Barrier(2, timeout=5)
+
+        def probe(account):
+            both_started.wait()
+            return True, "Connection successful"
+
+        mock_test.side_effect = probe
+
+        result = runner.invoke(connection_command, [])
+
+        assert result.exit_code == 0
+        assert mock_test.call_count == 2
+        assert result.output.index("test@example.com") < result.output.index("work@example.com")
+
 
 class TestResetCommand:
     """Tests for the reset command."""
 
+    @patch("nothx.cli._is_interactive", new=lambda: True)
     @patch("nothx.cli.questionary.text")
     def test_reset_cancelled(self, mock_text, runner, temp_config_dir):
         """Test reset cancelled by user."""
@@ -818,6 +1141,7 @@ class TestResetCommand:
         assert result.exit_code == 0
         assert "Cancelled" in result.output
 
+    @patch("nothx.cli._is_interactive", new=lambda: True)
     @patch("nothx.cli.questionary.text")
     def test_reset_confirmed(self, mock_text, runner, temp_config_dir):
         """Test reset confirmed by user."""
@@ -831,6 +1155,7 @@ class TestResetCommand:
         assert result.exit_code == 0
         assert "Cleared" in result.output
 
+    @patch("nothx.cli._is_interactive", new=lambda: True)
     @patch("nothx.cli.questionary.text")
     def test_reset_keep_config(self, mock_text, runner, temp_config_dir):
         """Test reset with --keep-config flag."""
@@ -846,6 +1171,34 @@ class TestResetCommand:
         rules_list = db.get_rules()
         assert len(rules_list) == 1
 
+    @patch("nothx.cli.questionary.text")
+    def test_reset_without_terminal_requires_yes(self, mock_text, runner, temp_config_dir):
+        """Piped invocations never prompt; --yes confirms, otherwise nothing is deleted."""
+        db.upsert_sender("test.com", 5, 2, [], True)
+
+        refused = runner.invoke(reset, ["--keep-config"])
+        assert refused.exit_code == 2
+        assert "--yes" in refused.output
+        assert db.get_stats()["total_senders"] == 1
+
+        confirmed = runner.invoke(reset, ["--keep-config", "--yes"])
+        assert confirmed.exit_code == 0
+        assert "Cleared 1 senders" in confirmed.output
+        mock_text.assert_not_called()
+
+    def test_reset_drops_stats_snapshot(self, runner, temp_config_dir):
+        """The welcome screen never shows pre-reset figures after a reset."""
+        from nothx.cli import STATS_CACHE_FILENAME, _cached_stats
+
+        db.upsert_sender("test.com", 5, 2, [], True)
+        assert _cached_stats()["total_senders"] == 1
+
+        result = runner.invoke(reset, ["--keep-config", "--yes"])
+
+        assert result.exit_code == 0
+        assert not (temp_config_dir / STATS_CACHE_FILENAME).exists()
+        assert _cached_stats()["total_senders"] == 0
+
 
 class TestCompletionCommand:
     """Tests for the completion command."""
@@ -918,6 +1271,24 @@ class TestUpdateCommand:
         assert result.exit_code == 0
         assert "Could not check" in result.output
 
+    @patch("nothx.cli._styled_confirm")
+    @patch("urllib.request.urlopen")
+    def test_update_without_terminal_does_not_prompt(self, mock_urlopen, mock_confirm, runner):
+        """Piped invocations point at --yes instead of waiting on a prompt."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps({"info": {"version": "99.99.99"}}).encode()
+        mock_response.__enter__ = MagicMock(return_value=mock_response)
+        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_response
+
+        with patch("subprocess.run") as mock_run:
+            result = runner.invoke(update, [])
+
+        assert result.exit_code == 0
+        assert "nothx update --yes" in result.output
+        mock_confirm.assert_not_called()
+        mock_run.assert_not_called()
+
 
 class TestCommandAliases:
     """Tests for command aliases."""
@@ -1012,6 +1383,19 @@ class TestEdgeCases:
             assert result.exit_code == 0
 
 
+class TestEmailValidation:
+    """Tests for the account email format check."""
+
+    def test_whole_address_must_match(self):
+        """Surrounding whitespace is ignored; anything else must be address syntax."""
+        from nothx.cli import _is_valid_email
+
+        assert _is_valid_email("  user.name+tag@mail.example.com\n")
+        assert not _is_valid_email("user@example.com extra")
+        assert not _is_valid_email("user@example")
+        assert not _is_valid_email("")
+
+
 class TestAppPasswordInstructions:
     """Tests for app password instruction display."""
 
@@ -1040,6 +1424,14 @@ class TestAppPasswordInstructions:
 
         assert "icloud" in APP_PASSWORD_INSTRUCTIONS
 
+    def test_instructions_are_precomposed_with_gutter(self):
+        """Test steps are joined into one string and indented steps get the gutter."""
+        from nothx.cli import _L, APP_PASSWORD_INSTRUCTIONS
+
+        lines = APP_PASSWORD_INSTRUCTIONS["gmail"].split("\n")
+        assert lines[0].startswith("[warning]")
+        assert lines[1].startswith(f"{_L} 1. Go to")
+
 
 class TestTroubleshootingTips:
     """Tests for troubleshooting tips."""
@@ -333,6 +333,26 @@ def test_preclaimed_operation_prevents_duplicate_network_execution(configured_cl
     assert db.get_unsubscribe_operation(operation["id"])["outcome"] is None
 
 
+def test_unexpected_unsubscribe_error_is_recorded_as_failed(configured_cli):
+    runner, config = configured_cli
+    config.unsubscribe_consent_version = CURRENT_UNSUBSCRIBE_CONSENT_VERSION
+    config.save()
+    scan_result, classifications = _subscription_scan(Action.UNSUB)
+    engine = MagicMock()
+    engine.classify_batch.return_value = classifications
+    with (
+        patch("nothx.cli.scan_inbox", return_value=scan_result),
+        patch("nothx.cli.ClassificationEngine", return_value=engine),
+        patch("nothx.cli.unsubscribe_subscription", side_effect=RuntimeError("boom")),
+    ):
+        result = runner.invoke(run, ["--auto"])
+
+    assert result.exit_code == 0, result.output
+    assert "0 unsubscribe request(s) accepted" in result.output
+    [operation] = db.list_unsubscribe_operations()
+    assert operation["outcome"] == "failed"
+
+
 def test_preclaimed_block_operation_prevents_duplicate_mailbox_execution(configured_cli):
     _runner, config = configured_cli
     scan_result, classifications = _subscription_scan(Action.BLOCK)
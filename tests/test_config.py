@@ -176,6 +176,21 @@ class TestConfigSaveLoad:
         assert config.accounts == {}
         assert config.default_account is None
 
+    def test_load_parses_file_once_until_it_changes(self, temp_config_dir):
+        Config(scan_days=14).save()
+
+        with patch("nothx.config.json.load", wraps=json.load) as json_load:
+            first = Config.load()
+            second = Config.load()
+            assert json_load.call_count == 1
+
+            first.safety.never_unsub_domains.append("*.example")
+            assert "*.example" not in second.safety.never_unsub_domains
+
+            Config(scan_days=7).save()
+            assert Config.load().scan_days == 7
+            assert json_load.call_count == 2
+
     def test_legacy_password_account_loads_without_auth_fields(self, temp_config_dir):
         config_data = {
             "accounts": {
@@ -1,7 +1,7 @@
 """Tests for database operations."""
 
 import tempfile
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
 
@@ -37,6 +37,54 @@ class TestDatabaseInit:
             assert "runs" in tables
             assert "rules" in tables
 
+    def test_init_is_a_no_op_once_initialized(self, temp_db):
+        """Repeat calls skip the schema work, but a deleted file is rebuilt."""
+        with patch("nothx.db.get_connection", wraps=db.get_connection) as get_connection:
+            db.init_db()
+            assert get_connection.call_count == 0
+
+            temp_db.unlink()
+            db.init_db()
+            assert get_connection.call_count == 1
+
+        assert db.get_stats()["total_senders"] == 0
+
+    def test_get_db_reuses_the_thread_connection(self, temp_db):
+        """Sequential blocks share a connection; nested blocks get their own."""
+        with db.get_db() as outer:
+            with db.get_db() as nested:
+                assert nested is not outer
+                nested.execute("INSERT INTO runs (ran_at) VALUES ('nested')")
+            outer.execute("INSERT INTO runs (ran_at) VALUES ('outer')")
+        with db.get_db() as again:
+            assert again is outer
+            assert not again.in_transaction
+
+        with pytest.raises(RuntimeError), db.get_db() as conn:
+            conn.execute("INSERT INTO runs (ran_at) VALUES ('discarded')")
+            raise RuntimeError
+        assert db.get_stats()["total_runs"] == 2
+
+    def test_get_db_reopens_when_the_file_is_replaced(self, temp_db):
+        """A cached connection never writes into a deleted database file."""
+        with db.get_db() as first:
+            pass
+        temp_db.unlink()
+        db.init_db()
+        with db.get_db() as second:
+            assert second is not first
+            second.execute("INSERT INTO runs (ran_at) VALUES ('new file')")
+        assert db.get_stats()["total_runs"] == 1
+
+    def test_get_db_recovers_from_an_unidentified_connection(self, temp_db):
+        """A cached connection whose file key was unknown is simply replaced."""
+        with db.get_db() as first:
+            pass
+        db._local.key = None
+        with db.get_db() as second:
+            assert second is not first
+            second.execute("SELECT 1")
+
 
 class TestSenderOperations:
     """Tests for sender-related database operations."""
@@ -98,6 +146,23 @@ class TestSenderOperations:
         sender = db.get_sender("test.com")
         assert sender["status"] == "unsubscribed"
 
+    def test_update_sender_status_bulk(self, temp_db):
+        """Bulk updates apply every pair and ignore unknown domains."""
+        for domain in ("a.com", "b.com"):
+            db.upsert_sender(domain, 5, 2, [], True)
+
+        db.update_sender_status_bulk(
+            [
+                ("a.com", SenderStatus.KEEP),
+                ("b.com", SenderStatus.BLOCKED),
+                ("missing.com", SenderStatus.KEEP),
+            ]
+        )
+
+        assert db.get_sender("a.com")["status"] == "keep"
+        assert db.get_sender("b.com")["status"] == "blocked"
+        assert db.get_sender("missing.com") is None
+
     def test_get_sender_not_found(self, temp_db):
         """Test getting a non-existent sender."""
         sender = db.get_sender("nonexistent.com")
@@ -120,6 +185,65 @@ class TestSenderOperations:
         assert len(unsubbed) == 1
         assert unsubbed[0]["domain"] == "unsub.com"
 
+    def test_review_queries_fetch_only_requested_columns(self, temp_db):
+        """Projected review rows carry just REVIEW_COLUMNS; unknown names are rejected."""
+        db.upsert_sender("shop.com", 10, 0, ["A", "B"], True)
+
+        (row,) = db.get_senders_for_review(db.REVIEW_COLUMNS)
+        assert tuple(row) == db.REVIEW_COLUMNS
+        assert row["sample_subjects"] == "A|B"
+        assert db.get_senders_by_status(SenderStatus.UNKNOWN, ("domain",)) == [
+            {"domain": "shop.com"}
+        ]
+
+        with pytest.raises(ValueError):
+            db.get_senders_for_review(("domain; DROP TABLE senders",))
+
+    def test_set_user_decision(self, temp_db):
+        """The override and status are written together."""
+        db.upsert_sender("keep.com", 5, 5, [], False)
+
+        db.set_user_decision("keep.com", "keep", SenderStatus.KEEP)
+
+        sender = db.get_sender("keep.com")
+        assert (sender["user_override"], sender["status"]) == ("keep", "keep")
+
+    def test_get_user_overrides(self, temp_db):
+        """Test that only senders with an override are returned."""
+        db.upsert_sender("keep.com", 5, 5, [], False)
+        db.upsert_sender("plain.com", 5, 5, [], False)
+        db.set_user_override("keep.com", "keep")
+
+        assert db.get_user_overrides() == {"keep.com": "keep"}
+
+    def test_llm_cache_round_trip_and_expiry(self, temp_db):
+        """Test cached AI responses are returned until they are too old."""
+        assert db.get_cached_llm("k1", max_age=timedelta(days=1)) is None
+
+        db.put_cached_llm("k1", "openai", "gpt-4o-mini", "[]", max_age=timedelta(days=1))
+
+        cached = db.get_cached_llm("k1", max_age=timedelta(days=1))
+        assert cached == {"response": "[]", "model": "gpt-4o-mini"}
+        assert db.get_cached_llm("k1", max_age=timedelta(seconds=-1)) is None
+
+        db.delete_cached_llm("k1")
+        assert db.get_cached_llm("k1", max_age=timedelta(days=1)) is None
+
+    def test_llm_cache_write_prunes_expired_rows(self, temp_db):
+        """Test storing a response drops entries older than the max age."""
+        db.put_cached_llm("old", "openai", "gpt-4o-mini", "[]", max_age=timedelta(days=1))
+        with db.get_db() as conn:
+            conn.execute(
+                "UPDATE llm_cache SET created_at = ? WHERE key = 'old'",
+                (db._iso_timestamp(datetime.now(UTC) - timedelta(days=2)),),
+            )
+
+        db.put_cached_llm("new", "openai", "gpt-4o-mini", "[]", max_age=timedelta(days=1))
+
+        with db.get_db() as conn:
+            keys = [row["key"] for row in conn.execute("SELECT key FROM llm_cache")]
+        assert keys == ["new"]
+
 
 class TestRulesOperations:
     """Tests for rule management."""
@@ -241,6 +365,18 @@ class TestStats:
         assert stats["kept"] == 1
         assert stats["pending_review"] == 1
 
+    def test_get_stats_counts_failed_senders_and_latest_run(self, temp_db):
+        """Failed unsubscribes are pending review; last_run is the newest run."""
+        db.upsert_sender("failed.com", 4, 0, [], True)
+        db.update_sender_status("failed.com", SenderStatus.FAILED)
+        for day in (3, 9, 5):
+            db.log_run(RunStats(ran_at=datetime(2024, 1, day), mode="auto"))
+
+        stats = db.get_stats()
+        assert stats["pending_review"] == 1
+        assert stats["total_runs"] == 3
+        assert stats["last_run"] == datetime(2024, 1, 9).isoformat()
+
 
 class TestUnsubSuccessRate:
     """Tests for unsubscribe success rate tracking."""
@@ -308,6 +444,19 @@ class TestGetAllSenders:
         by_emails = db.get_all_senders(sort_by="emails")
         assert by_emails[0]["domain"] == "zzz.com"
 
+    def test_get_all_senders_limit_and_count(self, temp_db):
+        """The limit is applied after sorting; count_senders sees every row."""
+        for name, emails in (("a.com", 1), ("b.com", 3), ("c.com", 2)):
+            db.upsert_sender(name, emails, 0, [], False)
+        db.update_sender_status("c.com", SenderStatus.KEEP)
+
+        top = db.get_all_senders(sort_by="emails", limit=2)
+        assert [s["domain"] for s in top] == ["b.com", "c.com"]
+        (row,) = db.get_all_senders(status_filter="keep", columns=db.LISTING_COLUMNS)
+        assert tuple(row) == db.LISTING_COLUMNS
+        assert db.count_senders() == 3
+        assert db.count_senders("keep") == 1
+
 
 class TestSearchSenders:
     """Tests for sender search."""
@@ -337,6 +486,25 @@ class TestSearchSenders:
         results = db.search_senders("example")
         assert len(results) == 2
 
+    def test_search_senders_matches_like_wildcards_literally(self, temp_db):
+        """% and _ in the pattern are not SQL wildcards; * is."""
+        db.upsert_sender("mail_list.com", 5, 2, [], False)
+        db.upsert_sender("mailxlist.com", 3, 1, [], True)
+
+        assert [s["domain"] for s in db.search_senders("mail_list")] == ["mail_list.com"]
+        assert db.search_senders("100%") == []
+        assert len(db.search_senders("mail*list")) == 2
+
+    def test_search_senders_prefix(self, temp_db):
+        """Prefix search returns domains in order, bounded by the limit."""
+        for name in ("shop.b.com", "shop.a.com", "shopping.com", "other.com"):
+            db.upsert_sender(name, 1, 0, [], False)
+
+        results = db.search_senders_prefix("shop.")
+        assert [s["domain"] for s in results] == ["shop.a.com", "shop.b.com"]
+        assert len(db.search_senders_prefix("shop", limit=2)) == 2
+        assert len(db.search_senders_prefix("")) == 4
+
 
 class TestActivityLog:
     """Tests for activity log."""
@@ -386,6 +554,21 @@ class TestActivityLog:
         activity = db.get_activity_log(limit=5)
         assert len(activity) == 5
 
+    def test_activity_log_queries_use_indexes(self, temp_db):
+        """Newest-first reads seek an index instead of sorting the table."""
+        queries = (
+            "SELECT * FROM runs ORDER BY ran_at DESC LIMIT 20",
+            "SELECT * FROM unsub_log ORDER BY attempted_at DESC LIMIT 20",
+            "SELECT * FROM unsub_log WHERE success = 0 ORDER BY attempted_at DESC LIMIT 20",
+        )
+        with db.get_db() as conn:
+            for query in queries:
+                plan = " ".join(
+                    row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}")
+                )
+                assert "USING INDEX" in plan, plan
+                assert "TEMP B-TREE" not in plan, plan
+
 
 class TestResetDatabase:
     """Tests for database reset."""
@@ -409,6 +592,15 @@ class TestResetDatabase:
         _, unsubs_deleted = db.reset_database()
         assert unsubs_deleted == 2
 
+    def test_reset_database_clears_llm_cache(self, temp_db):
+        """Test that reset drops cached AI responses about old senders."""
+        db.put_cached_llm("k1", "openai", "gpt-4o-mini", "[]", max_age=timedelta(days=1))
+
+        db.reset_database(keep_config=True)
+
+        with db.get_db() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 0
+
     def test_reset_database_keep_config_preserves_rules(self, temp_db):
         """Test that keep_config preserves rules."""
         db.add_rule("*.spam.com", "block")
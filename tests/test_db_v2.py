@@ -52,6 +52,8 @@ class TestAuthoritativeSchema:
             assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
             assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == db.BUSY_TIMEOUT_MS
             assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
+            # 1 == NORMAL
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
             tables = {
                 row[0]
                 for row in conn.execute(
@@ -872,6 +874,8 @@ def test_v2_retryability_repair_is_backed_up_and_partial_rows_are_terminal(
             conn.execute("ALTER TABLE mailbox_actions DROP COLUMN retryable")
             conn.execute("PRAGMA user_version = 2")
 
+        # Reopen as a fresh process would; init_db skips paths it already did
+        db._initialized_paths.clear()
         db.init_db()
 
         repaired = db.list_mailbox_actions(subscription_id=subscription["id"])
@@ -902,6 +906,8 @@ def test_v2_claim_column_repair_is_backed_up(tmp_path: Path):
             conn.execute("ALTER TABLE unsubscribe_operations DROP COLUMN claim_expires_at")
             conn.execute("PRAGMA user_version = 2")
 
+        # Reopen as a fresh process would; init_db skips paths it already did
+        db._initialized_paths.clear()
         db.init_db()
 
         with db.get_db() as repaired:
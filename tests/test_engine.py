@@ -151,6 +151,22 @@ class TestClassificationEngine:
         # Broad protected patterns never force KEEP.
         assert results["irs.gov"].action == Action.REVIEW
 
+    def test_classify_batch_reports_each_sender_as_decided(self, temp_db, config_no_ai):
+        """on_classified sees every result, matching what classify_iter yields."""
+        engine = ClassificationEngine(config_no_ai)
+        senders = [
+            SenderStats(domain="marketing.spam.com", total_emails=50, seen_emails=0),
+            SenderStats(domain="unknown.io", total_emails=5, seen_emails=3),
+        ]
+        seen = []
+
+        results = engine.classify_batch(
+            senders, on_classified=lambda key, result: seen.append((key, result))
+        )
+
+        assert dict(seen) == results
+        assert dict(engine.classify_iter(senders)).keys() == results.keys()
+
     def test_classify_batch_empty(self, temp_db, config_no_ai):
         """Test batch classification with empty list."""
         engine = ClassificationEngine(config_no_ai)
@@ -4,8 +4,9 @@ import email
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
+from nothx import imap
 from nothx.config import AccountConfig
-from nothx.imap import IMAPConnection, _imap_date
+from nothx.imap import TEST_CONNECTION_TIMEOUT, IMAPConnection, _imap_date
 from nothx.models import MailboxActionOutcome, MailboxInfo, MessageRef
 
 
@@ -34,6 +35,15 @@ def test_non_ascii_junk_mailbox_encoding_failure_is_reported() -> None:
     assert result.error == "IMAP mailbox action failed (UnicodeEncodeError)"
 
 
+def test_account_test_uses_a_socket_timeout() -> None:
+    account = AccountConfig(provider="gmail", email="me@example.com", password="secret")
+
+    with patch("nothx.imap.imaplib.IMAP4_SSL") as imap_ssl:
+        assert imap.test_account(account) == (True, "Connection successful")
+
+    imap_ssl.assert_called_once_with("imap.gmail.com", timeout=TEST_CONNECTION_TIMEOUT)
+
+
 class TestImapDate:
     def test_format(self):
         assert _imap_date(datetime(2026, 7, 2)) == "02-Jul-2026"
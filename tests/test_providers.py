@@ -0,0 +1,630 @@
+"""Tests for shared AI provider behavior."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+
+from nothx.classifier.ai import AIClassifier
+from nothx.classifier.providers import anthropic_provider, gemini_provider, openai_provider
+from nothx.classifier.providers.base import (
+    BaseAIProvider,
+    ProviderError,
+    ProviderErrorType,
+    ProviderResponse,
+    classify_error_message,
+)
+from nothx.classifier.providers.cache import CachingProvider
+from nothx.classifier.providers.factory import get_provider
+from nothx.classifier.providers.gemini_provider import GeminiProvider
+from nothx.classifier.providers.ollama_provider import OllamaProvider
+from nothx.classifier.providers.openai_provider import OpenAIProvider
+from nothx.config import Config
+
+
+class EchoProvider(BaseAIProvider):
+    """Minimal provider that echoes prompts back, failing on request."""
+
+    @property
+    def name(self) -> str:
+        return "echo"
+
+    @property
+    def default_model(self) -> str:
+        return "echo-1"
+
+    def is_available(self) -> bool:
+        return True
+
+    def complete(self, prompt: str, max_tokens: int = 4096) -> ProviderResponse:
+        if prompt == "fail":
+            raise ProviderError(
+                error_type=ProviderErrorType.RATE_LIMIT_ERROR,
+                message="slow down",
+                provider=self.name,
+                retryable=True,
+            )
+        return ProviderResponse(text=prompt.upper(), model=self.default_model)
+
+    def test_connection(self) -> tuple[bool, str]:
+        return True, "ok"
+
+
+class TestSanitizeErrorMessage:
+    @pytest.mark.parametrize(
+        "module", [anthropic_provider, openai_provider, gemini_provider], ids=lambda m: m.__name__
+    )
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Invalid request: api_key=abc123",
+            "Header Authorization: Bearer xyz",
+            "BEARER token rejected",
+        ],
+    )
+    def test_redacts_sensitive_messages(self, module, message):
+        result = module._sanitize_error_message(Exception(message))
+
+        assert result == "API error (details redacted for security)"
+
+    @pytest.mark.parametrize(
+        "module", [anthropic_provider, openai_provider, gemini_provider], ids=lambda m: m.__name__
+    )
+    def test_passes_through_safe_messages(self, module):
+        assert module._sanitize_error_message(Exception("Model overloaded")) == "Model overloaded"
+
+    def test_provider_specific_key_prefixes(self):
+        assert "redacted" in openai_provider._sanitize_error_message(Exception("bad key sk-123"))
+        assert "redacted" in gemini_provider._sanitize_error_message(Exception("key AIzaSy123"))
+        assert "AIzaSy" in openai_provider._sanitize_error_message(Exception("key AIzaSy123"))
+
+
+class TestClassifyErrorMessage:
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ("Quota exceeded for project", (ProviderErrorType.RATE_LIMIT_ERROR, True)),
+            ("401 Unauthorized", (ProviderErrorType.AUTHENTICATION_ERROR, False)),
+            ("Request Timed Out", (ProviderErrorType.TIMEOUT_ERROR, True)),
+            ("Connection reset by peer", (ProviderErrorType.CONNECTION_ERROR, True)),
+            ("Something odd happened", (ProviderErrorType.UNKNOWN, False)),
+        ],
+    )
+    def test_keywords(self, message, expected):
+        assert classify_error_message(message) == expected
+
+    def test_untyped_sdk_error_is_classified(self):
+        provider = OpenAIProvider(api_key="test-key")
+        provider._client = MagicMock()
+        provider._client.chat.completions.create.side_effect = RuntimeError("quota exhausted")
+
+        with pytest.raises(ProviderError) as exc_info:
+            provider.complete("hi")
+
+        assert exc_info.value.error_type == ProviderErrorType.RATE_LIMIT_ERROR
+        assert exc_info.value.retryable is True
+
+
+class TestCompleteMany:
+    def test_preserves_order_and_captures_errors(self):
+        results = EchoProvider().complete_many(["a", "fail", "c"], max_concurrency=2)
+
+        assert [r.text for r in results if isinstance(r, ProviderResponse)] == ["A", "C"]
+        assert isinstance(results[1], ProviderError)
+        assert results[1].error_type == ProviderErrorType.RATE_LIMIT_ERROR
+
+    def test_empty_prompts(self):
+        assert EchoProvider().complete_many([]) == []
+
+    def test_async_variant_matches(self):
+        results = asyncio.run(EchoProvider().acomplete_many(["a", "fail", "c"], max_concurrency=2))
+
+        assert results[0].text == "A"
+        assert isinstance(results[1], ProviderError)
+        assert results[2].text == "C"
+
+
+class CountingProvider(EchoProvider):
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, prompt: str, max_tokens: int = 4096) -> ProviderResponse:
+        self.calls += 1
+        return super().complete(prompt, max_tokens)
+
+
+class TestCachingProvider:
+    def test_repeated_prompt_is_served_from_cache(self):
+        inner = CountingProvider()
+        provider = CachingProvider(inner)
+
+        first = provider.complete("hello")
+        second = provider.complete("hello")
+
+        assert first is second
+        assert inner.calls == 1
+        assert provider.name == "echo"
+
+    def test_max_tokens_is_part_of_key(self):
+        inner = CountingProvider()
+        provider = CachingProvider(inner)
+
+        provider.complete("hello", max_tokens=10)
+        provider.complete("hello", max_tokens=20)
+
+        assert inner.calls == 2
+
+    def test_evicts_least_recently_used(self):
+        inner = CountingProvider()
+        provider = CachingProvider(inner, max_size=2)
+
+        provider.complete("a")
+        provider.complete("b")
+        provider.complete("a")
+        provider.complete("c")  # evicts "b"
+        provider.complete("a")
+        provider.complete("b")
+
+        assert inner.calls == 4
+
+    def test_errors_are_not_cached(self):
+        inner = CountingProvider()
+        provider = CachingProvider(inner)
+
+        for _ in range(2):
+            with pytest.raises(ProviderError):
+                provider.complete("fail")
+
+        assert inner.calls == 2
+
+    def test_clear_cache(self):
+        inner = CountingProvider()
+        provider = CachingProvider(inner)
+
+        provider.complete("hello")
+        provider.clear_cache()
+        provider.complete("hello")
+
+        assert inner.calls == 2
+
+    def test_invalidate_forces_refetch(self):
+        inner = CountingProvider()
+        provider = CachingProvider(inner)
+
+        provider.complete("hello")
+        provider.invalidate("hello")
+        provider.complete("hello")
+
+        assert inner.calls == 2
+
+    def test_persisted_response_is_reused_across_instances(self):
+        store: dict[str, dict] = {}
+
+        def put(key, provider, model, response, max_age):
+            store[key] = {"response": response, "model": model}
+
+        with (
+            patch(
+                "nothx.classifier.providers.cache.db.get_cached_llm",
+                side_effect=lambda key, max_age: store.get(key),
+            ),
+            patch("nothx.classifier.providers.cache.db.put_cached_llm", side_effect=put),
+        ):
+            first_inner = CountingProvider()
+            first = CachingProvider(first_inner, persist=True)
+            first.complete("hello")
+            first.confirm("hello")
+            second_inner = CountingProvider()
+            response = CachingProvider(second_inner, persist=True).complete("hello")
+
+        assert first_inner.calls == 1
+        assert second_inner.calls == 0
+        assert response.text == "HELLO"
+        assert response.usage is None
+        assert all("hello" not in key for key in store)
+
+    def test_unconfirmed_response_is_not_persisted(self):
+        with patch("nothx.classifier.providers.cache.db.put_cached_llm") as put:
+            provider = CachingProvider(CountingProvider(), persist=True)
+            provider.complete("hello")
+            provider.invalidate("hello")
+            provider.confirm("hello")
+
+        put.assert_not_called()
+
+    def test_unparseable_reply_is_not_replayed_on_the_next_run(self, tmp_path):
+        from nothx import db
+        from nothx.models import SenderStats
+
+        class FixedProvider(CountingProvider):
+            def __init__(self, text: str):
+                super().__init__()
+                self.text = text
+
+            def complete(self, prompt: str, max_tokens: int = 4096) -> ProviderResponse:
+                self.calls += 1
+                return ProviderResponse(text=self.text, model="m")
+
+        def classify(inner: BaseAIProvider) -> dict:
+            classifier = AIClassifier(Config())
+            classifier._provider = CachingProvider(inner, persist=True)
+            classifier._provider_initialized = True
+            return classifier._classify_chunk([SenderStats(domain="a.com")], persist=False)
+
+        good = json.dumps([{"domain": "a.com", "type": "marketing", "action": "unsub"}])
+        with (
+            patch("nothx.db.get_db_path", return_value=tmp_path / "nothx.db"),
+            patch("nothx.classifier.ai.db.get_recent_corrections", return_value=[]),
+        ):
+            db.init_db()
+            assert classify(FixedProvider('[{"domain": "a.com", "type"')) == {}
+            second = FixedProvider(good)
+            assert len(classify(second)) == 1
+            third = FixedProvider("never asked")
+            assert len(classify(third)) == 1
+
+        assert second.calls == 1
+        assert third.calls == 0
+
+    def test_database_errors_fall_through_to_provider(self):
+        inner = CountingProvider()
+        with (
+            patch(
+                "nothx.classifier.providers.cache.db.get_cached_llm",
+                side_effect=sqlite3.OperationalError("no such table"),
+            ),
+            patch(
+                "nothx.classifier.providers.cache.db.put_cached_llm",
+                side_effect=sqlite3.OperationalError("no such table"),
+            ),
+        ):
+            response = CachingProvider(inner, persist=True).complete("hello")
+
+        assert response.text == "HELLO"
+        assert inner.calls == 1
+
+    def test_factory_wraps_only_when_requested(self):
+        assert isinstance(get_provider("ollama", cache_size=8), CachingProvider)
+        assert isinstance(get_provider("ollama"), OllamaProvider)
+
+
+class TestStream:
+    def test_default_yields_full_completion(self):
+        assert list(EchoProvider().stream("hi")) == ["HI"]
+
+
+def _batch_line(custom_id: str, content: str | None = None, status_code: int = 200) -> str:
+    body: dict = {"error": {"message": "bad request"}}
+    if content is not None:
+        body = {
+            "choices": [{"message": {"content": content}}],
+            "usage": {"prompt_tokens": 7, "completion_tokens": 2},
+        }
+    return json.dumps(
+        {
+            "custom_id": custom_id,
+            "response": {"status_code": status_code, "body": body},
+            "error": None,
+        }
+    )
+
+
+class TestOpenAIBatch:
+    def _provider(self, final_status: str, output: str) -> tuple[OpenAIProvider, MagicMock]:
+        provider = OpenAIProvider(api_key="test-key")
+        client = MagicMock()
+        client.files.create.return_value = SimpleNamespace(id="file-in")
+        client.batches.create.return_value = SimpleNamespace(id="batch-1", status="validating")
+        client.batches.retrieve.return_value = SimpleNamespace(
+            id="batch-1", status=final_status, output_file_id="file-out"
+        )
+        client.files.content.return_value = SimpleNamespace(text=output)
+        provider._client = client
+        return provider, client
+
+    def test_results_follow_prompt_order(self):
+        output = "\n".join([_batch_line("1", "second"), _batch_line("0", "first")])
+        provider, client = self._provider("completed", output)
+
+        with patch("nothx.classifier.providers.openai_provider.time.sleep"):
+            results = provider.complete_batch(["a", "b", "c"])
+
+        assert [r.text for r in results[:2]] == ["first", "second"]
+        assert results[0].usage == {"input_tokens": 7, "output_tokens": 2}
+        assert isinstance(results[2], ProviderError)
+        uploaded = client.files.create.call_args.kwargs["file"][1].decode().splitlines()
+        assert [json.loads(line)["custom_id"] for line in uploaded] == ["0", "1", "2"]
+        assert client.batches.create.call_args.kwargs["completion_window"] == "24h"
+
+    def test_failed_request_becomes_error(self):
+        provider, _ = self._provider("completed", _batch_line("0", status_code=400))
+
+        with patch("nothx.classifier.providers.openai_provider.time.sleep"):
+            (result,) = provider.complete_batch(["a"])
+
+        assert isinstance(result, ProviderError)
+        assert result.message == "bad request"
+
+    def test_malformed_line_fails_only_its_request(self):
+        truncated = _batch_line("1", "second")[:40]
+        output = "\n".join([_batch_line("0", "first"), truncated, _batch_line("2", "third")])
+        provider, _ = self._provider("completed", output)
+
+        with patch("nothx.classifier.providers.openai_provider.time.sleep"):
+            results = provider.complete_batch(["a", "b", "c"])
+
+        assert results[0].text == "first"
+        assert isinstance(results[1], ProviderError)
+        assert results[1].error_type == ProviderErrorType.PARSE_ERROR
+        assert results[2].text == "third"
+
+    def test_failed_batch_raises(self):
+        provider, _ = self._provider("failed", "")
+
+        with patch("nothx.classifier.providers.openai_provider.time.sleep"):
+            with pytest.raises(ProviderError):
+                provider.complete_batch(["a"])
+
+    def test_times_out_waiting(self):
+        provider, _ = self._provider("in_progress", "")
+
+        with patch("nothx.classifier.providers.openai_provider.time.sleep"):
+            with pytest.raises(ProviderError) as exc_info:
+                provider.complete_batch(["a"], poll_interval=1, timeout=5)
+
+        assert exc_info.value.error_type == ProviderErrorType.TIMEOUT_ERROR
+
+
+def _ollama_response(payload: dict, ok: bool = True) -> MagicMock:
+    response = MagicMock()
+    response.ok = ok
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+class TestOllamaProvider:
+    def test_requests_reuse_one_session(self):
+        provider = OllamaProvider()
+        provider._session = MagicMock()
+        provider._session.get.return_value = _ollama_response({"models": []})
+        provider._session.post.return_value = _ollama_response(
+            {"response": "ok", "prompt_eval_count": 3, "eval_count": 1}
+        )
+
+        assert provider.is_available() is True
+        result = provider.complete("hello", max_tokens=5)
+
+        assert result.text == "ok"
+        assert result.usage == {"input_tokens": 3, "output_tokens": 1}
+        provider._session.get.assert_called_once()
+        provider._session.post.assert_called_once()
+
+    def test_stream_yields_chunks_until_done(self):
+        provider = OllamaProvider()
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = [
+            json.dumps({"response": "Hel", "done": False}).encode(),
+            b"",
+            json.dumps({"response": "lo", "done": False}).encode(),
+            json.dumps({"response": "", "done": True, "eval_count": 2}).encode(),
+        ]
+        provider._session = MagicMock()
+        provider._session.post.return_value = response
+
+        assert list(provider.stream("hi")) == ["Hel", "lo"]
+        assert provider._session.post.call_args.kwargs["json"]["stream"] is True
+        assert provider._session.post.call_args.kwargs["stream"] is True
+
+    def test_connection_error_is_mapped(self):
+        provider = OllamaProvider()
+        provider._session = MagicMock()
+        provider._session.post.side_effect = requests.exceptions.ConnectionError("refused")
+
+        with pytest.raises(ProviderError) as exc_info:
+            provider.complete("hi")
+
+        assert exc_info.value.error_type == ProviderErrorType.CONNECTION_ERROR
+        assert exc_info.value.retryable is True
+
+    def test_tags_are_fetched_once_across_checks(self):
+        provider = OllamaProvider()
+        provider._session = MagicMock()
+        provider._session.get.return_value = _ollama_response(
+            {"models": [{"name": "llama3.2:latest"}]}
+        )
+        provider._session.post.return_value = _ollama_response({"response": "ok"})
+
+        assert provider.is_available() is True
+        assert provider.get_model_options() == ["llama3.2:latest"]
+        assert provider.test_connection() == (True, "Connection successful")
+        provider._session.get.assert_called_once()
+
+    def test_tags_cache_expires(self):
+        provider = OllamaProvider()
+        provider._session = MagicMock()
+        provider._session.get.return_value = _ollama_response({"models": []})
+
+        with patch("nothx.classifier.providers.ollama_provider.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            provider.get_model_options()
+            monotonic.return_value = 200.0
+            provider.get_model_options()
+
+        assert provider._session.get.call_count == 2
+
+
+class TestOpenAIClientSharing:
+    def test_instances_with_same_endpoint_share_a_client(self):
+        with patch.dict(OpenAIProvider._client_cache, clear=True):
+            first = OpenAIProvider(api_key="key-a", model="gpt-4o")._get_client()
+            second = OpenAIProvider(api_key="key-a", model="gpt-4o-mini")._get_client()
+            other = OpenAIProvider(api_key="key-b")._get_client()
+
+        assert first is second
+        assert first is not other
+
+
+def _chat_completion(text: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+        usage=SimpleNamespace(prompt_tokens=3, completion_tokens=1),
+    )
+
+
+class TestOpenAIAsync:
+    def test_acomplete_many_uses_one_async_client(self):
+        provider = OpenAIProvider(api_key="test-key")
+
+        async def create(model, max_tokens, messages):
+            return _chat_completion(messages[0]["content"].upper())
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = create
+        client.close = AsyncMock()
+        openai_sdk = MagicMock()
+        openai_sdk.AsyncOpenAI.return_value = client
+
+        with patch.object(openai_provider, "_load_sdk", return_value=openai_sdk):
+            results = asyncio.run(provider.acomplete_many(["a", "b", "c"]))
+
+        assert [r.text for r in results] == ["A", "B", "C"]
+        assert results[0].usage == {"input_tokens": 3, "output_tokens": 1}
+        openai_sdk.AsyncOpenAI.assert_called_once_with(api_key="test-key")
+        client.close.assert_awaited_once()
+
+    def test_each_call_closes_its_client(self):
+        provider = OpenAIProvider(api_key="test-key")
+
+        async def create(model, max_tokens, messages):
+            return _chat_completion("ok")
+
+        clients = []
+
+        def new_client(**kwargs):
+            client = MagicMock()
+            client.chat.completions.create.side_effect = create
+            client.close = AsyncMock()
+            clients.append(client)
+            return client
+
+        openai_sdk = MagicMock()
+        openai_sdk.AsyncOpenAI.side_effect = new_client
+
+        with patch.object(openai_provider, "_load_sdk", return_value=openai_sdk):
+            asyncio.run(provider.acomplete("a"))
+            asyncio.run(provider.acomplete("b"))
+
+        assert len(clients) == 2
+        for client in clients:
+            client.close.assert_awaited_once()
+
+    def test_acomplete_maps_errors(self):
+        provider = OpenAIProvider(api_key="test-key")
+
+        async def create(model, max_tokens, messages):
+            raise RuntimeError("429 rate limit exceeded")
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = create
+        client.close = AsyncMock()
+
+        with patch.object(provider, "_new_async_client", return_value=client):
+            results = asyncio.run(provider.acomplete_many(["a"]))
+
+        assert isinstance(results[0], ProviderError)
+        assert results[0].error_type == ProviderErrorType.RATE_LIMIT_ERROR
+        assert results[0].retryable is True
+
+
+class TestWarmup:
+    def test_ollama_warmup_loads_model(self):
+        provider = OllamaProvider(model="mistral")
+        provider._session = MagicMock()
+
+        provider.warmup()
+
+        assert provider._session.post.call_args.kwargs["json"] == {"model": "mistral"}
+
+    def test_warmup_swallows_errors(self):
+        provider = OpenAIProvider(api_key="test-key")
+        provider._client = MagicMock()
+        provider._client.models.retrieve.side_effect = RuntimeError("network down")
+
+        provider.warmup()
+
+    def test_classifier_warms_provider_in_background(self):
+        provider = MagicMock()
+        provider.is_available.return_value = True
+        classifier = AIClassifier(Config())
+        classifier._provider = provider
+        classifier._provider_initialized = True
+
+        with patch("nothx.classifier.ai.threading.Thread") as thread_cls:
+            classifier.start_warmup()
+            target = thread_cls.call_args.kwargs["target"]
+        target()
+
+        provider.warmup.assert_called_once()
+
+    def test_concurrent_provider_lookups_create_one_provider(self):
+        classifier = AIClassifier(Config())
+        created = []
+        release = threading.Event()
+
+        def slow_get_provider(**kwargs):
+            release.wait(1)
+            created.append(kwargs)
+            return MagicMock()
+
+        with patch("nothx.classifier.ai.get_provider", side_effect=slow_get_provider):
+            workers = [threading.Thread(target=classifier._get_provider) for _ in range(2)]
+            for worker in workers:
+                worker.start()
+            release.set()
+            for worker in workers:
+                worker.join()
+
+        assert len(created) == 1
+
+
+class TestUsageExtraction:
+    def test_gemini_usage(self):
+        provider = GeminiProvider(api_key="test-key")
+        provider._client = MagicMock()
+        provider._client.generate_content.return_value = SimpleNamespace(
+            text="ok",
+            usage_metadata=SimpleNamespace(prompt_token_count=5, candidates_token_count=1),
+        )
+
+        assert provider.complete("hi").usage == {"input_tokens": 5, "output_tokens": 1}
+
+    def test_gemini_without_usage(self):
+        provider = GeminiProvider(api_key="test-key")
+        provider._client = MagicMock()
+        provider._client.generate_content.return_value = SimpleNamespace(text="ok")
+
+        assert provider.complete("hi").usage is None
+
+
+class TestGeminiConfigure:
+    def test_configures_sdk_only_when_key_changes(self):
+        genai = MagicMock()
+        with (
+            patch(
+                "nothx.classifier.providers.gemini_provider._load_sdk",
+                return_value=(genai, MagicMock()),
+            ),
+            patch.object(GeminiProvider, "_configured_key", None),
+        ):
+            GeminiProvider(api_key="key-a")._get_client()
+            GeminiProvider(api_key="key-a", model="gemini-2.5-pro")._get_client()
+            GeminiProvider(api_key="key-b")._get_client()
+
+        assert [c.kwargs["api_key"] for c in genai.configure.call_args_list] == ["key-a", "key-b"]
+        assert genai.GenerativeModel.call_count == 3
@@ -0,0 +1,155 @@
+"""Tests for user rule matching."""
+
+from unittest.mock import patch
+
+import pytest
+
+from nothx.classifier.rules import RulesMatcher
+from nothx.classifier.utils import matches_pattern
+from nothx.models import Action, SenderStats
+
+PATTERNS = [
+    "news.example.com",
+    "marketing.*",
+    "*.example.com",
+    "*.gov",
+    "*bank*",
+    "*shop*.com",
+    "mail?.example.org",
+    "*",
+]
+
+DOMAINS = [
+    "news.example.com",
+    "example.com",
+    "mail.example.com",
+    "marketing.store.io",
+    "marketingteam.com",
+    "irs.gov",
+    "bankofamerica.com",
+    "myshoppe.com",
+    "shop.net",
+    "mail1.example.org",
+    "other.org",
+]
+
+
+def _matcher(rules: list[tuple[str, str]]) -> RulesMatcher:
+    matcher = RulesMatcher()
+    matcher._rules = [{"pattern": pattern, "action": action} for pattern, action in rules]
+    return matcher
+
+
+def _match(matcher: RulesMatcher, domain: str):
+    with patch("nothx.classifier.rules.db.get_user_overrides", return_value={}):
+        return matcher.match(SenderStats(domain=domain))
+
+
+class TestRulesMatcher:
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    @pytest.mark.parametrize("domain", DOMAINS)
+    def test_single_rule_agrees_with_matches_pattern(self, pattern, domain):
+        result = _match(_matcher([(pattern, "keep")]), domain)
+
+        assert (result is not None) == matches_pattern(domain, pattern)
+
+    def test_first_rule_in_priority_order_wins(self):
+        matcher = _matcher([("*.example.com", "keep"), ("news.example.com", "block")])
+
+        result = _match(matcher, "news.example.com")
+
+        assert result is not None
+        assert result.action == Action.KEEP
+        assert result.reasoning == "Matched user rule: *.example.com"
+
+    def test_later_wildcard_does_not_beat_exact(self):
+        matcher = _matcher([("news.example.com", "block"), ("*.example.com", "keep")])
+
+        assert _match(matcher, "news.example.com").action == Action.BLOCK
+        assert _match(matcher, "shop.example.com").action == Action.KEEP
+
+    def test_domain_case_is_ignored(self):
+        matcher = _matcher([("News.Example.com", "unsub")])
+
+        assert _match(matcher, "NEWS.example.COM").action == Action.UNSUB
+
+    def test_invalid_action_is_skipped(self):
+        matcher = _matcher([("*.example.com", "explode"), ("*.example.com", "keep")])
+
+        assert _match(matcher, "mail.example.com").action == Action.KEEP
+
+    def test_reload_recompiles(self):
+        matcher = _matcher([("a.com", "keep")])
+        assert _match(matcher, "a.com") is not None
+
+        with patch("nothx.classifier.rules.db.get_rules", return_value=[]):
+            matcher.reload()
+            assert _match(matcher, "a.com") is None
+
+    def test_contains_rules_pick_first_in_priority_order(self):
+        matcher = _matcher([("*shop*", "unsub"), ("*bank*", "keep")])
+
+        # "bank" occurs earlier in the domain, but "*shop*" has priority
+        assert _match(matcher, "bankshop.com").action == Action.UNSUB
+        assert _match(matcher, "mybank.com").action == Action.KEEP
+        assert _match(matcher, "example.com") is None
+
+    def test_user_override_applies_without_rule(self):
+        matcher = _matcher([])
+        matcher._overrides = {"shop.com": "keep", "bad.com": "explode"}
+
+        result = matcher.match(SenderStats(domain="shop.com"))
+
+        assert result.action == Action.KEEP
+        assert result.reasoning == "User override"
+        assert matcher.match(SenderStats(domain="bad.com")) is None
+        assert matcher.match(SenderStats(domain="other.com")) is None
+
+    def test_overrides_are_loaded_once_until_reload(self):
+        matcher = _matcher([])
+        with patch(
+            "nothx.classifier.rules.db.get_user_overrides", return_value={"a.com": "block"}
+        ) as get_overrides:
+            matcher.match(SenderStats(domain="a.com"))
+            matcher.match(SenderStats(domain="b.com"))
+            assert get_overrides.call_count == 1
+
+            matcher._rules = []
+            matcher.reload()
+            matcher._rules = []
+            matcher.match(SenderStats(domain="a.com"))
+            assert get_overrides.call_count == 2
+
+    def test_exact_rule_ahead_of_wildcards_short_circuits(self):
+        matcher = _matcher([("news.example.com", "block"), ("*.example.com", "keep")])
+        compiled = matcher._load_compiled()
+
+        class _Unreachable(dict):
+            def get(self, key, default=None):
+                raise AssertionError("wildcard bucket scanned")
+
+        compiled.suffix = _Unreachable(compiled.suffix)
+
+        assert compiled.first_wildcard == 1
+        assert _match(matcher, "news.example.com").action == Action.BLOCK
+
+    def test_glob_rules_pick_first_in_priority_order(self):
+        matcher = _matcher([("news*.example.?om", "block"), ("n*s.example.com", "keep")])
+
+        assert _match(matcher, "news.example.com").action == Action.BLOCK
+        assert _match(matcher, "nuts.example.com").action == Action.KEEP
+        assert _match(matcher, "news.example.org") is None
+
+    def test_nested_suffix_rules_follow_priority_not_depth(self):
+        broad_first = _matcher([("*.b.com", "keep"), ("*.a.b.com", "block")])
+        deep_first = _matcher([("*.a.b.com", "block"), ("*.b.com", "keep")])
+
+        assert _match(broad_first, "x.a.b.com").action == Action.KEEP
+        assert _match(deep_first, "x.a.b.com").action == Action.BLOCK
+        assert _match(deep_first, "a.b.com").action == Action.BLOCK
+        assert _match(deep_first, "x.b.com").action == Action.KEEP
+
+    def test_reasoning_quotes_lowercased_pattern(self):
+        matcher = _matcher([("*.Example.COM", "keep")])
+
+        assert _match(matcher, "mail.example.com").reasoning == "Matched user rule: *.example.com"
@@ -53,6 +53,13 @@ class TestMatchesPattern:
         assert matches_pattern("banking.co", "*bank*") is True
         assert matches_pattern("example.com", "*bank*") is False
 
+    def test_other_wildcards_use_glob_matching(self):
+        """Test wildcard patterns that are not plain contains matches."""
+        assert matches_pattern("mybank1.com", "*bank?.com") is True
+        assert matches_pattern("mybank.com", "*bank?.com") is False
+        assert matches_pattern("news.shop.com", "*news*shop*") is True
+        assert matches_pattern("shop.news.com", "*news*shop*") is False
+
     def test_complex_patterns(self):
         """Test more complex wildcard patterns."""
         # Pattern with multiple wildcards